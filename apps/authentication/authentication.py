@@ -0,0 +1,83 @@
+from functools import cached_property
+
+from django.contrib.auth import get_user_model
+from rest_framework.authentication import SessionAuthentication
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .tokens import PERMISSIONS_CLAIM, PERMISSIONS_VERSION_CLAIM, USER_CLAIMS
+from .utils import get_permissions_version
+
+
+class TokenClaimsUser:
+    """
+    Request user built from the claims of an access token.
+    `id`, `pk` and the user claims are read from the token; any other
+    attribute loads the user row once and is served from it.
+    """
+
+    is_active = True
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, token):
+        self.token = token
+        # simplejwt stores the id claim as a string
+        self.id = self.pk = get_user_model()._meta.pk.to_python(
+            token[api_settings.USER_ID_CLAIM]
+        )
+
+    def __getattr__(self, name):
+        if name in USER_CLAIMS and name in self.token:
+            return self.token[name]
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.user, name)
+
+    @cached_property
+    def user(self):
+        return get_user_model().objects.get(**{api_settings.USER_ID_FIELD: self.pk})
+
+    @property
+    def token_permission_mask(self):
+        return self.token.get(PERMISSIONS_CLAIM)
+
+    def __str__(self):
+        return f"TokenClaimsUser {self.pk}"
+
+    def __eq__(self, other):
+        if isinstance(other, (TokenClaimsUser, get_user_model())):
+            return self.pk == other.pk
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.pk)
+
+
+class TokenClaimsAuthentication(JWTAuthentication):
+    """
+    Authenticates access tokens without loading the user.
+    The token's permissions version is checked against the cached current
+    one, so tokens issued before a grant or account change are rejected and
+    must be refreshed. Tokens without claims fall back to the database user.
+    """
+
+    def get_user(self, validated_token):
+        if PERMISSIONS_VERSION_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        if validated_token[PERMISSIONS_VERSION_CLAIM] != get_permissions_version(
+            user_id
+        ):
+            raise InvalidToken("User permissions have changed, refresh the token.")
+
+        return TokenClaimsUser(validated_token)
+
+
+STATELESS_AUTHENTICATION_CLASSES = (TokenClaimsAuthentication, SessionAuthentication)
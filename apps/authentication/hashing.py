@@ -0,0 +1,56 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+
+@cache
+def get_hashing_executor():
+    """
+    Pool async views hash passwords on. Its size caps the hashes running at
+    once per process; PBKDF2 (hashlib) and Argon2 (argon2-cffi) release the
+    GIL, so the threads hash in parallel without blocking the event loop or
+    the thread Django runs sync views on.
+    """
+    return ThreadPoolExecutor(
+        max_workers=settings.PASSWORD_HASHING_CONCURRENCY or os.cpu_count(),
+        thread_name_prefix="password-hashing",
+    )
+
+
+async def run_hasher(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(
+        get_hashing_executor(), func, *args
+    )
+
+
+async def amake_password(password):
+    return await run_hasher(make_password, password)
+
+
+def verify_password(password, encoded):
+    """
+    Whether `password` matches `encoded`, and the re-hashed password when
+    `encoded` was made by a hasher or with a cost that is no longer the
+    preferred one.
+    """
+    upgraded = []
+    is_correct = check_password(
+        password, encoded, setter=lambda raw: upgraded.append(make_password(raw))
+    )
+    return is_correct, upgraded[0] if upgraded else None
+
+
+async def acheck_password(user, password):
+    """
+    `user.check_password()` for async code: verifies on the hashing pool and
+    stores an upgraded hash (e.g. PBKDF2 to Argon2) like the sync setter.
+    """
+    is_correct, upgraded = await run_hasher(verify_password, password, user.password)
+    if upgraded:
+        user.password = upgraded
+        await user.asave(update_fields=["password"])
+    return is_correct
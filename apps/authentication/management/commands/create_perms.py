@@ -4,7 +4,11 @@ from django.db import transaction
 
 from apps.authentication.models.perms import CustomPermission, PermissionCategory, Roles
 from apps.authentication.perms.perms_list import ALL_PERMISSION_LIST
-from apps.authentication.utils import HttpBasedPermissionActionMaps, PermissionLists
+from apps.authentication.utils import (
+    HttpBasedPermissionActionMaps,
+    PermissionLists,
+    invalidate_permission_bits,
+)
 
 
 class Command(BaseCommand):
@@ -64,6 +68,7 @@ class Command(BaseCommand):
         self.stdout.write(self.style.WARNING("Preparing Custom Permissions"))
 
         to_bulk_create_permissions = []
+        next_bit_index = CustomPermission.next_bit_index()
 
         # Create permissions based on ALL_PERMISSION_LIST
         for app_name, models in ALL_PERMISSION_LIST.items():
@@ -81,18 +86,45 @@ class Command(BaseCommand):
                                 name=readable_name,
                                 code_name=code_name,
                                 category=category,
+                                bit_index=next_bit_index,
                             )
                         )
+                        next_bit_index += 1
 
         # Bulk create all new permissions at once
         if to_bulk_create_permissions:
             CustomPermission.objects.bulk_create(to_bulk_create_permissions)
+            # bulk_create skips save() and its signals
+            invalidate_permission_bits()
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Total '{len(to_bulk_create_permissions)}' Permissions Created"
                 )
             )
 
+    def assign_bit_indexes(self):
+        """
+        Give permissions created outside this command a bit index.
+        Assigned indexes are never changed, so cached and token bitmasks
+        stay valid.
+        """
+        permissions = list(
+            CustomPermission.all_objects.filter(bit_index__isnull=True).order_by("id")
+        )
+        if not permissions:
+            return
+
+        next_bit_index = CustomPermission.next_bit_index()
+        for bit_index, permission in enumerate(permissions, start=next_bit_index):
+            permission.bit_index = bit_index
+        CustomPermission.all_objects.bulk_update(permissions, ["bit_index"])
+        invalidate_permission_bits()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Total '{len(permissions)}' Permission Bit Indexes Assigned"
+            )
+        )
+
     # def create_perms(self):
     #     existing_permissions_map = set(
     #         CustomPermission.objects.values_list("code_name", flat=True)
@@ -184,6 +216,7 @@ class Command(BaseCommand):
             self.style.SUCCESS("\nStarting permission and category creation...")
         )
         try:
+            self.assign_bit_indexes()
             self.create_perms()
             self.create_support_role()
             self.assign_superuser_permissions()
@@ -0,0 +1,71 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.authentication.user_import import UserImporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Import users from a CSV file, hashing passwords across a process pool "
+        "and inserting them in chunks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "csv_file", help="Path of the CSV file to import, '-' reads stdin."
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Number of rows hashed, inserted and committed together.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of password hashing processes, 1 hashes in-process.",
+        )
+
+    def report_progress(self, result):
+        self.stdout.write(
+            f"{result.processed} rows processed, {result.created} created "
+            f"({result.rate:.1f} rows/s)"
+        )
+
+    def handle(self, *args, **options):
+        importer = UserImporter(
+            workers=options["workers"],
+            chunk_size=options["chunk_size"],
+            progress=self.report_progress,
+        )
+        self.stdout.write(
+            self.style.WARNING(
+                f"Importing users in chunks of {importer.chunk_size} "
+                f"with {importer.workers} hashing worker(s)"
+            )
+        )
+
+        if options["csv_file"] == "-":
+            result = importer.run(sys.stdin)
+        else:
+            try:
+                csv_file = open(options["csv_file"], newline="", encoding="utf-8-sig")
+            except OSError as exc:
+                raise CommandError(exc) from exc
+            with csv_file:
+                result = importer.run(csv_file)
+
+        for error in result.errors:
+            self.stdout.write(
+                self.style.ERROR(
+                    f"Line {error['line']} ({error['email_address']}): "
+                    f"{' '.join(error['errors'])}"
+                )
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Total '{result.created}' Users Imported, '{result.skipped}' "
+                f"skipped, '{result.failed}' failed in {result.elapsed:.1f}s "
+                f"({result.rate:.1f} rows/s)"
+            )
+        )
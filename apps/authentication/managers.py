@@ -1,4 +1,5 @@
 from django.contrib.auth.base_user import BaseUserManager
+from django.db.models.functions import Lower
 
 
 class CustomUserManager(BaseUserManager):
@@ -6,6 +7,20 @@ class CustomUserManager(BaseUserManager):
     Creating user, saving them and returning the user
     """
 
+    def with_email_lower(self):
+        """
+        Users with an `email_address_lower` alias to filter on. Compares
+        `lower(email_address)` so the functional index can be used, which
+        `email_address__iexact` (`UPPER()` on PostgreSQL) cannot.
+        """
+        return self.alias(email_address_lower=Lower("email_address"))
+
+    def filter_by_email(self, email_address):
+        """
+        Case-insensitive match on the email address.
+        """
+        return self.with_email_lower().filter(email_address_lower=email_address.lower())
+
     def create_user(self, email_address, password=None, **extra_fields):
         # if not email:
         #     raise ValueError("You must provide an email address")
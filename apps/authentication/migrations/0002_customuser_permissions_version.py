@@ -0,0 +1,22 @@
+# Generated by Django 6.1.2 on 2026-10-18 18:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="permissions_version",
+            field=models.BigIntegerField(
+                default=0,
+                editable=False,
+                help_text="Replaced whenever the user's effective permissions change.",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.1.2 on 2026-10-18 18:29
+
+from django.db import migrations, models
+
+
+def assign_bit_indexes(apps, schema_editor):
+    CustomPermission = apps.get_model("authentication", "CustomPermission")
+    permissions = list(CustomPermission.objects.order_by("id"))
+    for bit_index, permission in enumerate(permissions):
+        permission.bit_index = bit_index
+    CustomPermission.objects.bulk_update(permissions, ["bit_index"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0002_customuser_permissions_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="custompermission",
+            name="bit_index",
+            field=models.PositiveIntegerField(
+                blank=True,
+                editable=False,
+                help_text="Stable position of this permission in user permission bitmasks.",
+                null=True,
+                unique=True,
+            ),
+        ),
+        migrations.RunPython(assign_bit_indexes, migrations.RunPython.noop),
+    ]
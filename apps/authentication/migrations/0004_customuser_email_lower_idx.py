@@ -0,0 +1,22 @@
+# Generated by Django 6.1.2 on 2026-10-18 19:10
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("authentication", "0003_custompermission_bit_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                django.db.models.functions.text.Lower("email_address"),
+                name="customuser_email_lower_idx",
+            ),
+        ),
+    ]
@@ -1,7 +1,7 @@
 from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.core.exceptions import ValidationError
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.db.models.functions import Lower
 
 from apps.authentication.managers import CustomUserManager
 from base.models import AbstractBaseModel, models
@@ -85,11 +85,57 @@ class CustomUser(AbstractBaseUser, PermissionsMixin, AbstractBaseModel):
         default=False,
         help_text="Designates whether this user account is blocked.",
     )
+    permissions_version = models.BigIntegerField(
+        default=0,
+        editable=False,
+        help_text="Replaced whenever the user's effective permissions change.",
+    )
     objects = CustomUserManager()
 
+    # changing any of these outdates the access tokens issued to the user,
+    # see apps.authentication.tokens and .authentication
+    CLAIM_FIELDS = ("user_type", "is_superuser", "is_active", "is_blocked")
+
     REQUIRED_FIELDS = []
     USERNAME_FIELD = "email_address"
 
+    class Meta:
+        indexes = [
+            # case-insensitive lookups, see CustomUserManager.filter_by_email
+            models.Index(Lower("email_address"), name="customuser_email_lower_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.capture_claim_values()
+        return instance
+
+    def capture_claim_values(self):
+        # deferred fields are left out rather than loaded
+        self._loaded_claims = {
+            field: self.__dict__[field]
+            for field in self.CLAIM_FIELDS
+            if field in self.__dict__
+        }
+
+    def claims_changed(self, update_fields=None):
+        """
+        Whether saving with `update_fields` writes a `CLAIM_FIELDS` value
+        other than the one loaded. Instances not loaded from the database
+        are assumed to change them.
+        """
+        fields = self.CLAIM_FIELDS
+        if update_fields is not None:
+            fields = [field for field in fields if field in update_fields]
+        loaded = getattr(self, "_loaded_claims", None)
+        if loaded is None:
+            return bool(fields)
+        return any(
+            field not in loaded or getattr(self, field) != loaded[field]
+            for field in fields
+        )
+
     @property
     def get_permissions(self):
         return [_.code_name for _ in self.permissions.all()]
@@ -106,7 +152,9 @@ class CustomUser(AbstractBaseUser, PermissionsMixin, AbstractBaseModel):
         }
 
     def tokens(self, request):
-        refresh = RefreshToken.for_user(self)
+        from apps.authentication.tokens import refresh_token_for_user
+
+        refresh = refresh_token_for_user(self)
         return {
             "refresh": str(refresh),
             "access": str(refresh.access_token),
@@ -122,4 +170,18 @@ class CustomUser(AbstractBaseUser, PermissionsMixin, AbstractBaseModel):
     def save(self, *args, **kwargs):
         names = [self.first_name, self.middle_name, self.last_name]
         self.full_name = " ".join(name for name in names if name)
+        if not self._state.adding:
+            # only invalidate_user_permissions() writes the version, with an
+            # UPDATE; an instance loaded before it would restore a revoked one
+            update_fields = kwargs.get("update_fields")
+            if update_fields is None:
+                deferred = self.get_deferred_fields()
+                update_fields = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key and field.attname not in deferred
+                ]
+            kwargs["update_fields"] = [
+                name for name in update_fields if name != "permissions_version"
+            ]
         super().save(*args, **kwargs)
@@ -43,11 +43,26 @@ class CustomPermission(AbstractBaseModel):
         blank=True,
         help_text="null=True, blank=True",
     )
+    bit_index = models.PositiveIntegerField(
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Stable position of this permission in user permission bitmasks.",
+    )
 
     class Meta:
         verbose_name = "Permission"
         verbose_name_plural = "Permissions"
 
+    @classmethod
+    def next_bit_index(cls):
+        # soft-deleted permissions keep their index so it is never reused
+        last_index = cls.all_objects.aggregate(last=models.Max("bit_index"))["last"]
+        return 0 if last_index is None else last_index + 1
+
     def save(self, *args, **kwargs):
         self.code_name = str(self.code_name).lower()
+        if self.bit_index is None:
+            self.bit_index = self.next_bit_index()
         super().save(*args, **kwargs)
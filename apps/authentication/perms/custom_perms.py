@@ -1,12 +1,37 @@
+from functools import lru_cache
+
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 
 from ..models import UserTypeEnum
 from ..utils import (
     HttpBasedPermissionActionMaps,
+    get_permission_mask,
+    get_user_permission_mask,
 )
 
 
+@lru_cache(maxsize=None)
+def get_model_permission_code_names(model_name, action):
+    """
+    Code names checked for `action` on `model_name`: any CRUD permission on
+    the model grants viewing it, other actions need their own permission.
+    """
+    model_lower = str(model_name).lower()
+    required_perm = f"{action}_{model_lower}"
+    if action != HttpBasedPermissionActionMaps.CAN_VIEW:
+        return required_perm, (required_perm,)
+    return required_perm, tuple(
+        f"{crud_action}_{model_lower}"
+        for crud_action in (
+            HttpBasedPermissionActionMaps.CAN_VIEW,
+            HttpBasedPermissionActionMaps.CAN_CREATE,
+            HttpBasedPermissionActionMaps.CAN_UPDATE,
+            HttpBasedPermissionActionMaps.CAN_DELETE,
+        )
+    )
+
+
 class CustomIsAuthenticatedPermission(IsAuthenticated):
     """
     A simple permission mixin that ensures the user is authenticated.
@@ -39,6 +64,23 @@ class IsInstructor(CustomIsAuthenticatedPermission):
         return request.user.user_type == UserTypeEnum.INSTRUCTOR
 
 
+class IsAdmin(CustomIsAuthenticatedPermission):
+    message = "Only admins can perform this action."
+
+    def check_permission(self, request, view):
+        return request.user.is_superuser or request.user.user_type == UserTypeEnum.ADMIN
+
+
+class IsInstructorOrAdmin(CustomIsAuthenticatedPermission):
+    message = "Only instructors or admins can perform this action."
+
+    def check_permission(self, request, view):
+        return request.user.is_superuser or request.user.user_type in (
+            UserTypeEnum.INSTRUCTOR,
+            UserTypeEnum.ADMIN,
+        )
+
+
 class IsInstructorOwner(CustomIsAuthenticatedPermission):
     message = "You must be the owner of this course to perform this action."
 
@@ -113,15 +155,24 @@ class CustomAuthenticationPermission(IsAuthenticated):
             )
 
         self.request = request
+        return self.non_branch_based_authentication()
+
+    def get_user_permission_mask(self):
+        # stateless users carry their permission mask in the access token
+        token_permission_mask = getattr(
+            self.request.user, "token_permission_mask", None
+        )
+        if token_permission_mask is not None:
+            return token_permission_mask
+        return get_user_permission_mask(self.request.user.pk)
 
     def non_branch_based_authentication(self):
-        user_permissions = self.get_user_permissions()
+        user_permission_mask = self.get_user_permission_mask()
 
         # if atleast 1 custom permission matches then we pass the authentication
         if self.custom_permission:
-            for perm in self.custom_permission:
-                if perm in user_permissions:
-                    return True
+            if user_permission_mask & get_permission_mask(self.custom_permission):
+                return True
 
             raise PermissionDenied(
                 f"Permission denied. Missing Permissions: {self.custom_permission}"
@@ -138,39 +189,13 @@ class CustomAuthenticationPermission(IsAuthenticated):
         # returns can_create , can_view
         action = self.get_permission_action(http_method)
 
-        model_lower = str(models_based_on_http_method).lower()
-        view_perm = f"{HttpBasedPermissionActionMaps.CAN_VIEW}_{model_lower}"
-        create_perm = f"{HttpBasedPermissionActionMaps.CAN_CREATE}_{model_lower}"
-        update_perm = f"{HttpBasedPermissionActionMaps.CAN_UPDATE}_{model_lower}"
-        delete_perm = f"{HttpBasedPermissionActionMaps.CAN_DELETE}_{model_lower}"
-
-        if action == HttpBasedPermissionActionMaps.CAN_CREATE:
-            if create_perm not in user_permissions:
-                raise PermissionDenied(
-                    f"Permission denied. Missing permission : {delete_perm}"
-                )
-
-        elif action == HttpBasedPermissionActionMaps.CAN_UPDATE:
-            if update_perm not in user_permissions:
-                raise PermissionDenied(
-                    f"Permission denied. Missing permission : {update_perm}"
-                )
-
-        elif action == HttpBasedPermissionActionMaps.CAN_DELETE:
-            if delete_perm not in user_permissions:
-                raise PermissionDenied(
-                    f"Permission denied. Missing permission : {delete_perm}"
-                )
-
-        else:
-            if (
-                view_perm not in user_permissions
-                and create_perm not in user_permissions
-                and update_perm not in user_permissions
-                and delete_perm not in user_permissions
-            ):
-                raise PermissionDenied(
-                    f"Permission denied. Missing permission : {view_perm}"
-                )
+        # (required code name, code names any of which grant the action)
+        required_perm, granting_perms = get_model_permission_code_names(
+            models_based_on_http_method, action
+        )
+        if not user_permission_mask & get_permission_mask(granting_perms):
+            raise PermissionDenied(
+                f"Permission denied. Missing permission : {required_perm}"
+            )
 
         return True
@@ -10,22 +10,26 @@ from .perms import (
     RolesRetrieveSerializer,
     RolesUpdateSerializer,
 )
+from .refresh import UserClaimsTokenRefreshSerializer
 from .signup import CustomUserSignUpSerializer
 from .users import (
     ChangePasswordSerializer,
     CustomUserCreateSerializer,
     CustomUserRetrieveSerializer,
     CustomUserUpdateSerializer,
+    UserImportSerializer,
     UserListSerializer,
 )
 
 __all__ = [
     "LoginSerializer",
     "LogoutSerializer",
+    "UserClaimsTokenRefreshSerializer",
     "CustomUserCreateSerializer",
     "CustomUserUpdateSerializer",
     "CustomUserRetrieveSerializer",
     "UserListSerializer",
+    "UserImportSerializer",
     "ChangePasswordSerializer",
     "PermissionCategorySerializer",
     "PermissionDropdownSerializer",
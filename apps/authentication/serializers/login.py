@@ -1,18 +1,20 @@
-from django.contrib.auth import authenticate, get_user_model
-from django.db.models import Q
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from base.serializers import AsyncSerializerMixin
+
+from ..hashing import acheck_password
+
 User = get_user_model()
 
 
-class LoginSerializer(serializers.Serializer):
+class LoginSerializer(AsyncSerializerMixin, serializers.Serializer):
     email_address = serializers.CharField(required=False)
     password = serializers.CharField(write_only=True)
 
-    def validate(self, attrs):
-        request = self.context.get("request")
+    def get_user(self, attrs):
         email = attrs.get("email_address", "").lower()
-        password = attrs.get("password")
 
         if not email:
             raise serializers.ValidationError(
@@ -21,22 +23,41 @@ class LoginSerializer(serializers.Serializer):
                 }
             )
 
-        user = User.objects.filter(Q(email_address__iexact=email)).first()
-
-        if not user:
-            raise serializers.ValidationError({"email_address": "User not found."})
-        user = authenticate(
-            request=request, email_address=user.email_address, password=password
+        # the only user lookup of the login, roles and permissions are
+        # prefetched for the token payload
+        user = (
+            User.objects.filter_by_email(email)
+            .prefetch_related("roles", "permissions")
+            .first()
         )
 
         if not user:
-            raise serializers.ValidationError({"password": "Invalid credentials."})
+            raise serializers.ValidationError({"email_address": "User not found."})
+        return user
 
+    def get_tokens(self, user):
         if not user.is_active:
             raise serializers.ValidationError({"email_address": "User is not active."})
 
         if user.is_blocked:
             raise serializers.ValidationError({"email_address": "Account is blocked."})
 
-        data = user.tokens(request)
-        return data
+        return user.tokens(self.context.get("request"))
+
+    def validate(self, attrs):
+        user = self.get_user(attrs)
+
+        # what authenticate() would do, without looking the user up again
+        if not user.check_password(attrs.get("password")):
+            raise serializers.ValidationError({"password": "Invalid credentials."})
+
+        return self.get_tokens(user)
+
+    async def avalidate(self, attrs):
+        user = await sync_to_async(self.get_user)(attrs)
+
+        # hashed on the password hashing pool, see apps.authentication.hashing
+        if not await acheck_password(user, attrs.get("password")):
+            raise serializers.ValidationError({"password": "Invalid credentials."})
+
+        return await sync_to_async(self.get_tokens)(user)
@@ -0,0 +1,7 @@
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+
+from ..tokens import UserClaimsRefreshToken
+
+
+class UserClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = UserClaimsRefreshToken
@@ -1,9 +1,12 @@
 from rest_framework import serializers
 
+from base.serializers import AsyncSerializerMixin
+
+from ..hashing import amake_password
 from ..models import CustomUser
 
 
-class CustomUserSignUpSerializer(serializers.ModelSerializer):
+class CustomUserSignUpSerializer(AsyncSerializerMixin, serializers.ModelSerializer):
     # username = serializers.CharField(required=True)
     password = serializers.CharField(write_only=True, required=True)
     email_address = serializers.EmailField(required=True)
@@ -24,7 +27,7 @@ class CustomUserSignUpSerializer(serializers.ModelSerializer):
         #     )
 
         email = data.get("email_address")
-        if email and CustomUser.objects.filter(email_address__iexact=email).exists():
+        if email and CustomUser.objects.filter_by_email(email).exists():
             raise serializers.ValidationError({"email_address": "Email already exists."})
 
         return data
@@ -41,3 +44,13 @@ class CustomUserSignUpSerializer(serializers.ModelSerializer):
         # UserProfile.objects.create(user=user)
 
         return user
+
+    async def acreate(self, validated_data):
+        password = validated_data.pop("password")
+
+        user = CustomUser(**validated_data)
+        user.password = await amake_password(password)
+        user.is_active = True
+        await user.asave()
+
+        return user
@@ -1,8 +1,13 @@
+import codecs
+
+from django.conf import settings
 from rest_framework import serializers
 
-from base.serializers import BaseModelSerializer
+from base.serializers import AsyncSerializerMixin, BaseModelSerializer
 
+from ..hashing import acheck_password, amake_password
 from ..models import CustomPermission, CustomUser, Roles
+from ..user_import import UserImporter
 
 
 class CustomUserCreateSerializer(BaseModelSerializer):
@@ -89,7 +94,7 @@ class UserListSerializer(BaseModelSerializer):
         ]
 
 
-class ChangePasswordSerializer(BaseModelSerializer):
+class ChangePasswordSerializer(AsyncSerializerMixin, BaseModelSerializer):
     password = serializers.CharField(write_only=True, required=True)
     confirm_password = serializers.CharField(write_only=True, required=True)
     old_password = serializers.CharField(write_only=True, required=True)
@@ -118,19 +123,72 @@ class ChangePasswordSerializer(BaseModelSerializer):
             )
         return password
 
+    def validate_confirmation(self, attrs):
+        if attrs["password"] != attrs["confirm_password"]:
+            raise serializers.ValidationError(
+                {"password": "Password fields didn't match."}
+            )
+        return attrs
+
     def validate(self, attrs):
         user = self.context["view"].kwargs.get("user")
         if not user.check_password(attrs["old_password"]):
             raise serializers.ValidationError(
                 {"old_password": "Old password is not correct."}
             )
-        if attrs["password"] != attrs["confirm_password"]:
+        return self.validate_confirmation(attrs)
+
+    async def avalidate(self, attrs):
+        user = self.context["view"].kwargs.get("user")
+        if not await acheck_password(user, attrs["old_password"]):
             raise serializers.ValidationError(
-                {"password": "Password fields didn't match."}
+                {"old_password": "Old password is not correct."}
             )
-        return attrs
+        return self.validate_confirmation(attrs)
 
     def update(self, instance, validated_data):
         instance.set_password(validated_data["password"])
-        instance.save()
+        instance.save(update_fields=["password"])
         return instance
+
+    async def aupdate(self, instance, validated_data):
+        raw_password = validated_data["password"]
+        # what set_password() does, with the hash made on the hashing pool;
+        # _password makes save() call the validators' password_changed()
+        instance.password = await amake_password(raw_password)
+        instance._password = raw_password
+        await instance.asave(update_fields=["password"])
+        return instance
+
+
+class UserImportSerializer(serializers.Serializer):
+    """
+    Import the users of an uploaded CSV file with `UserImporter`, see there
+    for the columns. Reports created, skipped and failed rows and the
+    throughput.
+    """
+
+    file = serializers.FileField(write_only=True)
+    created = serializers.IntegerField(read_only=True)
+    skipped = serializers.IntegerField(read_only=True)
+    failed = serializers.IntegerField(read_only=True)
+    seconds = serializers.FloatField(read_only=True)
+    rows_per_second = serializers.FloatField(read_only=True)
+    errors = serializers.ListField(child=serializers.DictField(), read_only=True)
+
+    def validate_file(self, file):
+        # the upload is imported within the request, by the web worker
+        max_rows = settings.USER_IMPORT_MAX_UPLOAD_ROWS
+        if sum(1 for _ in file) - 1 > max_rows:
+            raise serializers.ValidationError(
+                f"At most {max_rows} users can be uploaded at once, import "
+                "bigger files with the import_users command."
+            )
+        file.seek(0)
+        return file
+
+    def create(self, validated_data):
+        # decode the upload line by line instead of reading it whole, and
+        # hash in-process rather than forking the web worker
+        lines = codecs.iterdecode(validated_data["file"], "utf-8-sig")
+        return UserImporter(workers=1).run(lines).as_dict()
@@ -0,0 +1,76 @@
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import CustomPermission, CustomUser, Roles
+from .utils import invalidate_permission_bits, invalidate_user_permissions
+
+# On a reverse `clear()` pk_set is None, so the affected rows are
+# resolved in "pre_clear" while they still exist.
+FORWARD_ACTIONS = ("post_add", "post_remove", "post_clear")
+REVERSE_ACTIONS = ("post_add", "post_remove", "pre_clear")
+
+
+def _users_of_roles(role_ids):
+    return list(
+        CustomUser.objects.filter(roles__in=role_ids).values_list("id", flat=True)
+    )
+
+
+@receiver(m2m_changed, sender=CustomUser.roles.through)
+@receiver(m2m_changed, sender=CustomUser.permissions.through)
+def invalidate_on_user_grants_changed(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not reverse:
+        # user.roles / user.permissions changed
+        if action in FORWARD_ACTIONS:
+            invalidate_user_permissions([instance.pk])
+    elif action in REVERSE_ACTIONS:
+        # role.customuser_set / permission.customuser_set changed
+        if action == "pre_clear":
+            pk_set = instance.customuser_set.values_list("id", flat=True)
+        invalidate_user_permissions(pk_set)
+
+
+@receiver(m2m_changed, sender=Roles.permissions.through)
+def invalidate_on_role_permissions_changed(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not reverse:
+        # role.permissions changed
+        if action in FORWARD_ACTIONS:
+            invalidate_user_permissions(_users_of_roles([instance.pk]))
+    elif action in REVERSE_ACTIONS:
+        # permission.roles changed
+        if action == "pre_clear":
+            pk_set = instance.roles.values_list("id", flat=True)
+        invalidate_user_permissions(_users_of_roles(pk_set))
+
+
+@receiver(post_save, sender=Roles)
+@receiver(pre_delete, sender=Roles)
+def invalidate_on_role_changed(sender, instance, **kwargs):
+    # is_active toggles and (soft) deletes change what a role grants
+    invalidate_user_permissions(_users_of_roles([instance.pk]))
+
+
+@receiver(post_save, sender=CustomPermission)
+def invalidate_on_permission_changed(sender, instance, created, **kwargs):
+    # bit indexes never change, but code names and the set of live
+    # permissions do
+    invalidate_permission_bits()
+    # a (soft) deleted permission no longer counts in its holders' masks
+    if not created:
+        invalidate_user_permissions(
+            set(instance.customuser_set.values_list("id", flat=True))
+            | set(_users_of_roles(instance.roles.values_list("id", flat=True)))
+        )
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_on_user_changed(sender, instance, created, update_fields, **kwargs):
+    # blocking, deactivating or promoting a user must outdate the claims of
+    # tokens already issued to them; profile edits and password rehashes not
+    if not created and instance.claims_changed(update_fields):
+        invalidate_user_permissions([instance.pk], user=instance)
+    instance.capture_claim_values()
@@ -1,3 +1,539 @@
-from django.test import TestCase
+import tempfile
+from io import StringIO
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.contrib.auth.hashers import (
+    PBKDF2PasswordHasher,
+    identify_hasher,
+    make_password,
+)
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .authentication import TokenClaimsAuthentication
+from .models import CustomPermission, CustomUser, Roles, UserTypeEnum
+from .tokens import refresh_token_for_user
+from .user_import import UserImporter
+from .utils import get_permission_mask, get_user_permission_mask, get_user_permissions
+
+
+class EffectivePermissionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email_address="user@test.com", password="Test@1234"
+        )
+        cls.view_roles = CustomPermission.objects.create(
+            name="Can View Roles", code_name="can_view_roles"
+        )
+        cls.create_roles = CustomPermission.objects.create(
+            name="Can Create Roles", code_name="can_create_roles"
+        )
+        cls.role = Roles.objects.create(name="Manager")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_union_of_direct_and_role_permissions_in_one_query(self):
+        self.user.permissions.add(self.view_roles)
+        self.role.permissions.add(self.create_roles)
+        self.user.roles.add(self.role)
+
+        with self.assertNumQueries(1):
+            mask = get_user_permission_mask(self.user.pk)
+        with self.assertNumQueries(0):
+            get_user_permission_mask(self.user.pk)
+
+        self.assertEqual(
+            mask, 1 << self.view_roles.bit_index | 1 << self.create_roles.bit_index
+        )
+        self.assertEqual(
+            get_user_permissions(self.user.pk), {"can_view_roles", "can_create_roles"}
+        )
+
+    def test_m2m_changes_invalidate_the_cached_set(self):
+        self.user.roles.add(self.role)
+        self.assertEqual(get_user_permissions(self.user.pk), frozenset())
+
+        self.role.permissions.add(self.view_roles)
+        self.assertEqual(get_user_permissions(self.user.pk), {"can_view_roles"})
+
+        self.view_roles.roles.clear()
+        self.assertEqual(get_user_permissions(self.user.pk), frozenset())
+
+        self.user.permissions.add(self.create_roles)
+        self.assertEqual(get_user_permissions(self.user.pk), {"can_create_roles"})
+
+    def test_inactive_roles_grant_nothing(self):
+        self.role.permissions.add(self.view_roles)
+        self.user.roles.add(self.role)
+        self.assertEqual(get_user_permissions(self.user.pk), {"can_view_roles"})
+
+        self.role.is_active = False
+        self.role.save()
+        self.assertEqual(get_user_permissions(self.user.pk), frozenset())
+
+
+class PermissionBitIndexTests(TestCase):
+    def test_create_perms_assigns_stable_bit_indexes(self):
+        manual = CustomPermission.objects.create(name="Manual", code_name="manual")
+        call_command("create_perms", stdout=StringIO())
+
+        bit_indexes = list(
+            CustomPermission.objects.order_by("bit_index").values_list(
+                "bit_index", flat=True
+            )
+        )
+        self.assertEqual(bit_indexes, list(range(len(bit_indexes))))
+
+        before = dict(CustomPermission.objects.values_list("code_name", "bit_index"))
+        manual.delete()
+        call_command("create_perms", stdout=StringIO())
+        after = dict(CustomPermission.all_objects.values_list("code_name", "bit_index"))
+        self.assertEqual(before, after)
+
+
+class CustomAuthenticationPermissionTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email_address="user@test.com", password="Test@1234"
+        )
+        cls.view_roles = CustomPermission.objects.create(
+            name="Can View Roles", code_name="can_view_roles"
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def test_missing_permission_is_denied(self):
+        response = self.client.get(reverse("roles-list"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_granted_permission_is_allowed(self):
+        self.user.permissions.add(self.view_roles)
+        response = self.client.get(reverse("roles-list"))
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(JWT_PERMISSION_CLAIMS=True)
+class PermissionClaimsTokenTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email_address="user@test.com", password="Test@1234"
+        )
+        cls.view_roles = CustomPermission.objects.create(
+            name="Can View Roles", code_name="can_view_roles"
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.user.permissions.add(self.view_roles)
+        self.user.refresh_from_db()
+
+    def _get_roles(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        return self.client.get(reverse("roles-list"))
+
+    def test_access_token_carries_permission_claims(self):
+        access = refresh_token_for_user(self.user).access_token
+
+        self.assertEqual(access["perms"], get_permission_mask(["can_view_roles"]))
+        self.assertEqual(access["user_type"], self.user.user_type)
+        self.assertFalse(access["is_superuser"])
+
+    def test_authorisation_does_not_load_the_user(self):
+        access = str(refresh_token_for_user(self.user).access_token)
+        self._get_roles(access)
+
+        # version lookup is cached: no user or permission queries remain
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._get_roles(access)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            [q for q in ctx.captured_queries if "authentication_customuser" in q["sql"]]
+        )
+
+    def test_permission_changes_force_a_refresh(self):
+        refresh = refresh_token_for_user(self.user)
+        access = str(refresh.access_token)
+
+        self.user.permissions.remove(self.view_roles)
+        self.assertEqual(self._get_roles(access).status_code, 401)
+
+        self.client.credentials()
+        response = self.client.post(reverse("token-refresh"), {"refresh": str(refresh)})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get_roles(response.data["access"]).status_code, 403)
+
+
+class TokenClaimsAuthenticationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email_address="user@test.com", password="Test@1234", first_name="User"
+        )
+
+    def setUp(self):
+        cache.clear()
+        access = refresh_token_for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+    def test_opted_in_views_do_not_load_the_user(self):
+        self.client.get(reverse("course-list"))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("course-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            [
+                q
+                for q in ctx.captured_queries
+                if 'FROM "authentication_customuser"' in q["sql"]
+            ]
+        )
+
+    def test_non_claim_attributes_load_the_user_once(self):
+        user = TokenClaimsAuthentication().get_user(
+            refresh_token_for_user(self.user).access_token
+        )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(user.user_type, self.user.user_type)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.first_name, "User")
+            self.assertEqual(user.email_address, "user@test.com")
+        self.assertEqual(user, self.user)
+
+    def test_stale_instances_do_not_restore_a_revoked_version(self):
+        stale = CustomUser.objects.get(pk=self.user.pk)
+        role = Roles.objects.create(name="Auditor")
+        CustomUser.objects.get(pk=self.user.pk).roles.add(role)
+        self.assertEqual(self.client.get(reverse("course-list")).status_code, 401)
+
+        stale.first_name = "Stale"
+        stale.save()
+        stale.save(update_fields=["first_name", "permissions_version"])
+        self.assertEqual(self.client.get(reverse("course-list")).status_code, 401)
+        self.assertNotEqual(
+            CustomUser.objects.values_list("permissions_version", flat=True).get(
+                pk=self.user.pk
+            ),
+            stale.permissions_version,
+        )
+
+    def test_only_claim_field_changes_revoke_tokens(self):
+        user = CustomUser.objects.get(pk=self.user.pk)
+        user.first_name = "Renamed"
+        user.save()
+        user.set_password("Other@1234")
+        user.save(update_fields=["password"])
+        self.assertEqual(self.client.get(reverse("course-list")).status_code, 200)
+
+        user.is_blocked = True
+        user.save()
+        self.assertEqual(self.client.get(reverse("course-list")).status_code, 401)
+        # the instance has the new version, tokens issued from it are current
+        self.assertEqual(
+            refresh_token_for_user(user).access_token["perms_ver"],
+            CustomUser.objects.values_list("permissions_version", flat=True).get(
+                pk=user.pk
+            ),
+        )
+
+
+class LoginTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email_address="Mixed.Case@Test.com", password="Test@1234"
+        )
+        cls.role = Roles.objects.create(name="Manager")
+        cls.view_roles = CustomPermission.objects.create(
+            name="Can View Roles", code_name="can_view_roles"
+        )
+        cls.user.roles.add(cls.role)
+        cls.user.permissions.add(cls.view_roles)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_login_looks_the_user_up_once_case_insensitively(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                reverse("login"),
+                {"email_address": "mixed.case@test.COM", "password": "Test@1234"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["id"], self.user.pk)
+        self.assertEqual(response.data["roles"], ["Manager"])
+        self.assertEqual(response.data["permissions"], ["can_view_roles"])
+        self.assertEqual(
+            len(
+                [
+                    q
+                    for q in ctx.captured_queries
+                    if 'FROM "authentication_customuser"' in q["sql"]
+                ]
+            ),
+            1,
+        )
+
+    def test_wrong_password_and_unknown_email_are_rejected(self):
+        response = self.client.post(
+            reverse("login"),
+            {"email_address": "mixed.case@test.com", "password": "wrong"},
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("password", response.data["errors"])
+
+        response = self.client.post(
+            reverse("login"),
+            {"email_address": "nobody@test.com", "password": "Test@1234"},
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("email_address", response.data["errors"])
+
+    def test_email_lookup_is_case_insensitive_and_indexed(self):
+        self.assertEqual(
+            CustomUser.objects.filter_by_email("MIXED.case@test.com").get(), self.user
+        )
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, CustomUser._meta.db_table
+            )
+        self.assertIn("customuser_email_lower_idx", constraints)
+
+
+try:
+    import argon2
+except ImportError:
+    argon2 = None
+
+
+class AsyncPasswordViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email_address="user@test.com", password="Test@1234"
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_signup_and_login(self):
+        response = self.client.post(
+            reverse("user-signup"),
+            {"email_address": "new@test.com", "password": "Secret@123"},
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(
+            CustomUser.objects.get(email_address="new@test.com").check_password(
+                "Secret@123"
+            )
+        )
+
+        response = self.client.post(
+            reverse("login"),
+            {"email_address": "new@test.com", "password": "Secret@123"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("access", response.data)
+
+    def test_change_password(self):
+        self.client.force_authenticate(self.user)
+        url = reverse("change-user-password", args=[self.user.pk])
+
+        response = self.client.patch(
+            url,
+            {
+                "old_password": "wrong",
+                "password": "Secret@123",
+                "confirm_password": "Secret@123",
+            },
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("old_password", response.data["errors"])
+
+        with mock.patch(
+            "django.contrib.auth.base_user.password_validation.password_changed"
+        ) as password_changed:
+            response = self.client.patch(
+                url,
+                {
+                    "old_password": "Test@1234",
+                    "password": "Secret@123",
+                    "confirm_password": "Secret@123",
+                },
+            )
+        self.assertEqual(response.status_code, 200)
+        password_changed.assert_called_once()
+        self.assertEqual(password_changed.call_args.args[0], "Secret@123")
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("Secret@123"))
+
+    @skipUnless(argon2, "argon2-cffi is not installed")
+    def test_login_upgrades_the_hash_to_argon2(self):
+        self.user.password = make_password("Test@1234", hasher="pbkdf2_sha256")
+        self.user.save(update_fields=["password"])
+
+        with override_settings(
+            PASSWORD_HASHERS=[
+                "apps.authentication.hashers.TunedArgon2PasswordHasher",
+                "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+            ]
+        ):
+            response = self.client.post(
+                reverse("login"),
+                {"email_address": "user@test.com", "password": "Test@1234"},
+            )
+            self.assertEqual(response.status_code, 200)
+            self.user.refresh_from_db()
+            self.assertEqual(identify_hasher(self.user.password).algorithm, "argon2")
+            self.assertTrue(self.user.check_password("Test@1234"))
+
+    def test_tokens_of_a_login_that_upgraded_the_hash_are_valid(self):
+        # fewer iterations than the current PBKDF2 default, so login rehashes
+        self.user.password = PBKDF2PasswordHasher().encode(
+            "Test@1234", "lowiterations", iterations=1000
+        )
+        self.user.save(update_fields=["password"])
+
+        response = self.client.post(
+            reverse("login"),
+            {"email_address": "user@test.com", "password": "Test@1234"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertNotEqual(self.user.password.split("$")[1], "1000")
+
+        # course-list authenticates from the token claims alone
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        self.assertEqual(self.client.get(reverse("course-list")).status_code, 200)
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class UserImportTests(APITestCase):
+    CSV = (
+        "email_address,password,first_name,middle_name,last_name,user_type,roles,permissions\n"
+        "ada@test.com,Secret@123,Ada,,Lovelace,instructor,Manager,can_view_roles\n"
+        "alan@test.com,Secret@456,Alan,M,Turing,,Manager|Auditor,\n"
+        "Ada@Test.com,Other@123,Ada,,Again,,,\n"
+        "Existing@test.com,Secret@789,,,,,,\n"
+        "not-an-email,Secret@123,,,,,,\n"
+        "grace@test.com,,Grace,,Hopper,STUDENT,Unknown,\n"
+        "linus@test.com,,Linus,,,,,\n"
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = CustomUser.objects.create_user(
+            email_address="existing@test.com",
+            password="Test@1234",
+            user_type=UserTypeEnum.ADMIN,
+        )
+        cls.view_roles = CustomPermission.objects.create(
+            name="Can View Roles", code_name="can_view_roles"
+        )
+        cls.manager = Roles.objects.create(name="Manager")
+        cls.auditor = Roles.objects.create(name="Auditor")
+
+    def import_csv(self, **options):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv") as csv_file:
+            csv_file.write(self.CSV)
+            csv_file.flush()
+            out = StringIO()
+            call_command("import_users", csv_file.name, stdout=out, **options)
+        return out.getvalue()
+
+    def assert_imported(self):
+        ada = CustomUser.objects.get(email_address="ada@test.com")
+        self.assertEqual(ada.full_name, "Ada Lovelace")
+        self.assertEqual(ada.user_type, UserTypeEnum.INSTRUCTOR)
+        self.assertTrue(ada.check_password("Secret@123"))
+        self.assertEqual(list(ada.roles.all()), [self.manager])
+        self.assertEqual(list(ada.permissions.all()), [self.view_roles])
+
+        alan = CustomUser.objects.get(email_address="alan@test.com")
+        self.assertEqual(alan.full_name, "Alan M Turing")
+        self.assertEqual(alan.user_type, UserTypeEnum.STUDENT)
+        self.assertEqual(set(alan.roles.all()), {self.manager, self.auditor})
+
+        linus = CustomUser.objects.get(email_address="linus@test.com")
+        self.assertFalse(linus.has_usable_password())
+        self.assertFalse(CustomUser.objects.filter(email_address="grace@test.com"))
+        self.assertEqual(CustomUser.objects.count(), 4)
+
+    def test_command_imports_users_with_roles_and_permissions(self):
+        output = self.import_csv(workers=1, chunk_size=2)
+
+        self.assert_imported()
+        self.assertIn("Total '3' Users Imported, '2' skipped, '2' failed", output)
+        self.assertIn("Line 6 (not-an-email)", output)
+        self.assertIn("Unknown role(s): Unknown.", output)
+
+    def test_command_hashes_across_a_process_pool(self):
+        self.import_csv(workers=2)
+
+        self.assert_imported()
+
+    def test_endpoint_is_restricted_to_admins(self):
+        student = CustomUser.objects.create_user(
+            email_address="student@test.com", password="Test@1234"
+        )
+        upload = SimpleUploadedFile("users.csv", self.CSV.encode())
+        url = reverse("user-import")
+
+        self.client.force_authenticate(student)
+        self.assertEqual(self.client.post(url, {"file": upload}).status_code, 403)
+
+        upload.seek(0)
+        self.client.force_authenticate(self.admin)
+        response = self.client.post(url, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {
+                key: response.data["data"][key]
+                for key in ("created", "skipped", "failed")
+            },
+            {"created": 3, "skipped": 2, "failed": 2},
+        )
+        self.assertEqual(len(response.data["data"]["errors"]), 2)
+
+    def test_rows_inserted_meanwhile_are_skipped(self):
+        CustomUser.objects.create_user(
+            email_address="ada@test.com", password="Test@1234"
+        )
+        # the lookup misses the users, as if they signed up right after it
+        lookups = [lambda users: set(), UserImporter._existing_email_addresses]
+        with mock.patch.object(
+            UserImporter,
+            "_existing_email_addresses",
+            side_effect=lambda users: lookups.pop(0)(users),
+        ):
+            result = UserImporter(workers=1).run(StringIO(self.CSV))
+
+        self.assertEqual((result.created, result.skipped, result.failed), (2, 3, 2))
+        self.assertTrue(CustomUser.objects.filter(email_address="alan@test.com"))
+        self.assertEqual(CustomUser.objects.count(), 4)
+
+    @override_settings(USER_IMPORT_MAX_UPLOAD_ROWS=6)
+    def test_endpoint_caps_the_uploaded_rows(self):
+        self.client.force_authenticate(self.admin)
+        upload = SimpleUploadedFile("users.csv", self.CSV.encode())
+        response = self.client.post(
+            reverse("user-import"), {"file": upload}, format="multipart"
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("import_users", response.data["message"])
+        self.assertEqual(CustomUser.objects.count(), 1)
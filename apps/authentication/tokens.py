@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .utils import get_user_permission_mask
+
+USER_CLAIMS = ("user_type", "is_superuser")
+PERMISSIONS_CLAIM = "perms"
+PERMISSIONS_VERSION_CLAIM = "perms_ver"
+
+
+def add_user_claims(token, user):
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    token[PERMISSIONS_VERSION_CLAIM] = user.permissions_version
+    if settings.JWT_PERMISSION_CLAIMS:
+        token[PERMISSIONS_CLAIM] = get_user_permission_mask(user.pk)
+
+
+class UserClaimsRefreshToken(RefreshToken):
+    """
+    Refresh token whose access tokens carry the user's type, superuser flag
+    and permissions version (plus the permission bitmask when
+    `JWT_PERMISSION_CLAIMS` is on), so requests can be authorised without
+    loading the user. Claims are re-resolved every time an access token is
+    issued.
+    """
+
+    _user = None
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token._user = user
+        return token
+
+    @property
+    def access_token(self):
+        access = super().access_token
+        user = self._user or get_user_model().objects.get(
+            **{api_settings.USER_ID_FIELD: self[api_settings.USER_ID_CLAIM]}
+        )
+        add_user_claims(access, user)
+        return access
+
+
+def refresh_token_for_user(user):
+    return UserClaimsRefreshToken.for_user(user)
@@ -15,6 +15,7 @@ from .views import (
     RolesRetrieveView,
     RolesUpdateView,
     UserCreateView,
+    UserImportView,
     UserListView,
     UserRetrieveView,
     UserUpdateView,
@@ -44,6 +45,7 @@ roles_patterns = [
 user_patterns = [
     path("list", UserListView.as_view(), name="user-list"),
     path("create", UserCreateView.as_view(), name="user-create"),
+    path("import", UserImportView.as_view(), name="user-import"),
     path("retrieve/<int:pk>", UserRetrieveView.as_view(), name="user-retrieve"),
     path("update/<int:pk>", UserUpdateView.as_view(), name="user-update"),
     path(
@@ -0,0 +1,261 @@
+import contextlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from csv import DictReader
+from itertools import batched
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+
+from .managers import CustomUserManager
+from .models import CustomPermission, CustomUser, Roles, UserTypeEnum
+
+
+def _setup_worker():
+    # forked workers inherit the configured project, spawned ones do not
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "e_learning_backend.settings")
+        django.setup()
+
+
+def hash_password(password):
+    """
+    Hash one password in a pool worker; no password gives an unusable one.
+    """
+    return make_password(password or None)
+
+
+class UserImportResult:
+    MAX_REPORTED_ERRORS = 100
+
+    def __init__(self):
+        self.created = 0
+        self.skipped = 0
+        self.failed = 0
+        self.errors = []
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    @property
+    def processed(self):
+        return self.created + self.skipped + self.failed
+
+    @property
+    def rate(self):
+        """Rows processed per second."""
+        elapsed = self.elapsed or time.perf_counter() - self.started
+        return self.processed / elapsed if elapsed else 0.0
+
+    def add_error(self, line, email_address, messages):
+        self.failed += 1
+        if len(self.errors) < self.MAX_REPORTED_ERRORS:
+            self.errors.append(
+                {"line": line, "email_address": email_address, "errors": messages}
+            )
+
+    def finish(self):
+        self.elapsed = time.perf_counter() - self.started
+
+    def as_dict(self):
+        return {
+            "created": self.created,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "seconds": round(self.elapsed, 2),
+            "rows_per_second": round(self.rate, 1),
+            "errors": self.errors,
+        }
+
+
+class UserImporter:
+    """
+    Streams users from CSV into the database chunk by chunk. Passwords are
+    hashed across a process pool, users are inserted with one `bulk_create`
+    per chunk and their roles and permissions with one `bulk_create` per
+    through table, instead of a save() and two set() calls per user.
+
+    Columns: email_address (required), password, first_name, middle_name,
+    last_name, user_type, roles (role names) and permissions (permission
+    code names), the last two separated by "|". Rows without a password get
+    an unusable one, rows whose email address already exists are skipped.
+    Each chunk is committed on its own; one that hits an email address
+    inserted meanwhile is retried without it.
+    """
+
+    MULTI_VALUE_SEPARATOR = "|"
+    NAME_FIELDS = ("first_name", "middle_name", "last_name")
+
+    def __init__(self, workers=None, chunk_size=None, progress=None):
+        self.workers = workers or settings.USER_IMPORT_WORKERS or os.cpu_count()
+        self.chunk_size = chunk_size or settings.USER_IMPORT_CHUNK_SIZE
+        # called with the running result after every chunk
+        self.progress = progress
+
+    def run(self, lines):
+        """
+        Import the CSV `lines` (a text file or any iterable of lines).
+        """
+        result = UserImportResult()
+        self.role_ids = dict(Roles.objects.values_list("name", "id"))
+        self.permission_ids = dict(
+            CustomPermission.objects.values_list("code_name", "id")
+        )
+        self.seen = set()
+
+        # the header is line 1
+        rows = enumerate(DictReader(lines), start=2)
+        with self._executor() as executor:
+            for chunk in batched(rows, self.chunk_size):
+                self.import_chunk(chunk, executor, result)
+                if self.progress:
+                    self.progress(result)
+        result.finish()
+        return result
+
+    def _executor(self):
+        if self.workers > 1:
+            return ProcessPoolExecutor(self.workers, initializer=_setup_worker)
+        return contextlib.nullcontext()
+
+    def hash_passwords(self, executor, passwords):
+        if executor is None:
+            return [hash_password(password) for password in passwords]
+        chunksize = max(1, len(passwords) // (self.workers * 4))
+        return list(executor.map(hash_password, passwords, chunksize=chunksize))
+
+    def import_chunk(self, chunk, executor, result):
+        pending = []
+        for line, row in chunk:
+            try:
+                user, grants = self.build_user(row)
+            except ValidationError as exc:
+                result.add_error(line, row.get("email_address"), exc.messages)
+                continue
+            # email addresses are compared case-insensitively, like on login
+            email_lower = user.email_address.lower()
+            if email_lower in self.seen:
+                result.skipped += 1
+                continue
+            self.seen.add(email_lower)
+            pending.append((line, user, grants, row.get("password")))
+
+        existing = self._existing_email_addresses(user for _, user, _, _ in pending)
+        result.skipped += len(existing)
+        pending = [
+            entry for entry in pending if entry[1].email_address.lower() not in existing
+        ]
+        if not pending:
+            return
+
+        # only hash for rows that are going to be inserted
+        passwords = self.hash_passwords(executor, [entry[3] for entry in pending])
+        for (_, user, _, _), password in zip(pending, passwords):
+            user.password = password
+
+        try:
+            self.insert(pending)
+        except IntegrityError:
+            # an email address taken since the lookup above, e.g. by a signup
+            taken = self._existing_email_addresses(user for _, user, _, _ in pending)
+            result.skipped += len(taken)
+            pending = [
+                entry
+                for entry in pending
+                if entry[1].email_address.lower() not in taken
+            ]
+            try:
+                self.insert(pending)
+            except IntegrityError as exc:
+                for line, user, _, _ in pending:
+                    result.add_error(line, user.email_address, [str(exc)])
+                return
+        result.created += len(pending)
+
+    def insert(self, pending):
+        users = [user for _, user, _, _ in pending]
+        with transaction.atomic():
+            CustomUser.objects.bulk_create(users)
+            self.bulk_grant(users, [grants for _, _, grants, _ in pending])
+
+    @staticmethod
+    def _existing_email_addresses(users):
+        # CustomUserManager does not hide soft-deleted users
+        return {
+            email_address.lower()
+            for email_address in CustomUser.objects.with_email_lower()
+            .filter(
+                email_address_lower__in=[user.email_address.lower() for user in users]
+            )
+            .values_list("email_address", flat=True)
+        }
+
+    def build_user(self, row):
+        """
+        Unsaved user and its `{"roles": ids, "permissions": ids}` of a row.
+        """
+        email_address = CustomUserManager.normalize_email(
+            (row.get("email_address") or "").strip()
+        )
+        validate_email(email_address)
+
+        user_type = (row.get("user_type") or "").strip().upper()
+        user_type = user_type or UserTypeEnum.STUDENT
+        if user_type not in UserTypeEnum.values:
+            raise ValidationError(f"Unknown user type '{user_type}'.")
+
+        names = {name: (row.get(name) or "").strip() for name in self.NAME_FIELDS}
+        grants = {
+            "roles": self._lookup(row.get("roles"), self.role_ids, "role"),
+            "permissions": self._lookup(
+                row.get("permissions"), self.permission_ids, "permission"
+            ),
+        }
+        user = CustomUser(
+            email_address=email_address,
+            user_type=user_type,
+            # what CustomUser.save() would set
+            full_name=" ".join(name for name in names.values() if name),
+            **names,
+        )
+        return user, grants
+
+    def _lookup(self, value, ids, label):
+        names = [
+            name.strip()
+            for name in (value or "").split(self.MULTI_VALUE_SEPARATOR)
+            if name.strip()
+        ]
+        unknown = [name for name in names if name not in ids]
+        if unknown:
+            raise ValidationError(f"Unknown {label}(s): {', '.join(unknown)}.")
+        return [ids[name] for name in names]
+
+    def bulk_grant(self, users, grants):
+        if any(user.pk is None for user in users):
+            # backends that cannot return ids from a bulk insert
+            ids = dict(
+                CustomUser.objects.filter(
+                    email_address__in=[user.email_address for user in users]
+                ).values_list("email_address", "id")
+            )
+            for user in users:
+                user.pk = ids[user.email_address]
+
+        for field_name in ("roles", "permissions"):
+            field = CustomUser._meta.get_field(field_name)
+            through = field.remote_field.through
+            user_column = f"{field.m2m_field_name()}_id"
+            target_column = f"{field.m2m_reverse_field_name()}_id"
+            through.objects.bulk_create(
+                through(**{user_column: user.pk, target_column: target_id})
+                for user, user_grants in zip(users, grants)
+                for target_id in user_grants[field_name]
+            )
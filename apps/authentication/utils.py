@@ -1,6 +1,13 @@
+import time
+
+from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
 
-from apps.authentication.models.perms import CustomPermission
+from apps.authentication.models.custom_users import CustomUser
+from apps.authentication.models.perms import CustomPermission, Roles
+from base.cache import get_or_set
 
 
 class PermissionLists:
@@ -27,6 +34,7 @@ class PermissionLists:
     ROLES = "roles"
     ROLE_NAME = "SUPPORT"
     USER_PERMISSION_CACHE_KEY = "user_permissions_cache"
+    PERMISSION_BITS_CACHE_KEY = "permission_bits_cache"
 
     # --------------------------------------------------------API LOGS--------------------------
     # API_LOGS = "api_logs"
@@ -47,3 +55,136 @@ class HttpBasedPermissionActionMaps:
     CAN_VIEW = "can_view"
     CAN_UPDATE = "can_update"
     CAN_DELETE = "can_delete"
+
+
+def get_permission_bits():
+    """
+    `{code_name: bit}` of every permission, where bit is `1 << bit_index`.
+    Cached until a permission is created or changed.
+    """
+    return get_or_set(
+        PermissionLists.PERMISSION_BITS_CACHE_KEY,
+        lambda: {
+            code_name: 1 << bit_index
+            for code_name, bit_index in CustomPermission.objects.filter(
+                bit_index__isnull=False
+            ).values_list("code_name", "bit_index")
+        },
+        ttl=None,
+    )
+
+
+def invalidate_permission_bits():
+    cache.delete(PermissionLists.PERMISSION_BITS_CACHE_KEY)
+    # again once committed, in case a concurrent reader cached the
+    # pre-commit permissions in between
+    transaction.on_commit(
+        lambda: cache.delete(PermissionLists.PERMISSION_BITS_CACHE_KEY)
+    )
+
+
+def get_permission_mask(code_names):
+    """
+    Bitmask of the given code names; unknown code names contribute nothing.
+    """
+    permission_bits = get_permission_bits()
+    mask = 0
+    for code_name in code_names:
+        mask |= permission_bits.get(code_name, 0)
+    return mask
+
+
+def get_permissions_from_mask(mask):
+    return frozenset(
+        code_name for code_name, bit in get_permission_bits().items() if mask & bit
+    )
+
+
+def get_effective_permission_mask(user_id):
+    """
+    Bitmask of the permissions granted to a user directly or through any of
+    their active roles, resolved in a single query.
+    """
+    direct_permission_ids = CustomUser.permissions.through.objects.filter(
+        customuser_id=user_id
+    ).values("custompermission_id")
+    role_permission_ids = Roles.permissions.through.objects.filter(
+        roles__customuser=user_id,
+        roles__is_active=True,
+        roles__deleted_at__isnull=True,
+    ).values("custompermission_id")
+    mask = 0
+    for bit_index in CustomPermission.objects.filter(
+        Q(id__in=direct_permission_ids) | Q(id__in=role_permission_ids),
+        bit_index__isnull=False,
+    ).values_list("bit_index", flat=True):
+        mask |= 1 << bit_index
+    return mask
+
+
+def get_user_permissions_cache_key(user_id):
+    return f"{PermissionLists.USER_PERMISSION_CACHE_KEY}:{user_id}"
+
+
+def get_user_permission_mask(user_id):
+    """
+    Cached `get_effective_permission_mask`, invalidated by the signals in
+    `apps.authentication.signals`.
+    """
+    return get_or_set(
+        get_user_permissions_cache_key(user_id),
+        lambda: get_effective_permission_mask(user_id),
+        ttl=settings.USER_PERMISSION_CACHE_TIMEOUT,
+    )
+
+
+def get_user_permissions(user_id):
+    """
+    Code names of `get_user_permission_mask`.
+    """
+    return get_permissions_from_mask(get_user_permission_mask(user_id))
+
+
+def get_permissions_version_cache_key(user_id):
+    return f"{PermissionLists.USER_PERMISSION_CACHE_KEY}:{user_id}:version"
+
+
+def get_permissions_version(user_id):
+    """
+    Cached `CustomUser.permissions_version`, compared against the version
+    claim of permission-carrying access tokens.
+    """
+    return get_or_set(
+        get_permissions_version_cache_key(user_id),
+        lambda: _load_permissions_version(user_id),
+        ttl=settings.USER_PERMISSION_CACHE_TIMEOUT,
+    )
+
+
+def _load_permissions_version(user_id):
+    return (
+        CustomUser.objects.filter(pk=user_id)
+        .values_list("permissions_version", flat=True)
+        .first()
+    )
+
+
+def invalidate_user_permissions(user_ids, user=None):
+    """
+    Outdate the cached permissions and issued tokens of `user_ids`. `user`,
+    an in-memory instance of one of them, gets the new version as well, so
+    tokens issued from it carry the current one.
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    # a fresh token (never a reused counter), so no later version can match
+    # the claim of a revoked token; CustomUser.save() never writes it back
+    version = time.time_ns()
+    CustomUser.objects.filter(pk__in=user_ids).update(permissions_version=version)
+    if user is not None:
+        user.permissions_version = version
+    cache.delete_many(
+        [get_user_permissions_cache_key(user_id) for user_id in user_ids]
+        + [get_permissions_version_cache_key(user_id) for user_id in user_ids]
+    )
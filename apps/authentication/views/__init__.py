@@ -4,6 +4,7 @@ from .custom_users import (
     LogoutView,
     RefreshTokenView,
     UserCreateView,
+    UserImportView,
     UserListView,
     UserRetrieveView,
     UserUpdateView,
@@ -25,6 +26,7 @@ __all__ = [
     "LogoutView",
     "RefreshTokenView",
     "UserCreateView",
+    "UserImportView",
     "UserUpdateView",
     "UserRetrieveView",
     "UserListView",
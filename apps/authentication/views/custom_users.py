@@ -3,18 +3,22 @@ from django.db.models import Q
 from rest_framework import generics, status
 from rest_framework.exceptions import NotFound
 from rest_framework.generics import GenericAPIView
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenRefreshView
 
 from apps.authentication.models.custom_users import CustomUser
 from base.views.generic_views import (
+    CustomErrorMessage,
     CustomGenericCreateView,
     CustomGenericListView,
     CustomGenericRetrieveView,
     CustomGenericUpdateView,
 )
+from base.views.views import AsyncAPIView, CustomAPIResponse
 
+from ..perms.custom_perms import IsAdmin
 from ..serializers import (
     ChangePasswordSerializer,
     CustomUserCreateSerializer,
@@ -22,6 +26,8 @@ from ..serializers import (
     CustomUserUpdateSerializer,
     LoginSerializer,
     LogoutSerializer,
+    UserClaimsTokenRefreshSerializer,
+    UserImportSerializer,
     UserListSerializer,
 )
 
@@ -43,11 +49,16 @@ class LogoutView(GenericAPIView):
         )
 
 
-class LoginView(GenericAPIView):
+class LoginView(AsyncAPIView, GenericAPIView):
+    """
+    Async, so the password check runs on the hashing pool instead of holding
+    the thread shared by sync views, see apps.authentication.hashing.
+    """
+
     permission_classes = []
     serializer_class = LoginSerializer
 
-    def post(self, request):
+    async def post(self, request):
         serializer = self.serializer_class(
             data=request.data, context={"request": request}
         )
@@ -58,7 +69,7 @@ class LoginView(GenericAPIView):
         meta_data = {
             "timestamp": now,
         }
-        if serializer.is_valid():
+        if await serializer.ais_valid():
             return Response(
                 {
                     "success": True,
@@ -81,6 +92,7 @@ class LoginView(GenericAPIView):
 
 class RefreshTokenView(TokenRefreshView):
     permission_classes = []
+    serializer_class = UserClaimsTokenRefreshSerializer
 
 
 class UserCreateView(CustomGenericCreateView):
@@ -88,6 +100,38 @@ class UserCreateView(CustomGenericCreateView):
     queryset = User.objects.all()
 
 
+class UserImportView(CustomGenericCreateView):
+    """
+    Bulk import users from an uploaded CSV file (admins only), see
+    `apps.authentication.user_import.UserImporter`.
+    """
+
+    serializer_class = UserImportSerializer
+    parser_classes = [MultiPartParser]
+    permission_classes = [IsAdmin]
+    success_response_message = "Users imported."
+    success_status_code = status.HTTP_200_OK
+
+    def create(self, request, *args, **kwargs):
+        # not atomic: each chunk commits on its own, rather than as a
+        # savepoint of one transaction that a failure rolls back whole
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            errors = serializer.errors
+            message = self._get_message(data=errors)
+            if message:
+                return CustomAPIResponse.custom_error_response(
+                    errors=errors, message=message
+                )
+            return CustomAPIResponse.custom_error_response(errors=errors)
+        self.perform_create(serializer)
+        return CustomAPIResponse.custom_success_response(
+            data=serializer.data,
+            message=self.success_response_message,
+            status_code=self.success_status_code,
+        )
+
+
 class UserUpdateView(CustomGenericUpdateView):
     serializer_class = CustomUserUpdateSerializer
     queryset = User.objects.all()
@@ -105,7 +149,13 @@ class UserListView(CustomGenericListView):
     serializer_class = UserListSerializer
 
 
-class ChangeUserPasswordView(CustomGenericUpdateView):
+class ChangeUserPasswordView(AsyncAPIView, GenericAPIView, CustomErrorMessage):
+    """
+    Async view, checking the old and hashing the new password off the
+    event loop.
+    """
+
+    http_method_names = ["patch"]  # only allows PATCH
     serializer_class = ChangePasswordSerializer
     success_response_message = "Password changed successfully."
     queryset = User.objects.all()
@@ -114,7 +164,22 @@ class ChangeUserPasswordView(CustomGenericUpdateView):
         IsAuthenticated,
     ]
 
-    def get_object(self):
-        user = self.request.user
+    async def patch(self, request, *args, **kwargs):
+        user = await User.objects.aget(pk=request.user.pk)
         self.kwargs["user"] = user
-        return user
+        serializer = self.get_serializer(user, data=request.data)
+        if not await serializer.ais_valid():
+            errors = serializer.errors
+            message = self._get_message(data=errors)
+            if message:
+                return CustomAPIResponse.custom_error_response(
+                    errors=errors, message=message
+                )
+            return CustomAPIResponse.custom_error_response(
+                errors=errors,
+            )
+
+        await serializer.asave()
+        return CustomAPIResponse.custom_success_response(
+            data=serializer.data, message=self.success_response_message
+        )
@@ -7,6 +7,7 @@ from base.views.generic_views import (
     CustomGenericUpdateView,
 )
 
+from ..authentication import STATELESS_AUTHENTICATION_CLASSES
 from ..filters.roles import RolesFilter
 from ..perms.custom_perms import (
     CustomAuthenticationPermission,
@@ -25,6 +26,7 @@ from ..serializers import (
 
 
 class PermissionsListView(CustomGenericListView):
+    authentication_classes = STATELESS_AUTHENTICATION_CLASSES
     queryset = CustomPermission.objects.all()
     serializer_class = PermissionSerializer
     filterset_fields = ["category"]
@@ -41,6 +43,7 @@ class PermissionsListView(CustomGenericListView):
 
 
 class PermissionsListDropdownView(CustomGenericListView):
+    authentication_classes = STATELESS_AUTHENTICATION_CLASSES
     queryset = CustomPermission.objects.all()
     serializer_class = PermissionDropdownSerializer
     filterset_fields = ["category"]
@@ -50,6 +53,7 @@ class PermissionsListDropdownView(CustomGenericListView):
 
 
 class PermissionsCategoryListView(CustomGenericListView):
+    authentication_classes = STATELESS_AUTHENTICATION_CLASSES
     queryset = PermissionCategory.objects.all()
     serializer_class = PermissionCategorySerializer
     success_response_message = "Permisssion Category fetched successfully."
@@ -65,6 +69,7 @@ class PermissionsCategoryListView(CustomGenericListView):
 
 
 class RolesListView(CustomGenericListView):
+    authentication_classes = STATELESS_AUTHENTICATION_CLASSES
     queryset = Roles.objects.all().prefetch_related("permissions")
     serializer_class = RolesListSerializer
     success_response_message = "Roles fetched successfully."
@@ -82,6 +87,7 @@ class RolesListView(CustomGenericListView):
 
 
 class RolesListDropdownView(CustomGenericListView):
+    authentication_classes = STATELESS_AUTHENTICATION_CLASSES
     queryset = Roles.objects.all()
     serializer_class = RolesListSerializerDropdown
 
@@ -90,6 +96,7 @@ class RolesListDropdownView(CustomGenericListView):
 
 
 class RolesRetrieveView(CustomGenericRetrieveView):
+    authentication_classes = STATELESS_AUTHENTICATION_CLASSES
     queryset = Roles.objects.all().prefetch_related("permissions")
     serializer_class = RolesRetrieveSerializer
     success_response_message = "Role retrieved successfully."
@@ -105,6 +112,7 @@ class RolesRetrieveView(CustomGenericRetrieveView):
 
 
 class RolesCreateView(CustomGenericCreateView):
+    authentication_classes = STATELESS_AUTHENTICATION_CLASSES
     queryset = Roles.objects.all()
     serializer_class = RolesCreateSerializer
     success_response_message = "Role created successfully."
@@ -120,6 +128,7 @@ class RolesCreateView(CustomGenericCreateView):
 
 
 class RolesUpdateView(CustomGenericUpdateView):
+    authentication_classes = STATELESS_AUTHENTICATION_CLASSES
     queryset = Roles.objects.all()
     serializer_class = RolesUpdateSerializer
     success_response_message = "Role updated successfully."
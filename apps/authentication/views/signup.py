@@ -1,17 +1,23 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
 
+from base.views.views import AsyncAPIView
+
 from ..serializers import CustomUserSignUpSerializer
 
 
-class CustomUserSignUpAPIView(generics.CreateAPIView):
+class CustomUserSignUpAPIView(AsyncAPIView, generics.CreateAPIView):
+    """
+    Async view, the new password is hashed with `amake_password`.
+    """
+
     serializer_class = CustomUserSignUpSerializer
     permission_classes = []
 
-    def post(self, request):
+    async def post(self, request):
         serializer = CustomUserSignUpSerializer(data=request.data)
-        if serializer.is_valid():
-            user = serializer.save()
+        if await serializer.ais_valid():
+            user = await serializer.asave()
             # if 'role' not in request.data:
             #     default_role = Role.objects.get(name='Staff')
             #     user.role = default_role
@@ -0,0 +1,144 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from base.db import primary
+
+LESSON_INDEX_VERSION_KEY = "course:{course_id}:lesson_index:version"
+LESSON_INDEX_KEY = "course:{course_id}:lesson_index"
+
+
+class LessonIndexStats:
+    """
+    Process-wide hit/miss counters for the lesson index cache tiers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counters = {
+                "local_hits": 0,
+                "shared_hits": 0,
+                "misses": 0,
+                "invalidations": 0,
+            }
+
+    def incr(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def as_dict(self):
+        with self._lock:
+            return dict(self.counters, local_size=len(_local_cache))
+
+
+class LocalLRUCache:
+    """
+    Small in-process LRU tier in front of the shared cache.
+    Entries are keyed by (course_id, version), so a version bump in the
+    shared cache makes stale local entries unreachable.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard_course(self, course_id):
+        with self._lock:
+            for key in [key for key in self._data if key[0] == course_id]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_local_cache = LocalLRUCache(maxsize=settings.LESSON_INDEX_LOCAL_CACHE_SIZE)
+stats = LessonIndexStats()
+
+
+def _current_version(course_id):
+    version_key = LESSON_INDEX_VERSION_KEY.format(course_id=course_id)
+    version = cache.get(version_key)
+    if version is None:
+        # a fresh token (never a reused counter) so an evicted version key can
+        # not resurrect index entries cached under an older version
+        cache.add(version_key, time.time_ns(), timeout=None)
+        version = cache.get(version_key)
+    return version
+
+
+def _build_lesson_index(course_id):
+    from .models import Lesson
+
+    # a new version follows a lesson write the replicas may not have yet
+    with primary():
+        return tuple(
+            Lesson.objects.filter(course_id=course_id)
+            .order_by("order")
+            .values_list("id", "order", "title")
+        )
+
+
+def get_lesson_index(course_id):
+    """
+    Return the ordered lesson index of a course as a tuple of
+    `(lesson_id, order, title)` rows, excluding soft-deleted lessons.
+    """
+    version = _current_version(course_id)
+
+    index = _local_cache.get((course_id, version))
+    if index is not None:
+        stats.incr("local_hits")
+        return index
+
+    key = LESSON_INDEX_KEY.format(course_id=course_id)
+    index = cache.get(key, version=version)
+    if index is not None:
+        stats.incr("shared_hits")
+    else:
+        stats.incr("misses")
+        index = _build_lesson_index(course_id)
+        cache.set(
+            key,
+            index,
+            timeout=settings.LESSON_INDEX_CACHE_TIMEOUT,
+            version=version,
+        )
+
+    _local_cache.set((course_id, version), index)
+    return index
+
+
+def invalidate_lesson_index(course_id):
+    cache.set(
+        LESSON_INDEX_VERSION_KEY.format(course_id=course_id),
+        time.time_ns(),
+        timeout=None,
+    )
+    _local_cache.discard_course(course_id)
+    stats.incr("invalidations")
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.course.models import Course
+from apps.course.models.course import make_short_description
+
+
+class Command(BaseCommand):
+    help = "Backfill the stored catalogue excerpts of course descriptions."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of courses read and updated per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        # soft-deleted courses too, so a restored course has its excerpt
+        courses = Course.all_objects.order_by("id").only(
+            "id", "description", "short_description"
+        )
+        batch_size = options["batch_size"]
+        self.stdout.write(self.style.WARNING("Backfilling course short descriptions"))
+
+        total_updated = 0
+        last_id = 0
+        while True:
+            # walk the table by primary key so each UPDATE stays short
+            batch = list(courses.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+
+            changed = []
+            for course in batch:
+                short_description = make_short_description(course.description)
+                if course.short_description != short_description:
+                    course.short_description = short_description
+                    changed.append(course)
+            with transaction.atomic():
+                Course.all_objects.bulk_update(changed, ["short_description"])
+            total_updated += len(changed)
+            last_id = batch[-1].id
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Total '{total_updated}' Course Short Descriptions Updated"
+            )
+        )
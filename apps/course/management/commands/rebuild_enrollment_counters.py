@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.course.models import Enrollment
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized lesson counters stored on enrollments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--course",
+            type=int,
+            help="Only rebuild enrollments of this course id.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of enrollments updated per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        enrollments = Enrollment.objects.order_by("id")
+        if options["course"]:
+            enrollments = enrollments.filter(course_id=options["course"])
+
+        batch_size = options["batch_size"]
+        self.stdout.write(self.style.WARNING("Rebuilding enrollment counters"))
+
+        total_updated = 0
+        last_id = 0
+        while True:
+            # walk the table by primary key so each UPDATE stays short
+            ids = list(
+                enrollments.filter(id__gt=last_id).values_list("id", flat=True)[
+                    :batch_size
+                ]
+            )
+            if not ids:
+                break
+
+            with transaction.atomic():
+                total_updated += Enrollment.objects.filter(
+                    id__in=ids
+                ).rebuild_progress_counters()
+            last_id = ids[-1]
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Total '{total_updated}' Enrollments Rebuilt")
+        )
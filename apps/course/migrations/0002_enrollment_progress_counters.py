@@ -0,0 +1,59 @@
+# Generated by Django 6.1.2 on 2026-10-18 18:11
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_progress_counters(apps, schema_editor):
+    Enrollment = apps.get_model("course", "Enrollment")
+    Lesson = apps.get_model("course", "Lesson")
+    Progress = apps.get_model("course", "Progress")
+
+    lesson_counts = (
+        Lesson.objects.filter(course_id=OuterRef("course_id"), deleted_at__isnull=True)
+        .order_by()
+        .values("course_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    completion_counts = (
+        Progress.objects.filter(enrollment_id=OuterRef("id"), deleted_at__isnull=True)
+        .order_by()
+        .values("enrollment_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Enrollment.objects.update(
+        total_lessons=Coalesce(Subquery(lesson_counts), 0),
+        completed_lessons_count=Coalesce(Subquery(completion_counts), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("course", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enrollment",
+            name="completed_lessons_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Denormalized number of lessons completed in this enrollment.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="enrollment",
+            name="total_lessons",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Denormalized number of lessons in the course.",
+            ),
+        ),
+        migrations.RunPython(backfill_progress_counters, migrations.RunPython.noop),
+    ]
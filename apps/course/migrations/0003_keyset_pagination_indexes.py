@@ -0,0 +1,31 @@
+# Generated by Django 6.1.2 on 2026-10-18 18:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("course", "0002_enrollment_progress_counters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="enrollment",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["student", "-created_at", "-id"],
+                name="enrollment_student_keyset_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="progress",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["enrollment", "-created_at", "-id"],
+                name="completion_keyset_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.1.2 on 2026-10-18 18:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("course", "0003_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="short_description",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Excerpt of the description shown in the catalogue.",
+                max_length=255,
+            ),
+        ),
+    ]
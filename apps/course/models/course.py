@@ -1,6 +1,22 @@
 from django.db import models
+from django.db.models import F, OuterRef
+from django.utils.text import Truncator
 
-from base.models import AbstractBaseModel
+from base.models import (
+    AbstractBaseModel,
+    SoftDeleteManager,
+    SoftDeleteQuerySet,
+    count_subquery,
+)
+
+SHORT_DESCRIPTION_LENGTH = 255
+
+
+def make_short_description(description):
+    """
+    Catalogue excerpt of a course description, whitespace collapsed.
+    """
+    return Truncator(" ".join(description.split())).chars(SHORT_DESCRIPTION_LENGTH)
 
 
 class CourseStatusEnum(models.TextChoices):
@@ -8,9 +24,31 @@ class CourseStatusEnum(models.TextChoices):
     PUBLISHED = "PUBLISHED", "Published"
 
 
+class CourseQuerySet(SoftDeleteQuerySet):
+    def with_catalogue_fields(self):
+        """
+        Annotate the lesson count and instructor name read by the course
+        serializers, so a catalogue page is fetched in a single query.
+        """
+        from .lesson import Lesson
+
+        return self.annotate(
+            lesson_count=count_subquery(
+                Lesson.objects.filter(course_id=OuterRef("id")), "course_id"
+            ),
+            instructor_name=F("instructor__full_name"),
+        )
+
+
 class Course(AbstractBaseModel):
     title = models.CharField(max_length=255, help_text="Title of the course.")
     description = models.TextField(blank=True, help_text="Description of the course.")
+    short_description = models.CharField(
+        max_length=SHORT_DESCRIPTION_LENGTH,
+        blank=True,
+        editable=False,
+        help_text="Excerpt of the description shown in the catalogue.",
+    )
     status = models.CharField(
         max_length=20,
         choices=CourseStatusEnum.choices,
@@ -24,6 +62,8 @@ class Course(AbstractBaseModel):
         help_text="Instructor who created the course.",
     )
 
+    objects = SoftDeleteManager.from_queryset(CourseQuerySet)()
+
     class Meta:
         db_table = "courses"
         ordering = ["-created_at"]
@@ -31,10 +71,21 @@ class Course(AbstractBaseModel):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # a deferred description has not changed, keep the stored excerpt
+        if "description" not in self.get_deferred_fields():
+            self.short_description = make_short_description(self.description)
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "description" in update_fields:
+                kwargs["update_fields"] = {*update_fields, "short_description"}
+        super().save(*args, **kwargs)
+
     @property
     def is_published(self):
         return self.status == CourseStatusEnum.PUBLISHED
 
     @property
     def total_lessons(self):
+        if "lesson_count" in self.__dict__:
+            return self.lesson_count
         return self.lessons.count()
@@ -1,6 +1,64 @@
+from django.contrib.postgres.expressions import ArraySubquery
 from django.db import models
+from django.db.models import F, OuterRef, Q
 
-from base.models import AbstractBaseModel
+from base.models import (
+    AbstractBaseModel,
+    SoftDeleteManager,
+    SoftDeleteQuerySet,
+    count_subquery,
+)
+
+from .lesson import Lesson
+from .progress import Progress
+
+
+class EnrollmentQuerySet(SoftDeleteQuerySet):
+    def with_progress(self):
+        """
+        Annotate everything the enrollment list/detail serializers read, so a
+        page of enrollments is fetched in a single query.
+        Lesson counters are already stored on the row.
+        """
+        return self.annotate(
+            course_title=F("course__title"),
+            student_name=F("student__full_name"),
+        )
+
+    def with_completed_lesson_ids(self):
+        # newest first, like Progress' default ordering the serializer's
+        # fallback reads with
+        return self.annotate(
+            completed_lesson_ids=ArraySubquery(
+                Progress.objects.filter(enrollment_id=OuterRef("id"))
+                .order_by("-created_at")
+                .values("lesson_id")
+            )
+        )
+
+    def sync_total_lessons(self):
+        """
+        Recompute the denormalized `total_lessons` counter in one UPDATE.
+        Called whenever lessons of a course are added, soft-deleted or restored.
+        """
+        return self.update(
+            total_lessons=count_subquery(
+                Lesson.objects.filter(course_id=OuterRef("course_id")), "course_id"
+            )
+        )
+
+    def rebuild_progress_counters(self):
+        """
+        Recompute both denormalized counters from scratch to correct any drift.
+        """
+        return self.update(
+            total_lessons=count_subquery(
+                Lesson.objects.filter(course_id=OuterRef("course_id")), "course_id"
+            ),
+            completed_lessons_count=count_subquery(
+                Progress.objects.filter(enrollment_id=OuterRef("id")), "enrollment_id"
+            ),
+        )
 
 
 class Enrollment(AbstractBaseModel):
@@ -22,22 +80,39 @@ class Enrollment(AbstractBaseModel):
     completed_at = models.DateTimeField(
         null=True, blank=True, help_text="Timestamp when the course was completed."
     )
+    total_lessons = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Denormalized number of lessons in the course.",
+    )
+    completed_lessons_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Denormalized number of lessons completed in this enrollment.",
+    )
+
+    objects = SoftDeleteManager.from_queryset(EnrollmentQuerySet)()
 
     class Meta:
         db_table = "enrollments"
         unique_together = ["student", "course"]
         ordering = ["-created_at"]
+        indexes = [
+            # keyset pagination of a student's enrollments
+            models.Index(
+                fields=["student", "-created_at", "-id"],
+                condition=Q(deleted_at__isnull=True),
+                name="enrollment_student_keyset_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.student.full_name} - {self.course.title}"
 
-    @property
-    def total_lessons(self):
-        return self.course.total_lessons
-
-    @property
-    def completed_lessons_count(self):
-        return self.completed_lessons.count()
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            self.total_lessons = Lesson.objects.filter(course_id=self.course_id).count()
+        super().save(*args, **kwargs)
 
     @property
     def completion_percentage(self):
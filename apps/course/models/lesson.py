@@ -1,7 +1,10 @@
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 
 from base.models import AbstractBaseModel
 
+from ..lesson_index import invalidate_lesson_index
+
 
 class Lesson(AbstractBaseModel):
     course = models.ForeignKey(
@@ -25,3 +28,48 @@ class Lesson(AbstractBaseModel):
 
     def __str__(self):
         return f"{self.course.title} - {self.title}"
+
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            self._sync_enrollment_counters()
+        self._invalidate_lesson_index()
+
+    @transaction.atomic
+    def delete(self, using=None, keep_parents=False, hard=False):
+        result = super().delete(using, keep_parents, hard)
+        # a hard delete also cascades the lesson's Progress rows
+        self._sync_enrollment_counters(completions_removed=hard)
+        self._invalidate_lesson_index()
+        if hard:
+            # no lesson row is left to move the course's Last-Modified forward
+            self._touch_course()
+        return result
+
+    @transaction.atomic
+    def restore(self):
+        super().restore()
+        self._sync_enrollment_counters()
+
+    def _sync_enrollment_counters(self, completions_removed=False):
+        from .enrollment import Enrollment
+
+        enrollments = Enrollment.objects.filter(course_id=self.course_id)
+        if completions_removed:
+            enrollments.rebuild_progress_counters()
+        else:
+            enrollments.sync_total_lessons()
+
+    def _touch_course(self):
+        from .course import Course
+
+        Course.all_objects.filter(pk=self.course_id).update(updated_at=timezone.now())
+
+    def _invalidate_lesson_index(self):
+        course_id = self.course_id
+        invalidate_lesson_index(course_id)
+        # bump again once committed, in case a concurrent reader cached the
+        # pre-commit ordering in between
+        transaction.on_commit(lambda: invalidate_lesson_index(course_id))
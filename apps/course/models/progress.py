@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Q
 
 from base.models import AbstractBaseModel
 
@@ -21,6 +22,43 @@ class Progress(AbstractBaseModel):
         db_table = "lesson_completions"
         unique_together = ["enrollment", "lesson"]
         ordering = ["-created_at"]
+        indexes = [
+            # keyset pagination of an enrollment's completions
+            models.Index(
+                fields=["enrollment", "-created_at", "-id"],
+                condition=Q(deleted_at__isnull=True),
+                name="completion_keyset_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.enrollment.student.full_name} - {self.lesson.title}"
+
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            self._bump_enrollment_counter(1)
+
+    @transaction.atomic
+    def delete(self, using=None, keep_parents=False, hard=False):
+        was_live = self.deleted_at is None
+        result = super().delete(using, keep_parents, hard)
+        if was_live:
+            self._bump_enrollment_counter(-1)
+        return result
+
+    @transaction.atomic
+    def restore(self):
+        was_live = self.deleted_at is None
+        super().restore()
+        if not was_live:
+            self._bump_enrollment_counter(1)
+
+    def _bump_enrollment_counter(self, delta):
+        from .enrollment import Enrollment
+
+        Enrollment.objects.filter(id=self.enrollment_id).update(
+            completed_lessons_count=F("completed_lessons_count") + delta
+        )
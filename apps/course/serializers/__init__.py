@@ -5,6 +5,7 @@ from .course import (
     CourseUpdateSerializer,
 )
 from .enrollment import (
+    EnrollmentBulkCreateSerializer,
     EnrollmentCreateSerializer,
     EnrollmentDetailSerializer,
     EnrollmentListSerializer,
@@ -16,6 +17,7 @@ from .lesson import (
     LessonUpdateSerializer,
 )
 from .progress import (
+    LessonCompletionBatchSerializer,
     LessonCompletionCreateSerializer,
     LessonCompletionListSerializer,
 )
@@ -31,7 +33,9 @@ __all__ = [
     "LessonDetailSerializer",
     "EnrollmentListSerializer",
     "EnrollmentCreateSerializer",
+    "EnrollmentBulkCreateSerializer",
     "EnrollmentDetailSerializer",
+    "LessonCompletionBatchSerializer",
     "LessonCompletionCreateSerializer",
     "LessonCompletionListSerializer",
 ]
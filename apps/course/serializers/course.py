@@ -1,15 +1,13 @@
 from rest_framework import serializers
 
-from base.serializers import BaseModelSerializer, ExcludeFields
+from base.serializers import AnnotatedCharField, BaseModelSerializer, ExcludeFields
 
 from ..models import Course, CourseStatusEnum
 from .lesson import LessonListSerializer
 
 
 class CourseListSerializer(BaseModelSerializer):
-    instructor_name = serializers.CharField(
-        source="instructor.full_name", read_only=True
-    )
+    instructor_name = AnnotatedCharField(source="instructor.full_name", read_only=True)
     total_lessons = serializers.IntegerField(read_only=True)
 
     class Meta:
@@ -25,7 +23,8 @@ class CourseListSerializer(BaseModelSerializer):
         #     "created_at",
         #     "updated_at",
         # ]
-        exclude = ExcludeFields.exclude
+        # the catalogue shows the stored excerpt, the full text is in the detail
+        exclude = [*ExcludeFields.exclude, "description"]
 
 
 class CourseCreateSerializer(BaseModelSerializer):
@@ -56,9 +55,7 @@ class CourseUpdateSerializer(BaseModelSerializer):
 
 
 class CourseDetailSerializer(BaseModelSerializer):
-    instructor_name = serializers.CharField(
-        source="instructor.full_name", read_only=True
-    )
+    instructor_name = AnnotatedCharField(source="instructor.full_name", read_only=True)
     total_lessons = serializers.IntegerField(read_only=True)
     lessons = serializers.SerializerMethodField()
 
@@ -78,5 +75,6 @@ class CourseDetailSerializer(BaseModelSerializer):
         ]
 
     def get_lessons(self, obj):
-        lessons = obj.lessons.all().order_by("order")
+        # Lesson orders by "order"; all() keeps a prefetch of the lessons usable
+        lessons = obj.lessons.all()
         return LessonListSerializer(lessons, many=True).data
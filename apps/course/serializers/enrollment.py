@@ -1,14 +1,18 @@
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
 from django.utils import timezone
 from rest_framework import serializers
 
-from base.serializers import BaseModelSerializer
+from apps.authentication.models import CustomUser, UserTypeEnum
+from base.serializers import AnnotatedCharField, BaseModelSerializer
 
-from ..models import CourseStatusEnum, Enrollment
+from ..models import Course, CourseStatusEnum, Enrollment, Lesson
 
 
 class EnrollmentListSerializer(BaseModelSerializer):
-    course_title = serializers.CharField(source="course.title", read_only=True)
-    student_name = serializers.CharField(source="student.full_name", read_only=True)
+    course_title = AnnotatedCharField(source="course.title", read_only=True)
+    student_name = AnnotatedCharField(source="student.full_name", read_only=True)
     total_lessons = serializers.IntegerField(read_only=True)
     completed_lessons_count = serializers.IntegerField(read_only=True)
     completion_percentage = serializers.FloatField(read_only=True)
@@ -65,9 +69,133 @@ class EnrollmentCreateSerializer(BaseModelSerializer):
         return super().create(validated_data)
 
 
+class EnrollmentBulkCreateSerializer(serializers.Serializer):
+    """
+    Enroll a cohort of students, given by id or email address, in a course.
+    Students are resolved in one query and enrolled with chunked
+    `bulk_create(ignore_conflicts=True)` in one transaction, so the number
+    of queries does not grow with the cohort.
+    """
+
+    course = serializers.PrimaryKeyRelatedField(queryset=Course.objects.all())
+    students = serializers.ListField(
+        child=serializers.CharField(),
+        allow_empty=False,
+        max_length=settings.BULK_ENROLLMENT_MAX_STUDENTS,
+        write_only=True,
+    )
+    created = serializers.IntegerField(read_only=True)
+    skipped = serializers.IntegerField(read_only=True)
+    unresolved = serializers.ListField(child=serializers.CharField(), read_only=True)
+
+    def validate_course(self, course):
+        user = self.context["request"].user
+        if (
+            user.user_type == UserTypeEnum.INSTRUCTOR
+            and course.instructor_id != user.pk
+        ):
+            raise serializers.ValidationError(
+                "You can only enroll students in your own courses."
+            )
+        if course.status != CourseStatusEnum.PUBLISHED:
+            raise serializers.ValidationError(
+                "Students can only be enrolled in published courses."
+            )
+        return course
+
+    @staticmethod
+    def parse_student_id(entry):
+        """
+        The id `entry` names, `None` for anything that is not an id in the
+        range of the primary key (email addresses, "²", overflowing numbers).
+        """
+        try:
+            student_id = int(entry)
+        except ValueError:
+            return None
+        pk_type = CustomUser._meta.pk.get_internal_type()
+        _, max_id = connection.ops.integer_field_range(pk_type)
+        return student_id if 0 < student_id <= max_id else None
+
+    def resolve_students(self, entries):
+        """
+        Ids of the students matching the given ids / email addresses, and
+        the entries matching no student.
+        """
+        ids = {}
+        emails = set()
+        for entry in entries:
+            student_id = self.parse_student_id(entry)
+            if student_id is None:
+                # case-insensitive, like login
+                emails.add(entry.lower())
+            else:
+                ids[entry] = student_id
+        students = (
+            CustomUser.objects.with_email_lower()
+            .filter(
+                Q(id__in=ids.values()) | Q(email_address_lower__in=emails),
+                user_type=UserTypeEnum.STUDENT,
+            )
+            .values_list("id", "email_address")
+        )
+
+        student_ids = set()
+        matched_emails = set()
+        for student_id, email_address in students:
+            student_ids.add(student_id)
+            matched_emails.add(email_address.lower())
+        unresolved = [
+            entry
+            for entry in entries
+            if (
+                ids[entry] not in student_ids
+                if entry in ids
+                else entry.lower() not in matched_emails
+            )
+        ]
+        return student_ids, unresolved
+
+    @transaction.atomic
+    def create(self, validated_data):
+        course = validated_data["course"]
+        student_ids, unresolved = self.resolve_students(validated_data["students"])
+
+        # soft-deleted enrollments still hold the (student, course) pair
+        enrolled = set(
+            Enrollment.all_objects.filter(
+                course=course, student_id__in=student_ids
+            ).values_list("student_id", flat=True)
+        )
+        # bulk_create skips Enrollment.save(), count the lessons once instead
+        total_lessons = Lesson.objects.filter(course_id=course.id).count()
+        enrollments = [
+            Enrollment(
+                student_id=student_id, course=course, total_lessons=total_lessons
+            )
+            for student_id in sorted(student_ids - enrolled)
+        ]
+        # a pair enrolled concurrently is skipped by the unique constraint, so
+        # what was created is counted from the rows rather than the batch
+        Enrollment.objects.bulk_create(
+            enrollments,
+            batch_size=settings.BULK_ENROLLMENT_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        created = Enrollment.all_objects.filter(
+            course=course, student_id__in=student_ids
+        ).count() - len(enrolled)
+        return {
+            "course": course,
+            "created": created,
+            "skipped": len(student_ids) - created,
+            "unresolved": unresolved,
+        }
+
+
 class EnrollmentDetailSerializer(BaseModelSerializer):
-    course_title = serializers.CharField(source="course.title", read_only=True)
-    student_name = serializers.CharField(source="student.full_name", read_only=True)
+    course_title = AnnotatedCharField(source="course.title", read_only=True)
+    student_name = AnnotatedCharField(source="student.full_name", read_only=True)
     total_lessons = serializers.IntegerField(read_only=True)
     completed_lessons_count = serializers.IntegerField(read_only=True)
     completion_percentage = serializers.FloatField(read_only=True)
@@ -91,4 +219,6 @@ class EnrollmentDetailSerializer(BaseModelSerializer):
         ]
 
     def get_completed_lesson_ids(self, obj):
+        if "completed_lesson_ids" in obj.__dict__:
+            return obj.completed_lesson_ids
         return list(obj.completed_lessons.values_list("lesson_id", flat=True))
@@ -2,6 +2,7 @@ from django.db import IntegrityError, transaction
 from django.utils import timezone
 from rest_framework import serializers
 
+from ..lesson_index import get_lesson_index
 from ..models import Enrollment, Progress
 from ..tasks import handle_course_completion
 
@@ -24,7 +25,7 @@ class LessonCompletionCreateSerializer(serializers.ModelSerializer):
         lesson = data.get("lesson")
 
         # Check if the lesson belongs to the enrolled course
-        if lesson.course != enrollment.course:
+        if lesson.course_id != enrollment.course_id:
             raise serializers.ValidationError(
                 {"lesson": "This lesson does not belong to the enrolled course."}
             )
@@ -35,32 +36,27 @@ class LessonCompletionCreateSerializer(serializers.ModelSerializer):
                 {"lesson": "You have already completed this lesson."}
             )
 
-        # Check sequential order: ensure previous lessons are completed
-        # Get all lessons for this course ordered by their order field
-        all_lessons = list(
-            lesson.course.lessons.filter(deleted_at__isnull=True)
-            .order_by("order")
-            .values_list("id", "order")
-        )
-
-        # Find current lesson's position
-        current_lesson_index = next(
-            (i for i, (lid, _) in enumerate(all_lessons) if lid == lesson.id), None
-        )
-
-        if current_lesson_index is None:
+        if lesson.deleted_at is not None:
             raise serializers.ValidationError(
                 {"lesson": "This lesson does not exist in the course."}
             )
 
-        # Check if all previous lessons are completed
-        if current_lesson_index > 0:
-            previous_lesson_ids = [lid for lid, _ in all_lessons[:current_lesson_index]]
-            completed_lesson_ids = Progress.objects.filter(
+        # Check sequential order: every earlier lesson of the course must have a
+        # Progress row for this enrollment. The ordering comes from the cached
+        # lesson index, leaving a single COUNT query.
+        previous_lesson_ids = [
+            lesson_id
+            for lesson_id, order, _ in get_lesson_index(lesson.course_id)
+            if order < lesson.order
+        ]
+        if previous_lesson_ids:
+            completed_previous_lessons = Progress.objects.filter(
                 enrollment=enrollment, lesson_id__in=previous_lesson_ids
-            ).values_list("lesson_id", flat=True)
-
-            if len(completed_lesson_ids) < len(previous_lesson_ids):
+            )
+            if completed_previous_lessons.count() < len(previous_lesson_ids):
+                completed_lesson_ids = set(
+                    completed_previous_lessons.values_list("lesson_id", flat=True)
+                )
                 uncompleted = [
                     lid
                     for lid in previous_lesson_ids
@@ -87,6 +83,11 @@ class LessonCompletionCreateSerializer(serializers.ModelSerializer):
                 validated_data
             )  # create the Progress record
 
+            # Progress.save() bumped the denormalized counter, re-read it
+            enrollment.refresh_from_db(
+                fields=["completed_lessons_count", "total_lessons"]
+            )
+
             # check if all lessons are completed then update enrollment status
             total_lessons = enrollment.total_lessons
             completed_lessons = enrollment.completed_lessons_count
@@ -111,6 +112,131 @@ class LessonCompletionCreateSerializer(serializers.ModelSerializer):
             )
 
 
+class LessonCompletionBatchSerializer(serializers.Serializer):
+    """
+    Complete an ordered batch of lessons, e.g. progress synced by an offline
+    client, under a single enrollment lock: one sequence check for the whole
+    batch, one INSERT and one counter update. Each lesson gets its own
+    outcome instead of the batch failing as a whole.
+    """
+
+    COMPLETED = "completed"
+    ALREADY_COMPLETED = "already_completed"
+    NOT_IN_COURSE = "not_in_course"
+    BLOCKED = "blocked"
+    MAX_LESSONS = 500
+
+    lessons = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_LESSONS,
+        write_only=True,
+    )
+    completed_lessons_count = serializers.IntegerField(read_only=True)
+    is_completed = serializers.BooleanField(read_only=True)
+    results = serializers.ListField(child=serializers.DictField(), read_only=True)
+
+    def validate_lessons(self, lesson_ids):
+        if len(set(lesson_ids)) != len(lesson_ids):
+            raise serializers.ValidationError("Lesson IDs must be unique.")
+        return lesson_ids
+
+    def validate(self, data):
+        enrollment = self.context.get("enrollment")
+        if not enrollment:
+            raise serializers.ValidationError(
+                {"enrollment": "Enrollment not found or does not belong to you."}
+            )
+        data["enrollment"] = enrollment
+        return data
+
+    def get_outcomes(self, lesson_ids, lesson_index, existing):
+        """
+        Apply the sequential rule to the whole batch in one walk over the
+        course's lesson order: a requested lesson is completed when every
+        earlier lesson is completed already or earlier in this batch.
+
+        : existing: lesson id -> deleted_at of this enrollment's Progress rows.
+        """
+        requested = set(lesson_ids)
+        completed = {
+            lesson_id for lesson_id, deleted_at in existing.items() if not deleted_at
+        }
+        outcomes = {}
+        uncompleted = []
+        for lesson_id, _, _ in lesson_index:
+            if lesson_id in requested:
+                if lesson_id in existing:
+                    # a soft-deleted completion still holds the unique row
+                    outcomes[lesson_id] = {"status": self.ALREADY_COMPLETED}
+                elif uncompleted:
+                    outcomes[lesson_id] = {
+                        "status": self.BLOCKED,
+                        "uncompleted_lesson_ids": list(uncompleted),
+                    }
+                else:
+                    outcomes[lesson_id] = {"status": self.COMPLETED}
+                    continue
+            if lesson_id not in completed:
+                uncompleted.append(lesson_id)
+
+        return [
+            {
+                "lesson": lesson_id,
+                **outcomes.get(lesson_id, {"status": self.NOT_IN_COURSE}),
+            }
+            for lesson_id in lesson_ids
+        ]
+
+    @transaction.atomic
+    def create(self, validated_data):
+        # one lock for the batch, also serializing it with single completions
+        enrollment = Enrollment.objects.select_for_update().get(
+            id=validated_data["enrollment"].id
+        )
+        existing = dict(
+            Progress.all_objects.filter(enrollment_id=enrollment.id).values_list(
+                "lesson_id", "deleted_at"
+            )
+        )
+        results = self.get_outcomes(
+            validated_data["lessons"], get_lesson_index(enrollment.course_id), existing
+        )
+
+        completions = [
+            Progress(enrollment=enrollment, lesson_id=result["lesson"])
+            for result in results
+            if result["status"] == self.COMPLETED
+        ]
+        if completions:
+            # bulk_create skips Progress.save(), recount once instead
+            Progress.objects.bulk_create(completions, ignore_conflicts=True)
+            Enrollment.objects.filter(id=enrollment.id).rebuild_progress_counters()
+            enrollment.refresh_from_db(
+                fields=["completed_lessons_count", "total_lessons"]
+            )
+
+            total_lessons = enrollment.total_lessons
+            if (
+                not enrollment.is_completed
+                and total_lessons > 0
+                and enrollment.completed_lessons_count >= total_lessons
+            ):
+                enrollment.is_completed = True
+                enrollment.completed_at = timezone.now()
+                enrollment.save()
+
+                transaction.on_commit(
+                    lambda: handle_course_completion.delay(enrollment.id)
+                )
+
+        return {
+            "completed_lessons_count": enrollment.completed_lessons_count,
+            "is_completed": enrollment.is_completed,
+            "results": results,
+        }
+
+
 class LessonCompletionListSerializer(serializers.ModelSerializer):
     lesson_title = serializers.CharField(source="lesson.title", read_only=True)
 
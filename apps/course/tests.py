@@ -1,3 +1,1038 @@
-from django.test import TestCase
+import csv
+import io
+import json
+import uuid
+from decimal import Decimal
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import iscoroutinefunction
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection, router
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
+from django.utils.translation import gettext_lazy
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase, APITransactionTestCase
+
+from apps.authentication.models import CustomUser, UserTypeEnum
+from base.cache import cached, get_or_set, invalidate_tags
+from base.db import (
+    get_pool_stats,
+    is_pinned_to_primary,
+    on_replica,
+    replica,
+    route_request,
+)
+from base.parsers import ORJSONParser
+from base.renderers import ORJSONRenderer, orjson
+from base.views.generic_views import CustomCursorPagination
+from base.views.views import CustomAPIResponse
+
+from .lesson_index import get_lesson_index, stats
+from .models import Course, CourseStatusEnum, Enrollment, Lesson, Progress
+from .models.course import SHORT_DESCRIPTION_LENGTH
+from .serializers import LessonListSerializer
+from .views import (
+    CourseListView,
+    CourseRetrieveView,
+    EnrollmentListView,
+    EnrollmentRetrieveView,
+    LessonListView,
+    LessonRetrieveView,
+)
+
+
+def create_user(email_address, user_type=UserTypeEnum.STUDENT, **fields):
+    return CustomUser.objects.create_user(
+        email_address=email_address,
+        password="Test@1234",
+        user_type=user_type,
+        **fields,
+    )
+
+
+def create_course(
+    instructor,
+    title="Course",
+    lesson_count=0,
+    status=CourseStatusEnum.PUBLISHED,
+    **fields,
+):
+    """
+    A course and its `lesson_count` lessons, titled and ordered by index.
+    """
+    course = Course.objects.create(
+        title=title, instructor=instructor, status=status, **fields
+    )
+    lessons = [
+        Lesson.objects.create(course=course, title=f"Lesson {i}", order=i)
+        for i in range(lesson_count)
+    ]
+    return course, lessons
+
+
+class CourseTestCase(APITestCase):
+    """
+    `instructor`'s published `course` of `lesson_count` lessons, with
+    `student` enrolled in it (`enrollment`) when `enroll_student` is set.
+    """
+
+    lesson_count = 3
+    enroll_student = False
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = create_user("instructor@test.com", UserTypeEnum.INSTRUCTOR)
+        cls.course, cls.lessons = create_course(
+            cls.instructor, lesson_count=cls.lesson_count
+        )
+        if cls.enroll_student:
+            cls.student = create_user("student@test.com")
+            cls.enrollment = Enrollment.objects.create(
+                student=cls.student, course=cls.course
+            )
+
+
+class EnrollmentQueryCountTests(CourseTestCase):
+    def _enroll(self, count, start=0):
+        for i in range(start, start + count):
+            student = create_user(f"student{i}@test.com", first_name=f"Student {i}")
+            enrollment = Enrollment.objects.create(student=student, course=self.course)
+            Progress.objects.create(enrollment=enrollment, lesson=self.lessons[0])
+
+    def _list_query_count(self):
+        self.client.force_authenticate(self.instructor)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("enrollment-list"))
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_list_query_count_is_constant_per_page(self):
+        self._enroll(2)
+        small_page_queries, _ = self._list_query_count()
+
+        self._enroll(6, start=2)
+        large_page_queries, response = self._list_query_count()
+
+        self.assertEqual(small_page_queries, large_page_queries)
+        self.assertEqual(len(response.data["data"]), 8)
+        row = response.data["data"][0]
+        self.assertEqual(row["course_title"], "Course")
+        self.assertEqual(row["total_lessons"], 3)
+        self.assertEqual(row["completed_lessons_count"], 1)
+
+    @skipUnless(connection.vendor == "postgresql", "ArraySubquery needs PostgreSQL")
+    def test_detail_is_a_single_query(self):
+        self._enroll(1)
+        enrollment = Enrollment.objects.get()
+        self.client.force_authenticate(enrollment.student)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("enrollment-retrieve", kwargs={"pk": enrollment.pk})
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["completed_lesson_ids"], [self.lessons[0].id])
+        self.assertEqual(response.data["completion_percentage"], 33.33)
+
+    @skipUnless(connection.vendor == "postgresql", "ArraySubquery needs PostgreSQL")
+    def test_completed_lesson_ids_are_newest_first(self):
+        self._enroll(1)
+        enrollment = Enrollment.objects.get()
+        Progress.objects.create(enrollment=enrollment, lesson=self.lessons[2])
+
+        annotated = Enrollment.objects.with_completed_lesson_ids().get()
+        self.assertEqual(
+            annotated.completed_lesson_ids,
+            [self.lessons[2].id, self.lessons[0].id],
+        )
+        self.assertEqual(
+            annotated.completed_lesson_ids,
+            list(enrollment.completed_lessons.values_list("lesson_id", flat=True)),
+        )
+
+
+class EnrollmentBulkCreateTests(CourseTestCase):
+    lesson_count = 1
+
+    def _students(self, count, start=0):
+        return CustomUser.objects.bulk_create(
+            CustomUser(email_address=f"student{i}@test.com", full_name=f"Student {i}")
+            for i in range(start, start + count)
+        )
+
+    def _enroll(self, students, user=None):
+        self.client.force_authenticate(user or self.instructor)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                reverse("enrollment-bulk-create"),
+                {"course": self.course.id, "students": students},
+                format="json",
+            )
+        return response, len(ctx.captured_queries)
+
+    def test_cohort_is_enrolled_by_id_or_email(self):
+        first, second, third = self._students(3)
+        Enrollment.objects.create(student=first, course=self.course)
+
+        response, _ = self._enroll(
+            [first.id, second.email_address, third.id, "nobody@test.com"]
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.data["data"]
+        self.assertEqual((data["created"], data["skipped"]), (2, 1))
+        self.assertEqual(data["unresolved"], ["nobody@test.com"])
+        self.assertEqual(
+            set(
+                Enrollment.objects.filter(course=self.course).values_list(
+                    "total_lessons", flat=True
+                )
+            ),
+            {1},
+        )
+
+    def test_email_addresses_match_case_insensitively(self):
+        first, second = self._students(2)
+
+        response, _ = self._enroll(
+            [first.email_address.upper(), second.id, second.email_address.title()]
+        )
+        data = response.data["data"]
+        self.assertEqual((data["created"], data["skipped"]), (2, 0))
+        self.assertEqual(data["unresolved"], [])
+        self.assertEqual(Enrollment.objects.filter(course=self.course).count(), 2)
+
+    def test_malformed_ids_are_reported_unresolved(self):
+        student = self._students(1)[0]
+        entries = ["²", "99999999999999999999", "0", "-1", str(student.id)]
+
+        response, _ = self._enroll(entries)
+        self.assertEqual(response.status_code, 200)
+        data = response.data["data"]
+        self.assertEqual(data["created"], 1)
+        self.assertEqual(data["unresolved"], entries[:4])
+
+    def test_only_published_courses_accept_students(self):
+        self.course.status = CourseStatusEnum.DRAFT
+        self.course.save(update_fields=["status"])
+        student = self._students(1)[0]
+
+        response, _ = self._enroll([student.id])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Enrollment.objects.filter(course=self.course))
+
+    def test_query_count_does_not_grow_with_the_cohort(self):
+        _, small = self._enroll([s.id for s in self._students(3)])
+        response, large = self._enroll([s.id for s in self._students(300, start=3)])
+        self.assertEqual(response.data["data"]["created"], 300)
+        self.assertEqual(small, large)
+
+    def test_only_the_course_instructor_can_enroll(self):
+        other = create_user("other@test.com", UserTypeEnum.INSTRUCTOR)
+        student = self._students(1)[0]
+        response, _ = self._enroll([student.id], user=other)
+        self.assertEqual(response.status_code, 400)
+        response, _ = self._enroll([student.id], user=student)
+        self.assertEqual(response.status_code, 403)
+
+
+class EnrollmentCounterTests(CourseTestCase):
+    """
+    The denormalized `total_lessons` / `completed_lessons_count` of an
+    enrollment with 2 of 3 lessons completed.
+    """
+
+    enroll_student = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.progress = [
+            Progress.objects.create(enrollment=cls.enrollment, lesson=lesson)
+            for lesson in cls.lessons[:2]
+        ]
+
+    def assert_counters(self, total_lessons, completed_lessons_count):
+        self.enrollment.refresh_from_db()
+        self.assertEqual(
+            (self.enrollment.total_lessons, self.enrollment.completed_lessons_count),
+            (total_lessons, completed_lessons_count),
+        )
+
+    def test_lesson_delete_and_restore(self):
+        self.assert_counters(3, 2)
+
+        self.lessons[2].delete()
+        self.assert_counters(2, 2)
+        self.lessons[2].restore()
+        self.assert_counters(3, 2)
+
+        # cascades to the lesson's completion
+        self.lessons[0].delete(hard=True)
+        self.assert_counters(2, 1)
+
+    def test_progress_delete_and_restore(self):
+        self.progress[0].delete()
+        self.assert_counters(3, 1)
+        self.progress[0].restore()
+        self.assert_counters(3, 2)
+
+        # an already soft-deleted row was counted out before
+        self.progress[1].delete()
+        self.progress[1].delete(hard=True)
+        self.assert_counters(3, 1)
+        self.progress[0].delete(hard=True)
+        self.assert_counters(3, 0)
+
+    def test_rebuild_command_corrects_drift(self):
+        Enrollment.objects.update(total_lessons=0, completed_lessons_count=7)
+
+        call_command("rebuild_enrollment_counters", stdout=io.StringIO())
+        self.assert_counters(3, 2)
+
+
+class CourseCatalogueQueryCountTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = create_user("student@test.com")
+
+    def _publish_courses(self, count, start=0):
+        for i in range(start, start + count):
+            instructor = create_user(
+                f"instructor{i}@test.com",
+                UserTypeEnum.INSTRUCTOR,
+                first_name=f"Instructor {i}",
+            )
+            create_course(instructor, title=f"Course {i}", lesson_count=1)
+
+    def _list_query_count(self):
+        # total_count is cached for a short TTL
+        cache.clear()
+        self.client.force_authenticate(self.student)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("course-list"))
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_list_query_count_is_constant_per_page(self):
+        self._publish_courses(2)
+        small_page_queries, _ = self._list_query_count()
+
+        self._publish_courses(6, start=2)
+        large_page_queries, response = self._list_query_count()
+
+        self.assertEqual(small_page_queries, large_page_queries)
+        self.assertEqual(len(response.data["data"]), 8)
+        row = response.data["data"][0]
+        self.assertEqual(row["total_lessons"], 1)
+        self.assertTrue(row["instructor_name"].startswith("Instructor"))
+
+
+class LessonCompletionSequenceTests(CourseTestCase):
+    lesson_count = 5
+    enroll_student = True
+
+    def _complete(self, lesson):
+        self.client.force_authenticate(self.student)
+        return self.client.post(
+            reverse(
+                "lesson-progress-create",
+                kwargs={"enrollment_id": self.enrollment.id},
+            ),
+            {"lesson": lesson.id},
+        )
+
+    def test_skipping_lessons_reports_uncompleted_ids(self):
+        self._complete(self.lessons[0])
+        response = self._complete(self.lessons[3])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(
+            str([self.lessons[1].id, self.lessons[2].id]),
+            str(response.data["errors"]["lesson"]),
+        )
+
+    def test_soft_deleted_lessons_do_not_block_the_sequence(self):
+        self.lessons[1].delete()
+        self._complete(self.lessons[0])
+        response = self._complete(self.lessons[2])
+
+        self.assertEqual(response.status_code, 201)
+        self.enrollment.refresh_from_db()
+        self.assertEqual(self.enrollment.completed_lessons_count, 2)
+
+
+class LessonCompletionBatchTests(CourseTestCase):
+    lesson_count = 4
+    enroll_student = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        _, (cls.other_lesson,) = create_course(
+            cls.instructor,
+            title="Other",
+            lesson_count=1,
+            status=CourseStatusEnum.DRAFT,
+        )
+
+    def _complete(self, lessons):
+        self.client.force_authenticate(self.student)
+        return self.client.post(
+            reverse("lesson-progress-batch", args=[self.enrollment.id]),
+            {"lessons": [lesson.id for lesson in lessons]},
+            format="json",
+        )
+
+    def _statuses(self, response):
+        return [result["status"] for result in response.data["data"]["results"]]
+
+    def test_batch_reports_an_outcome_per_lesson(self):
+        first, second, third, fourth = self.lessons
+        Progress.objects.create(enrollment=self.enrollment, lesson=first)
+
+        response = self._complete([third, first, self.other_lesson, fourth])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self._statuses(response),
+            ["blocked", "already_completed", "not_in_course", "blocked"],
+        )
+        self.assertEqual(
+            response.data["data"]["results"][0]["uncompleted_lesson_ids"],
+            [second.id],
+        )
+        self.assertEqual(response.data["data"]["completed_lessons_count"], 1)
+
+    def test_batch_completes_in_course_order_under_one_lock(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._complete(reversed(self.lessons))
+        self.assertEqual(self._statuses(response), ["completed"] * 4)
+        self.assertTrue(response.data["data"]["is_completed"])
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 1)
+
+        self.enrollment.refresh_from_db()
+        self.assertEqual(self.enrollment.completed_lessons_count, 4)
+        self.assertTrue(self.enrollment.is_completed)
+
+    def test_duplicate_lessons_are_rejected(self):
+        response = self._complete([self.lessons[0], self.lessons[0]])
+        self.assertEqual(response.status_code, 400)
+
+
+class LessonIndexCacheTests(CourseTestCase):
+    def setUp(self):
+        cache.clear()
+        stats.reset()
+
+    def test_repeated_reads_are_served_from_cache(self):
+        get_lesson_index(self.course.id)
+        with self.assertNumQueries(0):
+            index = get_lesson_index(self.course.id)
+
+        self.assertEqual(
+            [row[0] for row in index], [lesson.id for lesson in self.lessons]
+        )
+        self.assertEqual(stats.as_dict()["misses"], 1)
+        self.assertEqual(stats.as_dict()["local_hits"], 1)
+
+    def test_stats_are_restricted_to_admins(self):
+        staff = create_user("staff@test.com", is_staff=True)
+        admin = create_user("admin@test.com", UserTypeEnum.ADMIN)
+        url = reverse("lesson-index-stats")
+
+        self.client.force_authenticate(staff)
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.client.force_authenticate(admin)
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_lesson_writes_invalidate_the_index(self):
+        get_lesson_index(self.course.id)
+
+        self.lessons[0].title = "Renamed"
+        self.lessons[0].save()
+        self.assertEqual(get_lesson_index(self.course.id)[0][2], "Renamed")
+
+        self.lessons[1].delete()
+        self.assertEqual(
+            [row[0] for row in get_lesson_index(self.course.id)],
+            [self.lessons[0].id, self.lessons[2].id],
+        )
+
+
+class CursorPaginationTests(CourseTestCase):
+    lesson_count = 0
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        for i in range(5):
+            student = create_user(f"student{i}@test.com")
+            Enrollment.objects.create(student=student, course=cls.course)
+        # ties on created_at must be broken by id
+        first = Enrollment.objects.order_by("id").first()
+        Enrollment.objects.update(created_at=first.created_at)
+
+    def _get(self, url):
+        self.client.force_authenticate(self.instructor)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_pages_walk_forward_and_back_without_gaps(self):
+        expected = list(Enrollment.objects.order_by("-id").values_list("id", flat=True))
+
+        page = self._get(reverse("enrollment-list") + "?limit=2")
+        self.assertIsNone(page["previous"])
+        self.assertNotIn("total_count", page)
+        seen = [row["id"] for row in page["data"]]
+        pages = [page]
+        while page["next"]:
+            page = self._get(page["next"])
+            seen += [row["id"] for row in page["data"]]
+            pages.append(page)
+        self.assertEqual(seen, expected)
+
+        previous = self._get(pages[-1]["previous"])
+        self.assertEqual(previous["data"], pages[-2]["data"])
+
+    def test_invalid_cursor_is_not_found(self):
+        self.client.force_authenticate(self.instructor)
+        response = self.client.get(reverse("enrollment-list") + "?cursor=garbage")
+        self.assertEqual(response.status_code, 404)
+
+    def test_nullable_ordering_fields_are_refused(self):
+        paginator = CustomCursorPagination()
+        self.assertEqual(
+            paginator.get_ordering(Enrollment.objects.order_by("-created_at")),
+            [("created_at", True), ("id", True)],
+        )
+        with self.assertRaises(ImproperlyConfigured):
+            paginator.get_ordering(Enrollment.objects.order_by("-completed_at"))
+
+
+class PaginationCountTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = create_user("student@test.com")
+        instructor = create_user("instructor@test.com", UserTypeEnum.INSTRUCTOR)
+        for i in range(3):
+            create_course(instructor, title=f"Course {i}")
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.student)
+
+    def _get(self, query=""):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("course-list") + query)
+        self.assertEqual(response.status_code, 200)
+        count_queries = [q for q in ctx.captured_queries if "__count" in q["sql"]]
+        return response.data, count_queries
+
+    def test_exact_counts_are_cached(self):
+        data, count_queries = self._get()
+        self.assertEqual(data["total_count"], 3)
+        self.assertEqual(data["count_type"], "exact")
+        self.assertEqual(len(count_queries), 1)
+
+        data, count_queries = self._get()
+        self.assertEqual(data["total_count"], 3)
+        self.assertEqual(count_queries, [])
+
+    def test_count_can_be_skipped(self):
+        data, count_queries = self._get("?count=false&limit=2")
+        self.assertEqual(count_queries, [])
+        self.assertIsNone(data["total_count"])
+        self.assertIsNone(data["count_type"])
+        self.assertEqual(len(data["data"]), 2)
+        self.assertIsNotNone(data["next"])
+
+        data, _ = self._get("?count=false&limit=2&page=2")
+        self.assertEqual(len(data["data"]), 1)
+        self.assertIsNone(data["next"])
+
+
+class StreamingExportTests(CourseTestCase):
+    lesson_count = 1
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.other_instructor = create_user("other@test.com", UserTypeEnum.INSTRUCTOR)
+        for i in range(3):
+            student = create_user(f"student{i}@test.com", first_name=f"Student {i}")
+            enrollment = Enrollment.objects.create(student=student, course=cls.course)
+            Progress.objects.create(enrollment=enrollment, lesson=cls.lessons[0])
+
+    def _export(self, user, name, export_format):
+        self.client.force_authenticate(user)
+        response = self.client.get(reverse(name), {"export_format": export_format})
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def test_enrollments_stream_as_csv(self):
+        rows = list(
+            csv.DictReader(
+                io.StringIO(self._export(self.instructor, "enrollment-export", "csv"))
+            )
+        )
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["course_title"], "Course")
+        self.assertEqual(rows[0]["completed_lessons_count"], "1")
+
+    def test_progress_streams_as_ndjson_within_ownership(self):
+        lines = self._export(
+            self.instructor, "lesson-progress-export", "ndjson"
+        ).splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[0])["lesson_title"], "Lesson 0")
+
+        self.assertEqual(
+            self._export(self.other_instructor, "lesson-progress-export", "ndjson"),
+            "",
+        )
+
+
+class CourseShortDescriptionTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = create_user("instructor@test.com", UserTypeEnum.INSTRUCTOR)
+
+    def _create(self, description):
+        return Course.objects.create(
+            title="Course", description=description, instructor=self.instructor
+        )
+
+    def test_excerpt_is_maintained_on_save(self):
+        course = self._create("A  short\n description")
+        self.assertEqual(course.short_description, "A short description")
+
+        course.description = "word " * 100
+        course.save(update_fields=["description"])
+        course.refresh_from_db()
+        self.assertEqual(len(course.short_description), SHORT_DESCRIPTION_LENGTH)
+        self.assertTrue(course.short_description.endswith("\u2026"))
+
+    def test_catalogue_reads_only_the_excerpt(self):
+        self._create("Full description")
+        self.client.force_authenticate(self.instructor)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("course-list"))
+        row = response.data["data"][0]
+        self.assertEqual(row["short_description"], "Full description")
+        self.assertNotIn("description", row)
+        self.assertNotIn(
+            '"description"', " ".join(q["sql"] for q in ctx.captured_queries)
+        )
+
+    def test_command_backfills_excerpts(self):
+        course = self._create("Old")
+        Course.objects.filter(pk=course.pk).update(description="New description")
+
+        call_command("backfill_short_descriptions", batch_size=1, stdout=io.StringIO())
+        course.refresh_from_db()
+        self.assertEqual(course.short_description, "New description")
+
+
+class ConditionalGetTests(CourseTestCase):
+    def setUp(self):
+        self.client.force_authenticate(self.instructor)
+        self.url = reverse("course-retrieve", args=[self.course.pk])
+
+    def _etag(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response["ETag"]
+
+    def test_unchanged_course_is_not_modified_in_one_query(self):
+        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(
+                self.url, HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], response["ETag"])
+
+        not_modified = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_lesson_changes_change_the_etag(self):
+        etags = [self._etag()]
+        self.lessons[0].delete()
+        etags.append(self._etag())
+        self.lessons[0].restore()
+        etags.append(self._etag())
+        Lesson.objects.filter(pk=self.lessons[1].pk).delete(hard=True)
+        etags.append(self._etag())
+        self.assertEqual(len(set(etags)), len(etags))
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etags[0])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["data"]["lessons"]), 2)
+
+    def test_hidden_course_is_not_found(self):
+        student = create_user("student@test.com")
+        Course.objects.filter(pk=self.course.pk).update(status=CourseStatusEnum.DRAFT)
+        self.client.force_authenticate(student)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 404)
+
+
+class AsyncReadViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = create_user("instructor@test.com", UserTypeEnum.INSTRUCTOR)
+        course, cls.lessons = create_course(
+            cls.instructor, title="Course 0", lesson_count=3
+        )
+        cls.courses = [course] + [
+            create_course(cls.instructor, title=f"Course {i}")[0] for i in (1, 2)
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.instructor)
+
+    def test_read_views_are_async(self):
+        for view in (
+            CourseListView,
+            CourseRetrieveView,
+            LessonListView,
+            LessonRetrieveView,
+            EnrollmentListView,
+            EnrollmentRetrieveView,
+        ):
+            self.assertTrue(iscoroutinefunction(view.as_view()), view)
+
+    def test_course_detail_prefetches_its_lessons(self):
+        url = reverse("course-retrieve", args=[self.courses[0].pk])
+        with self.assertNumQueries(3):
+            # validator, course, lessons
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [lesson["id"] for lesson in response.data["data"]["lessons"]],
+            [lesson.pk for lesson in self.lessons],
+        )
+
+    def test_lesson_detail_and_missing_objects(self):
+        response = self.client.get(
+            reverse("lesson-retrieve", args=[self.lessons[1].pk])
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["data"]["course_title"], "Course 0")
+
+        response = self.client.get(reverse("lesson-retrieve", args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_async_page_number_pagination(self):
+        response = self.client.get(reverse("course-list") + "?limit=2&page=last")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["current_page"], 2)
+        self.assertEqual(response.data["total_count"], 3)
+        self.assertEqual(len(response.data["data"]), 1)
+
+        response = self.client.get(reverse("course-list") + "?limit=2&page=3")
+        self.assertEqual(response.status_code, 404)
+
+
+class SparseFieldsetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = create_user("instructor@test.com", UserTypeEnum.INSTRUCTOR)
+        course, _ = create_course(
+            cls.instructor,
+            description="Long description",
+            status=CourseStatusEnum.DRAFT,
+        )
+        cls.lesson = Lesson.objects.create(
+            course=course, title="Lesson", content="Long content", order=1
+        )
+        cls.student = create_user("student@test.com")
+        cls.enrollment = Enrollment.objects.create(student=cls.student, course=course)
+        for order in range(2, 5):
+            lesson = Lesson.objects.create(course=course, title="Lesson", order=order)
+            Progress.objects.create(enrollment=cls.enrollment, lesson=lesson)
+
+    def setUp(self):
+        self.client.force_authenticate(self.instructor)
+
+    def _get(self, url, query):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url + query)
+        return response, " ".join(q["sql"] for q in ctx.captured_queries)
+
+    def test_fields_and_omit_skip_columns(self):
+        url = reverse("lesson-retrieve", args=[self.lesson.pk])
+        response, sql = self._get(url, "?fields=id,title")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["data"], {"id": self.lesson.pk, "title": "Lesson"}
+        )
+        self.assertNotIn('"content"', sql)
+
+        response, sql = self._get(url, "?omit=content,course_title")
+        self.assertNotIn("content", response.data["data"])
+        self.assertEqual(response.data["data"]["course"], self.lesson.course_id)
+        self.assertNotIn('"content"', sql)
+
+        _, sql = self._get(url, "")
+        self.assertIn('"content"', sql)
+
+    def test_properties_keep_all_columns(self):
+        url = reverse("course-list")
+        # total_lessons is a property, which may read any column
+        response, sql = self._get(url, "?omit=short_description")
+        self.assertNotIn("short_description", response.data["data"][0])
+        self.assertIn('"short_description"', sql)
+
+        response, sql = self._get(url, "?omit=short_description,total_lessons")
+        self.assertEqual(response.data["data"][0]["title"], "Course")
+        self.assertNotIn('"short_description"', sql)
+
+    def test_cursor_columns_stay_loaded(self):
+        self.client.force_authenticate(self.student)
+        url = reverse("lesson-progress-list", args=[self.enrollment.pk]) + "?limit=2"
+        full = self.client.get(url).data
+        # the page is one query, no deferred created_at is reloaded per row
+        with self.assertNumQueries(1):
+            page = self.client.get(url + "&fields=id").data
+        self.assertEqual(page["data"], [{"id": row["id"]} for row in full["data"]])
+        self.assertEqual(len(self.client.get(page["next"]).data["data"]), 1)
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get(reverse("course-list") + "?fields=id,nope")
+        self.assertEqual(response.status_code, 400)
+
+
+@skipUnless(orjson, "orjson is not installed")
+class ORJSONRendererTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        instructor = create_user("instructor@test.com", UserTypeEnum.INSTRUCTOR)
+        course, _ = create_course(instructor, status=CourseStatusEnum.DRAFT)
+        for i in range(5):
+            Lesson.objects.create(
+                course=course,
+                title=f"Lesson {i} \u00e9\u2028",
+                content="<b>content</b> \U0001f600",
+                order=i + 1,
+            )
+
+    def assertSameBytes(self, data):
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_envelopes_are_byte_identical(self):
+        lessons = LessonListSerializer(Lesson.objects.all(), many=True).data
+        self.assertSameBytes(
+            CustomAPIResponse.custom_success_response(data=lessons).data
+        )
+        self.assertSameBytes(
+            CustomAPIResponse.custom_error_response(
+                errors={"title": [gettext_lazy("This field is required.")]}
+            ).data
+        )
+
+    def test_native_values_match_drf_encoder(self):
+        self.assertSameBytes(
+            {
+                "now": timezone.now(),
+                "today": timezone.now().date(),
+                "price": Decimal("10.50"),
+                "id": uuid.uuid4(),
+                "lessons": Lesson.objects.values_list("id", flat=True),
+                1: "int key",
+                "big": 2**70,
+            }
+        )
+
+    def test_parser_matches_stdlib(self):
+        body = JSONRenderer().render(
+            LessonListSerializer(Lesson.objects.all(), many=True).data
+        )
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body))
+        )
+
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError:
+    ConnectionPool = None
+
+
+class DatabasePoolStatsTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = create_user("admin@test.com", UserTypeEnum.ADMIN)
+        cls.staff = create_user("staff@test.com", is_staff=True)
+
+    def test_admins_only(self):
+        # admins by user type, Django's is_staff does not count
+        self.client.force_authenticate(self.staff)
+        response = self.client.get(reverse("db-pool-stats"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_unpooled_database(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get(reverse("db-pool-stats"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data["data"])
+
+    @skipUnless(ConnectionPool, "needs the pool extra")
+    def test_pool_usage(self):
+        # never opened, so no connection is attempted
+        pool = ConnectionPool("", open=False, min_size=0, max_size=4)
+        pool._stats.update(requests_num=4, requests_wait_ms=10, requests_errors=1)
+        with mock.patch.object(connection, "pool", pool, create=True):
+            stats = get_pool_stats()
+        self.assertEqual(stats["max_size"], 4)
+        self.assertEqual(stats["in_use"], stats["size"] - stats["available"])
+        self.assertEqual(stats["waiting"], 0)
+        self.assertEqual(stats["wait_ms"], 10)
+        self.assertEqual(stats["avg_wait_ms"], 2.5)
+        self.assertEqual(stats["timeouts"], 1)
+
+
+class CacheAsideTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_tagged_values_are_computed_once(self):
+        compute = mock.Mock(return_value=3)
+
+        self.assertEqual(get_or_set("lessons", compute, tags=["course:1"]), 3)
+        self.assertEqual(get_or_set("lessons", compute, tags=["course:1"]), 3)
+        compute.assert_called_once()
+
+    def test_invalidating_a_tag_makes_its_keys_unreachable(self):
+        get_or_set("lessons", lambda: "stale", tags=["course:1", "lessons"])
+        get_or_set("title", lambda: "kept", tags=["course:2"])
+
+        invalidate_tags("course:1")
+
+        self.assertEqual(
+            get_or_set("lessons", lambda: "fresh", tags=["course:1", "lessons"]),
+            "fresh",
+        )
+        self.assertEqual(get_or_set("title", lambda: "new", tags=["course:2"]), "kept")
+
+    def test_none_is_cached(self):
+        compute = mock.Mock(return_value=None)
+
+        self.assertIsNone(get_or_set("missing", compute))
+        self.assertIsNone(get_or_set("missing", compute))
+        compute.assert_called_once()
+
+    def test_decorated_function_invalidates_its_own_key(self):
+        compute = mock.Mock(side_effect=lambda course_id: f"course {course_id}")
+        get_title = cached(
+            lambda course_id: f"title:{course_id}",
+            tags=lambda course_id: [f"course:{course_id}"],
+        )(compute)
+
+        get_title(1)
+        get_title(2)
+        get_title(1)
+        self.assertEqual(compute.call_count, 2)
+
+        get_title.invalidate(1)
+        self.assertEqual(get_title(1), "course 1")
+        get_title(2)
+        self.assertEqual(compute.call_count, 3)
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"])
+class ReplicaRoutingTests(SimpleTestCase):
+    """
+    `replica_1` is not a configured database, and no query may run here:
+    the routing decisions are checked, not made.
+    """
+
+    student = CustomUser(pk=1, email_address="student@test.com")
+
+    def setUp(self):
+        cache.clear()
+
+    def route(self, method="get", user=None):
+        request = getattr(RequestFactory(), method)("/")
+        if user is not None:
+            request.user = user
+        return route_request(request)
+
+    def test_safe_requests_read_from_a_replica(self):
+        with self.route(user=self.student):
+            self.assertEqual(router.db_for_read(Course), "replica_1")
+            self.assertEqual(router.db_for_write(Course), "default")
+            self.assertEqual(router.db_for_read(Course), "default")
+
+        with self.route(method="post", user=self.student):
+            self.assertEqual(router.db_for_read(Course), "default")
+
+        # outside requests and before DRF authenticated the request
+        self.assertEqual(router.db_for_read(Course), "default")
+        with self.route(user=SimpleLazyObject(lambda: self.student)):
+            self.assertEqual(router.db_for_read(Course), "default")
+
+    def test_writers_are_pinned_to_the_primary(self):
+        with self.route(method="post", user=self.student) as routing:
+            router.db_for_write(Progress)
+        routing.finish()
+
+        with self.route(user=self.student):
+            self.assertEqual(router.db_for_read(Course), "default")
+        with self.route(user=AnonymousUser()):
+            self.assertEqual(router.db_for_read(Course), "replica_1")
+
+    def test_exports_use_replicas_and_cache_fills_the_primary(self):
+        with self.route(method="post", user=self.student):
+            self.assertEqual(on_replica(Progress.objects.all()).db, "replica_1")
+            with replica():
+                self.assertEqual(router.db_for_read(Course), "replica_1")
+
+        with self.route(user=self.student):
+            self.assertEqual(
+                get_or_set("routing", lambda: router.db_for_read(Course)), "default"
+            )
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"])
+class ReplicaReadYourWritesTests(APITransactionTestCase):
+    """
+    Outside a test transaction, so reads are routed as in production; one
+    routed to the unconfigured `replica_1` fails.
+    """
+
+    def setUp(self):
+        cache.clear()
+        instructor = create_user("instructor@test.com", UserTypeEnum.INSTRUCTOR)
+        self.student = create_user("student@test.com")
+        course, self.lessons = create_course(instructor, lesson_count=3)
+        self.enrollment = Enrollment.objects.create(student=self.student, course=course)
+
+    def test_lesson_completion_reads_its_own_writes(self):
+        self.client.force_authenticate(self.student)
+        url_kwargs = {"enrollment_id": self.enrollment.id}
+        # not the last lesson, which completes the course through Celery
+        for lesson in self.lessons[:2]:
+            response = self.client.post(
+                reverse("lesson-progress-create", kwargs=url_kwargs),
+                {"lesson": lesson.id},
+            )
+            self.assertEqual(response.status_code, 201)
+        self.assertTrue(is_pinned_to_primary(self.student.pk))
+
+        # pinned, so the completions are listed from the primary
+        response = self.client.get(reverse("lesson-progress-list", kwargs=url_kwargs))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["data"]), 2)
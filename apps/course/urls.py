@@ -5,14 +5,19 @@ from .views import (
     CourseListView,
     CourseRetrieveView,
     CourseUpdateView,
+    EnrollmentBulkCreateView,
     EnrollmentCreateView,
+    EnrollmentExportView,
     EnrollmentListView,
     EnrollmentRetrieveView,
     LessonCreateView,
     LessonDeleteView,
+    LessonIndexStatsView,
     # CourseDeleteView,
     LessonListView,
+    LessonProgressBatchCreateView,
     LessonProgressCreateView,
+    LessonProgressExportView,
     LessonProgressListView,
     LessonRetrieveView,
     LessonUpdateView,
@@ -32,11 +37,18 @@ lesson_patterns = [
     path("retrieve/<int:pk>", LessonRetrieveView.as_view(), name="lesson-retrieve"),
     path("update/<int:pk>", LessonUpdateView.as_view(), name="lesson-update"),
     path("delete/<int:pk>", LessonDeleteView.as_view(), name="lesson-delete"),
+    path("index-stats", LessonIndexStatsView.as_view(), name="lesson-index-stats"),
 ]
 
 enrollment_patterns = [
     path("list", EnrollmentListView.as_view(), name="enrollment-list"),
     path("create", EnrollmentCreateView.as_view(), name="enrollment-create"),
+    path(
+        "bulk-create",
+        EnrollmentBulkCreateView.as_view(),
+        name="enrollment-bulk-create",
+    ),
+    path("export", EnrollmentExportView.as_view(), name="enrollment-export"),
     path(
         "retrieve/<int:pk>",
         EnrollmentRetrieveView.as_view(),
@@ -45,11 +57,17 @@ enrollment_patterns = [
 ]
 
 progress_patterns = [
+    path("export", LessonProgressExportView.as_view(), name="lesson-progress-export"),
     path(
         "<int:enrollment_id>/completions/create",
         LessonProgressCreateView.as_view(),
         name="lesson-progress-create",
     ),
+    path(
+        "<int:enrollment_id>/completions/",
+        LessonProgressBatchCreateView.as_view(),
+        name="lesson-progress-batch",
+    ),
     path(
         "<int:enrollment_id>/completions/list",
         LessonProgressListView.as_view(),
@@ -6,19 +6,24 @@ from .course import (
     # CourseDeleteView,
 )
 from .enrollment import (
+    EnrollmentBulkCreateView,
     EnrollmentCreateView,
+    EnrollmentExportView,
     EnrollmentListView,
     EnrollmentRetrieveView,
 )
 from .lesson import (
     LessonCreateView,
     LessonDeleteView,
+    LessonIndexStatsView,
     LessonListView,
     LessonRetrieveView,
     LessonUpdateView,
 )
 from .progress import (
+    LessonProgressBatchCreateView,
     LessonProgressCreateView,
+    LessonProgressExportView,
     LessonProgressListView,
 )
 
@@ -33,9 +38,14 @@ __all__ = [
     "LessonRetrieveView",
     "LessonUpdateView",
     "LessonDeleteView",
+    "LessonIndexStatsView",
     "EnrollmentListView",
     "EnrollmentCreateView",
+    "EnrollmentBulkCreateView",
     "EnrollmentRetrieveView",
+    "EnrollmentExportView",
     "LessonProgressCreateView",
+    "LessonProgressBatchCreateView",
     "LessonProgressListView",
+    "LessonProgressExportView",
 ]
@@ -1,16 +1,19 @@
-from django.db.models import Q
+from django.db.models import Max, OuterRef, Q, Subquery
 from rest_framework.permissions import IsAuthenticated
 
+from apps.authentication.authentication import STATELESS_AUTHENTICATION_CLASSES
 from apps.authentication.models import UserTypeEnum
 from apps.authentication.perms.custom_perms import IsInstructor, IsInstructorOwner
+from base.models import count_subquery
 from base.views.generic_views import (
+    AsyncConditionalGetMixin,
+    AsyncCustomGenericListView,
+    AsyncCustomGenericRetrieveView,
     CustomGenericCreateView,
-    CustomGenericListView,
-    CustomGenericRetrieveView,
     CustomGenericUpdateView,
 )
 
-from ..models import Course, CourseStatusEnum
+from ..models import Course, CourseStatusEnum, Lesson
 from ..serializers import (
     CourseCreateSerializer,
     CourseDetailSerializer,
@@ -19,7 +22,7 @@ from ..serializers import (
 )
 
 
-class CourseListView(CustomGenericListView):
+class CourseListView(AsyncCustomGenericListView):
     """
     List all published courses for students.
     Instructors see all their own courses.
@@ -27,15 +30,17 @@ class CourseListView(CustomGenericListView):
 
     serializer_class = CourseListSerializer
     permission_classes = [IsAuthenticated]
+    authentication_classes = STATELESS_AUTHENTICATION_CLASSES
 
     def get_queryset(self):
         user = self.request.user
         if user.user_type == UserTypeEnum.INSTRUCTOR:
             # Instructors see their own courses
-            return Course.objects.filter(instructor=user)
+            queryset = Course.objects.filter(instructor_id=user.pk)
         else:
             # Students see only published courses
-            return Course.objects.filter(status=CourseStatusEnum.PUBLISHED)
+            queryset = Course.objects.filter(status=CourseStatusEnum.PUBLISHED)
+        return queryset.with_catalogue_fields().defer("description")
 
 
 class CourseCreateView(CustomGenericCreateView):
@@ -47,9 +52,11 @@ class CourseCreateView(CustomGenericCreateView):
     permission_classes = [IsAuthenticated, IsInstructor]
 
 
-class CourseRetrieveView(CustomGenericRetrieveView):
+class CourseRetrieveView(AsyncConditionalGetMixin, AsyncCustomGenericRetrieveView):
     """
     Retrieve course details.
+    Conditional GETs are answered with 304 while neither the course, its
+    instructor nor any of its lessons (soft-deleted included) changed.
     """
 
     serializer_class = CourseDetailSerializer
@@ -58,9 +65,38 @@ class CourseRetrieveView(CustomGenericRetrieveView):
     def get_queryset(self):
         user = self.request.user
         if user.user_type == UserTypeEnum.INSTRUCTOR:
-            return Course.objects.filter(instructor=user)
+            queryset = Course.objects.filter(instructor=user)
         else:
-            return Course.objects.filter(status=CourseStatusEnum.PUBLISHED)
+            queryset = Course.objects.filter(status=CourseStatusEnum.PUBLISHED)
+        return queryset.with_catalogue_fields().prefetch_related("lessons")
+
+    async def aget_validator(self):
+        lessons = Lesson.all_objects.filter(course_id=OuterRef("pk")).order_by()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        # a single query, None (answered unconditionally) for hidden courses
+        return await (
+            self.get_queryset()
+            .filter(pk=self.kwargs[lookup_url_kwarg])
+            .annotate(
+                lessons_modified=Subquery(
+                    lessons.values("course_id")
+                    .annotate(last_modified=Max("updated_at"))
+                    .values("last_modified")
+                ),
+                lessons_total=count_subquery(lessons, "course_id"),
+                lessons_live=count_subquery(
+                    lessons.filter(deleted_at__isnull=True), "course_id"
+                ),
+            )
+            .values_list(
+                "updated_at",
+                "instructor__updated_at",
+                "lessons_modified",
+                "lessons_total",
+                "lessons_live",
+            )
+            .afirst()
+        )
 
 
 class CourseUpdateView(CustomGenericUpdateView):
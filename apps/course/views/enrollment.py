@@ -1,34 +1,74 @@
-from rest_framework import generics, permissions
+from rest_framework import generics, permissions, status
 
+from apps.authentication.authentication import STATELESS_AUTHENTICATION_CLASSES
 from apps.authentication.models import UserTypeEnum
-from apps.authentication.perms.custom_perms import IsStudent
+from apps.authentication.perms.custom_perms import IsInstructorOrAdmin, IsStudent
+from base.views.generic_views import (
+    AsyncGenericAPIView,
+    AsyncListModelMixin,
+    AsyncRetrieveModelMixin,
+    CustomCursorPagination,
+    CustomGenericCreateView,
+    StreamingExportMixin,
+)
 
 from ..models import Enrollment
 from ..serializers import (
+    EnrollmentBulkCreateSerializer,
     EnrollmentCreateSerializer,
     EnrollmentDetailSerializer,
     EnrollmentListSerializer,
 )
 
 
-class EnrollmentListView(generics.ListAPIView):
-    """
-    List all enrollments for the current student.
-    """
-
+class EnrollmentListQuerysetMixin:
     serializer_class = EnrollmentListSerializer
     permission_classes = [permissions.IsAuthenticated]
+    authentication_classes = STATELESS_AUTHENTICATION_CLASSES
+    pagination_class = CustomCursorPagination
 
     def get_queryset(self):
         user = self.request.user
         if user.user_type == UserTypeEnum.STUDENT:
-            return Enrollment.objects.filter(student=user)
+            return Enrollment.objects.filter(student_id=user.pk).with_progress()
         elif user.user_type == UserTypeEnum.INSTRUCTOR:
             # Instructors can see enrollments in their courses
-            return Enrollment.objects.filter(course__instructor=user)
+            return Enrollment.objects.filter(
+                course__instructor_id=user.pk
+            ).with_progress()
         return Enrollment.objects.none()
 
 
+class EnrollmentListView(
+    EnrollmentListQuerysetMixin, AsyncListModelMixin, AsyncGenericAPIView
+):
+    """
+    List all enrollments for the current student.
+    """
+
+
+class EnrollmentExportView(
+    StreamingExportMixin, EnrollmentListQuerysetMixin, generics.ListAPIView
+):
+    """
+    Stream every enrollment visible in the enrollment list as CSV or NDJSON.
+    """
+
+    export_filename = "enrollments"
+    export_fields = {
+        "id": "id",
+        "student": "student_id",
+        "student_name": "student_name",
+        "course": "course_id",
+        "course_title": "course_title",
+        "is_completed": "is_completed",
+        "completed_at": "completed_at",
+        "total_lessons": "total_lessons",
+        "completed_lessons_count": "completed_lessons_count",
+        "created_at": "created_at",
+    }
+
+
 class EnrollmentCreateView(generics.CreateAPIView):
     """
     Enroll in a course (Students only).
@@ -38,7 +78,19 @@ class EnrollmentCreateView(generics.CreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsStudent]
 
 
-class EnrollmentRetrieveView(generics.RetrieveAPIView):
+class EnrollmentBulkCreateView(CustomGenericCreateView):
+    """
+    Enroll a cohort of students in a course (course instructor or admins),
+    reporting how many enrollments were created and skipped.
+    """
+
+    serializer_class = EnrollmentBulkCreateSerializer
+    permission_classes = [IsInstructorOrAdmin]
+    success_response_message = "Cohort enrollment processed."
+    success_status_code = status.HTTP_200_OK
+
+
+class EnrollmentRetrieveView(AsyncRetrieveModelMixin, AsyncGenericAPIView):
     """
     Retrieve enrollment details with progress information.
     """
@@ -49,7 +101,9 @@ class EnrollmentRetrieveView(generics.RetrieveAPIView):
     def get_queryset(self):
         user = self.request.user
         if user.user_type == UserTypeEnum.STUDENT:
-            return Enrollment.objects.filter(student=user)
+            queryset = Enrollment.objects.filter(student=user)
         elif user.user_type == UserTypeEnum.INSTRUCTOR:
-            return Enrollment.objects.filter(course__instructor=user)
-        return Enrollment.objects.none()
+            queryset = Enrollment.objects.filter(course__instructor=user)
+        else:
+            return Enrollment.objects.none()
+        return queryset.with_progress().with_completed_lesson_ids()
@@ -1,14 +1,23 @@
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
 
-from apps.authentication.perms.custom_perms import IsInstructor, IsLessonInstructorOwner
+from apps.authentication.authentication import STATELESS_AUTHENTICATION_CLASSES
+from apps.authentication.perms.custom_perms import (
+    IsAdmin,
+    IsInstructor,
+    IsLessonInstructorOwner,
+)
 from base.views.generic_views import (
+    AsyncConditionalGetMixin,
+    AsyncCustomGenericListView,
+    AsyncCustomGenericRetrieveView,
     CustomGenericCreateView,
-    CustomGenericListView,
-    CustomGenericRetrieveView,
     CustomGenericUpdateView,
 )
+from base.views.views import CustomAPIResponse
 
+from ..lesson_index import stats as lesson_index_stats
 from ..models import Lesson
 from ..serializers import (
     LessonCreateSerializer,
@@ -18,18 +27,24 @@ from ..serializers import (
 )
 
 
-class LessonListView(CustomGenericListView):
+class LessonListView(AsyncConditionalGetMixin, AsyncCustomGenericListView):
     """
     List all lessons for a course.
+    Conditional GETs are answered with 304 while no lesson of the course
+    (soft-deleted included) changed.
     """
 
     serializer_class = LessonListSerializer
     permission_classes = [IsAuthenticated]
+    authentication_classes = STATELESS_AUTHENTICATION_CLASSES
 
     def get_queryset(self):
         course_id = self.kwargs.get("course_id")
         return Lesson.objects.filter(course_id=course_id).order_by("order")
 
+    def get_validator_queryset(self):
+        return Lesson.all_objects.filter(course_id=self.kwargs.get("course_id"))
+
 
 class LessonCreateView(CustomGenericCreateView):
     """
@@ -40,13 +55,13 @@ class LessonCreateView(CustomGenericCreateView):
     permission_classes = [IsInstructor]
 
 
-class LessonRetrieveView(CustomGenericRetrieveView):
+class LessonRetrieveView(AsyncCustomGenericRetrieveView):
     """
     Retrieve lesson details.
     """
 
     serializer_class = LessonDetailSerializer
-    queryset = Lesson.objects.all()
+    queryset = Lesson.objects.select_related("course")
 
 
 class LessonUpdateView(CustomGenericUpdateView):
@@ -70,3 +85,17 @@ class LessonDeleteView(generics.DestroyAPIView):
 
     def get_queryset(self):
         return Lesson.objects.filter(course__instructor=self.request.user)
+
+
+class LessonIndexStatsView(APIView):
+    """
+    Hit/miss counters of the cached lesson order index for this worker process.
+    """
+
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        return CustomAPIResponse.custom_success_response(
+            data=lesson_index_stats.as_dict(),
+            message="Lesson index cache stats retrieved successfully.",
+        )
@@ -1,11 +1,17 @@
+from rest_framework import generics, permissions, status
+
+from apps.authentication.models import UserTypeEnum
 from apps.authentication.perms.custom_perms import IsStudent
 from base.views.generic_views import (
+    CustomCursorPagination,
     CustomGenericCreateView,
     CustomGenericListView,
+    StreamingExportMixin,
 )
 
 from ..models import Enrollment, Progress
 from ..serializers import (
+    LessonCompletionBatchSerializer,
     LessonCompletionCreateSerializer,
     LessonCompletionListSerializer,
 )
@@ -34,6 +40,17 @@ class LessonProgressCreateView(CustomGenericCreateView):
         return context
 
 
+class LessonProgressBatchCreateView(LessonProgressCreateView):
+    """
+    Mark an ordered list of lessons as completed in one request (Students
+    only), reporting an outcome per lesson.
+    """
+
+    serializer_class = LessonCompletionBatchSerializer
+    success_response_message = "Lesson completions processed."
+    success_status_code = status.HTTP_200_OK
+
+
 class LessonProgressListView(CustomGenericListView):
     """
     List all completed lessons for an enrollment.
@@ -41,9 +58,40 @@ class LessonProgressListView(CustomGenericListView):
 
     serializer_class = LessonCompletionListSerializer
     permission_classes = [IsStudent]
+    pagination_class = CustomCursorPagination
 
     def get_queryset(self):
         enrollment_id = self.kwargs.get("enrollment_id")
         return Progress.objects.filter(
             enrollment_id=enrollment_id, enrollment__student=self.request.user
         )
+
+
+class LessonProgressExportView(StreamingExportMixin, generics.ListAPIView):
+    """
+    Stream lesson completions as CSV or NDJSON: a student's own, or every
+    completion in an instructor's courses. Filter with `?enrollment__course=`.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    filterset_fields = ["enrollment", "enrollment__course"]
+    export_filename = "lesson_progress"
+    export_fields = {
+        "id": "id",
+        "enrollment": "enrollment_id",
+        "student": "enrollment__student_id",
+        "student_name": "enrollment__student__full_name",
+        "course": "enrollment__course_id",
+        "lesson": "lesson_id",
+        "lesson_title": "lesson__title",
+        "lesson_order": "lesson__order",
+        "completed_at": "created_at",
+    }
+
+    def get_queryset(self):
+        user = self.request.user
+        if user.user_type == UserTypeEnum.STUDENT:
+            return Progress.objects.filter(enrollment__student_id=user.pk)
+        elif user.user_type == UserTypeEnum.INSTRUCTOR:
+            return Progress.objects.filter(enrollment__course__instructor_id=user.pk)
+        return Progress.objects.none()
@@ -1,6 +1,9 @@
 from django.urls import include, path
 
+from base.views.views import DatabasePoolStatsView
+
 urlpatterns = [
     path("auth_app/", include("apps.authentication.urls")),
     path("course_app/", include("apps.course.urls")),
+    path("db/pool", DatabasePoolStatsView.as_view(), name="db-pool-stats"),
 ]
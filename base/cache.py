@@ -0,0 +1,103 @@
+import functools
+import hashlib
+import time
+from contextlib import nullcontext
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from .db import primary
+
+TAG_VERSION_KEY = "cache_tag:{tag}"
+
+_MISSING = object()
+
+
+def _tag_versions(tags):
+    """
+    Current version token of every tag, creating tokens for unknown tags.
+    """
+    if not tags:
+        return []
+    keys = [TAG_VERSION_KEY.format(tag=tag) for tag in tags]
+    versions = cache.get_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        # a fresh token (never a reused counter) so an evicted tag can not
+        # resurrect values cached under an older version of it
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def make_tagged_key(key, tags=()):
+    """
+    Cache key for `key` bound to the current version of each tag.
+    Invalidating any of the tags makes the key unreachable.
+    """
+    if not tags:
+        return key
+    signature = ":".join(str(version) for version in _tag_versions(tags))
+    return f"{key}:{hashlib.md5(signature.encode()).hexdigest()}"
+
+
+def invalidate_tags(*tags):
+    cache.set_many(
+        {TAG_VERSION_KEY.format(tag=tag): time.time_ns() for tag in tags},
+        timeout=None,
+    )
+
+
+def get_or_set(key, default_fn, ttl=DEFAULT_TIMEOUT, tags=(), read_primary=True):
+    """
+    Cache-aside read: return the cached value for `key`, computing and
+    storing `default_fn()` on a miss. `None` results are cached as well.
+
+    `default_fn()` reads from the primary database unless `read_primary`
+    is false: a lagging replica would cache what an invalidation just
+    discarded until the value expires.
+    """
+    tagged_key = make_tagged_key(key, tags)
+    value = cache.get(tagged_key, _MISSING)
+    if value is _MISSING:
+        with primary() if read_primary else nullcontext():
+            value = default_fn()
+        cache.set(tagged_key, value, timeout=ttl)
+    return value
+
+
+def cached(key_fn, ttl=DEFAULT_TIMEOUT, tags=()):
+    """
+    Cache-aside decorator.
+
+    : key_fn: callable receiving the wrapped function's arguments and
+    returning the cache key, e.g. `lambda course_id: f"course:{course_id}"`.
+    : ttl: timeout in seconds; defaults to the CACHES timeout, `None` never expires.
+    : tags: iterable of tag names, or a callable receiving the wrapped
+    function's arguments and returning them. See `invalidate_tags`.
+
+        @cached(lambda user_id: f"user:{user_id}:roles", ttl=60, tags=["roles"])
+        def get_role_names(user_id): ...
+
+        invalidate_tags("roles")
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tag_names = tags(*args, **kwargs) if callable(tags) else tags
+            return get_or_set(
+                key_fn(*args, **kwargs),
+                lambda: func(*args, **kwargs),
+                ttl=ttl,
+                tags=tuple(tag_names),
+            )
+
+        def invalidate(*args, **kwargs):
+            tag_names = tags(*args, **kwargs) if callable(tags) else tags
+            cache.delete(make_tagged_key(key_fn(*args, **kwargs), tuple(tag_names)))
+
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
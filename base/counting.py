@@ -0,0 +1,87 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.db import connections
+
+from .cache import get_or_set
+
+EXACT = "exact"
+ESTIMATED = "estimated"
+
+
+class ExactCount:
+    """
+    Counting strategy for paginated list responses.
+    Called with the filtered queryset, returns `(count, EXACT | ESTIMATED)`.
+    """
+
+    def __call__(self, queryset):
+        return queryset.count(), EXACT
+
+
+class CachedExactCount(ExactCount):
+    """
+    Exact `COUNT(*)` cached per (database, SQL, params) for a short TTL.
+    """
+
+    def __init__(self, ttl=None):
+        self.ttl = settings.PAGINATION_COUNT_CACHE_TIMEOUT if ttl is None else ttl
+
+    def get_cache_key(self, queryset):
+        sql, params = queryset.order_by().query.sql_with_params()
+        signature = f"{queryset.db}:{sql}:{params!r}"
+        return f"pagination_count:{hashlib.md5(signature.encode()).hexdigest()}"
+
+    def __call__(self, queryset):
+        # counted where the page is read, a count only expires
+        count = get_or_set(
+            self.get_cache_key(queryset),
+            queryset.count,
+            ttl=self.ttl,
+            read_primary=False,
+        )
+        return count, EXACT
+
+
+class PlannerEstimateCount(CachedExactCount):
+    """
+    Planner row estimate for unfiltered querysets (only the default
+    manager's soft-delete condition) on PostgreSQL, when the estimate is at
+    least `threshold` rows. Filtered or small querysets, and other
+    databases, get a cached exact count.
+    """
+
+    def __init__(self, ttl=None, threshold=None):
+        super().__init__(ttl)
+        self.threshold = (
+            settings.PAGINATION_ESTIMATE_THRESHOLD if threshold is None else threshold
+        )
+
+    def is_unfiltered(self, queryset):
+        base_query = queryset.model._default_manager.all().query
+        # joins added by select_related() or annotations do not change the
+        # row count, filters and aggregates do
+        return (
+            queryset.query.where == base_query.where
+            and queryset.query.group_by is None
+            and not queryset.query.distinct
+        )
+
+    def get_estimate(self, queryset):
+        sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def __call__(self, queryset):
+        if connections[queryset.db].vendor == "postgresql" and self.is_unfiltered(
+            queryset
+        ):
+            estimate = self.get_estimate(queryset)
+            if estimate >= self.threshold:
+                return estimate, ESTIMATED
+        return super().__call__(queryset)
@@ -0,0 +1,202 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.functional import SimpleLazyObject
+from rest_framework.permissions import SAFE_METHODS
+
+PRIMARY_PIN_KEY = "db_primary_pin:{user_id}"
+
+_request_routing = ContextVar("request_routing", default=None)
+_forced_database = ContextVar("forced_database", default=None)
+
+
+def get_replica_alias():
+    """
+    A random replica of `DATABASE_REPLICAS`, the primary when there are none.
+    """
+    replicas = settings.DATABASE_REPLICAS
+    return random.choice(replicas) if replicas else DEFAULT_DB_ALIAS
+
+
+def on_replica(queryset):
+    """
+    `queryset` bound to a replica whatever the request, for analytics and
+    exports that can tolerate replication lag. Bound explicitly, so it
+    holds when the queryset is evaluated after the request, e.g. streamed.
+    """
+    return queryset.using(get_replica_alias())
+
+
+@contextmanager
+def use_database(alias):
+    """
+    Route every read in the block to `alias`, see `primary()` and `replica()`.
+    """
+    token = _forced_database.set(alias)
+    try:
+        yield alias
+    finally:
+        _forced_database.reset(token)
+
+
+def primary():
+    return use_database(DEFAULT_DB_ALIAS)
+
+
+def replica():
+    return use_database(get_replica_alias())
+
+
+def pin_to_primary(user_id):
+    cache.set(
+        PRIMARY_PIN_KEY.format(user_id=user_id),
+        True,
+        timeout=settings.DATABASE_REPLICA_PIN_SECONDS,
+    )
+
+
+def is_pinned_to_primary(user_id):
+    return cache.get(PRIMARY_PIN_KEY.format(user_id=user_id), False)
+
+
+class RequestRouting:
+    """
+    Where the reads of one request go, see `base.middleware`.
+
+    Safe-method requests read from one replica, unless the request wrote
+    or its user wrote in a request of the last `DATABASE_REPLICA_PIN_SECONDS`.
+    Any other request reads from the primary, so it sees its own writes.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.wrote = False
+        self._pinned = None
+        self._replica = None
+
+    def get_user(self):
+        """
+        The user DRF authenticated the request as, `None` until it has.
+        Django's lazy session user is left unevaluated: resolving it would
+        route its own queries.
+        """
+        user = self.request.__dict__.get("user")
+        if type(user) is SimpleLazyObject:
+            return None
+        return user
+
+    def is_pinned(self):
+        if self._pinned is None:
+            user = self.get_user()
+            if user is None:
+                # e.g. the user lookup of authentication, which must find
+                # users that just signed up
+                return True
+            self._pinned = user.is_authenticated and is_pinned_to_primary(user.pk)
+        return self._pinned
+
+    def db_for_read(self):
+        if self.wrote or self.request.method not in SAFE_METHODS or self.is_pinned():
+            return DEFAULT_DB_ALIAS
+        if self._replica is None:
+            # one replica per request, so its reads agree with each other
+            self._replica = get_replica_alias()
+        return self._replica
+
+    def finish(self):
+        user = self.get_user()
+        if self.wrote and user is not None and user.is_authenticated:
+            pin_to_primary(user.pk)
+
+
+@contextmanager
+def route_request(request):
+    routing = RequestRouting(request)
+    token = _request_routing.set(routing)
+    try:
+        yield routing
+    finally:
+        _request_routing.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Writes go to the primary. Reads go, in order of precedence:
+
+    - to the database of the instance they are related to,
+    - to the database of an enclosing `primary()` / `replica()` block,
+    - to the primary inside a transaction, which must read its own writes,
+    - where the current request's `RequestRouting` says,
+    - to the primary anywhere else (commands, shell, Celery tasks).
+    """
+
+    def db_for_read(self, model, **hints):
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+
+        forced = _forced_database.get()
+        if forced:
+            return forced
+
+        routing = _request_routing.get()
+        if (
+            routing is None
+            or not settings.DATABASE_REPLICAS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return routing.db_for_read()
+
+    def db_for_write(self, model, **hints):
+        routing = _request_routing.get()
+        if routing is not None:
+            routing.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replicas hold the primary's rows
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+
+def get_pool_stats(using=DEFAULT_DB_ALIAS):
+    """
+    Usage of this process' psycopg connection pool for `using`, or `None`
+    when the database is not pooled (see `DB_POOL`). The counters add up
+    from the time the pool was opened.
+
+    : in_use: connections lent out to requests right now.
+    : waiting: requests queued for a connection right now.
+    : wait_ms: total time requests spent queued; `avg_wait_ms` spreads it
+    over every request, `timeouts` counts the ones that gave up.
+    """
+    pool = getattr(connections[using], "pool", None)
+    if pool is None:
+        return None
+
+    stats = pool.get_stats()
+    requests = stats.get("requests_num", 0)
+    wait_ms = stats.get("requests_wait_ms", 0)
+    return {
+        "min_size": stats["pool_min"],
+        "max_size": stats["pool_max"],
+        "size": stats["pool_size"],
+        "available": stats["pool_available"],
+        "in_use": stats["pool_size"] - stats["pool_available"],
+        "waiting": stats["requests_waiting"],
+        "requests": requests,
+        "queued": stats.get("requests_queued", 0),
+        "timeouts": stats.get("requests_errors", 0),
+        "wait_ms": wait_ms,
+        "avg_wait_ms": round(wait_ms / requests, 2) if requests else 0,
+        "connections_opened": stats.get("connections_num", 0),
+        "connect_ms": stats.get("connections_ms", 0),
+        "connections_lost": stats.get("connections_lost", 0),
+    }
@@ -0,0 +1,30 @@
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.utils.decorators import sync_and_async_middleware
+
+from .db import route_request
+
+
+@sync_and_async_middleware
+def replica_routing_middleware(get_response):
+    """
+    Routes the reads of each request through a `base.db.RequestRouting`,
+    and pins users that wrote to the primary for the next requests. Sync
+    and async, so async views are not pushed back onto a thread.
+    """
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            with route_request(request) as routing:
+                response = await get_response(request)
+            await sync_to_async(routing.finish)()
+            return response
+
+    else:
+
+        def middleware(request):
+            with route_request(request) as routing:
+                response = get_response(request)
+            routing.finish()
+            return response
+
+    return middleware
@@ -3,6 +3,8 @@ import datetime
 # import nepali_datetime
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
+from django.db.models import Count, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 # def ad_to_bs_converter(ad_obj):
@@ -15,19 +17,40 @@ from django.utils import timezone
 #     return date_bs
 
 
+def count_subquery(queryset, outer_field):
+    """
+    Correlated `COUNT(*)` over `queryset` grouped by `outer_field`, usable in
+    `annotate()` / `update()` without a GROUP BY on the outer query.
+    `queryset` is expected to filter `outer_field` against an `OuterRef`.
+    """
+    counts = (
+        queryset.order_by()
+        .values(outer_field)
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
 class SoftDeleteQuerySet(models.QuerySet):
     def delete(self, hard=False):
         if hard:
             return super().delete()
         return self.update(deleted_at=timezone.now())
 
+    # keep `Manager.from_queryset()` from copying a bulk delete onto managers
+    delete.queryset_only = True
+
     def restore(self):
         return self.update(deleted_at=None)
 
 
 class SoftDeleteManager(models.Manager):
+    # overridden by `SoftDeleteManager.from_queryset(<SoftDeleteQuerySet subclass>)`
+    _queryset_class = SoftDeleteQuerySet
+
     def get_queryset(self):
-        return SoftDeleteQuerySet(self.model, using=self._db).filter(
+        return self._queryset_class(self.model, using=self._db).filter(
             deleted_at__isnull=True
         )
 
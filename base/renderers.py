@@ -0,0 +1,49 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # optional, install the "fast-json" extra
+    orjson = None
+
+# orjson never escapes these, DRF always does (strict javascript subset)
+_LINE_SEPARATOR = "\u2028".encode()
+_PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in `JSONRenderer` backed by orjson, producing the same bytes as the
+    stdlib renderer for compact output. Datetimes, decimals, lazy strings,
+    querysets etc. go through DRF's encoder, so they render exactly as
+    before; pretty-printed output and data orjson rejects (ints over 64 bit)
+    use the stdlib renderer.
+    Two float corner cases differ: magnitudes below 1e-4 are written
+    positionally (`0.00001`, not `1e-05`) and NaN/Infinity as `null`.
+    Without orjson installed this is the stdlib renderer.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def get_default(self):
+        return self.encoder_class().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.get_default(), option=self.options)
+        except (orjson.JSONEncodeError, ValueError):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if b"\xe2\x80" in ret:
+            ret = ret.replace(_LINE_SEPARATOR, b"\\u2028").replace(
+                _PARAGRAPH_SEPARATOR, b"\\u2029"
+            )
+        return ret
@@ -1,4 +1,7 @@
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
 
 
 class ExcludeFieldsForMain:
@@ -43,3 +46,69 @@ class BaseModelSerializer(serializers.ModelSerializer):
                 field_name: self.fields[field_name] for field_name in include_fields
             }
             self.fields = new_fields
+
+
+class AsyncSerializerMixin:
+    """
+    Validation and saving for async views. `ais_valid()` runs the field
+    validation of `is_valid()` in a thread, then awaits `avalidate()`;
+    `asave()` awaits `acreate()` / `aupdate()`. They default to the sync
+    hooks run in a thread, override them where the work should not hold a
+    thread (e.g. password hashing).
+    """
+
+    async def avalidate(self, attrs):
+        return await sync_to_async(self.validate)(attrs)
+
+    async def acreate(self, validated_data):
+        return await sync_to_async(self.create)(validated_data)
+
+    async def aupdate(self, instance, validated_data):
+        return await sync_to_async(self.update)(instance, validated_data)
+
+    def run_field_validation(self, data):
+        value = self.to_internal_value(data)
+        self.run_validators(value)
+        return value
+
+    async def ais_valid(self, *, raise_exception=False):
+        if not hasattr(self, "_validated_data"):
+            try:
+                value = await sync_to_async(self.run_field_validation)(
+                    self.initial_data
+                )
+                self._validated_data = await self.avalidate(value)
+            except (ValidationError, DjangoValidationError) as exc:
+                self._validated_data = {}
+                self._errors = serializers.as_serializer_error(exc)
+            else:
+                self._errors = {}
+
+        if self._errors and raise_exception:
+            raise ValidationError(self.errors)
+        return not bool(self._errors)
+
+    async def asave(self, **kwargs):
+        validated_data = {**self.validated_data, **kwargs}
+        if self.instance is not None:
+            self.instance = await self.aupdate(self.instance, validated_data)
+        else:
+            self.instance = await self.acreate(validated_data)
+        return self.instance
+
+
+class AnnotatedFieldMixin:
+    """
+    Read a value annotated on the queryset under the field's name and fall
+    back to the regular `source` lookup when the instance was not loaded
+    through the annotated queryset.
+    """
+
+    def get_attribute(self, instance):
+        if self.field_name in getattr(instance, "__dict__", {}):
+            return instance.__dict__[self.field_name]
+        return super().get_attribute(instance)
+
+
+class AnnotatedCharField(AnnotatedFieldMixin, serializers.CharField):
+    pass
@@ -1,16 +1,46 @@
+import base64
+import csv
+import datetime
+import hashlib
+import io
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    ValidationError,
+)
+from django.core.paginator import EmptyPage, InvalidPage, Page, PageNotAnInteger
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.db.models.query import ModelIterable
+from django.http import Http404, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status
+from rest_framework.exceptions import NotFound, ParseError
 from rest_framework.generics import (
     CreateAPIView,
+    GenericAPIView,
     ListAPIView,
     RetrieveAPIView,
     UpdateAPIView,
 )
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
-from .views import CustomAPIResponse
+from ..counting import PlannerEstimateCount
+from ..db import on_replica
+from .views import AsyncAPIView, CustomAPIResponse
 
 
 class CustomPagination(PageNumberPagination):
@@ -24,7 +54,112 @@ class CustomPagination(PageNumberPagination):
 
     page_query_param = "page"
 
+    # `?count=false` skips counting; total_count and total_pages are then null
+    count_query_param = "count"
+
+    # how total_count is computed, overridable per view with `count_strategy`
+    count_strategy = PlannerEstimateCount()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            if self.is_count_requested(request):
+                count_strategy = getattr(view, "count_strategy", self.count_strategy)
+                paginator.count, self.count_type = count_strategy(queryset)
+                self.page = paginator.page(page_number)
+            else:
+                self.count_type = None
+                self.page = self.get_uncounted_page(paginator, page_number)
+        except InvalidPage as exc:
+            raise self.get_invalid_page_error(page_number, exc)
+
+        return self.get_page_rows(paginator)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        `paginate_queryset()` for async views: the count strategy runs in a
+        thread and the page rows are read with async iteration.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        try:
+            if self.is_count_requested(request):
+                count_strategy = getattr(view, "count_strategy", self.count_strategy)
+                # counted before get_page_number(), which reads it for "last"
+                paginator.count, self.count_type = await sync_to_async(count_strategy)(
+                    queryset
+                )
+                page_number = self.get_page_number(request, paginator)
+                self.page = paginator.page(page_number)
+                self.page.object_list = [row async for row in self.page.object_list]
+            else:
+                self.count_type = None
+                # "last" needs a count, so it is rejected like any other word
+                page_number = request.query_params.get(self.page_query_param) or 1
+                number, offset, rows = self.get_uncounted_rows(paginator, page_number)
+                self.page = self.make_uncounted_page(
+                    paginator, number, offset, [row async for row in rows]
+                )
+        except InvalidPage as exc:
+            raise self.get_invalid_page_error(page_number, exc)
+
+        return self.get_page_rows(paginator)
+
+    def get_invalid_page_error(self, page_number, exc):
+        return NotFound(
+            self.invalid_page_message.format(page_number=page_number, message=str(exc))
+        )
+
+    def get_page_rows(self, paginator):
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        return list(self.page)
+
+    def is_count_requested(self, request):
+        value = request.query_params.get(self.count_query_param, "")
+        return value.lower() not in ("false", "0", "no")
+
+    def get_uncounted_page(self, paginator, page_number):
+        number, offset, rows = self.get_uncounted_rows(paginator, page_number)
+        return self.make_uncounted_page(paginator, number, offset, list(rows))
+
+    def get_uncounted_rows(self, paginator, page_number):
+        """
+        `(number, offset, rows)`, rows being the unevaluated slice of the
+        page plus one row telling whether a next page exists.
+        """
+        # paginator.validate_number() would count, and "last" needs a count
+        try:
+            number = int(page_number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger("That page number is not an integer")
+        if number < 1:
+            raise EmptyPage("That page number is less than 1")
+
+        offset = (number - 1) * paginator.per_page
+        return (
+            number,
+            offset,
+            paginator.object_list[offset : offset + paginator.per_page + 1],
+        )
+
+    def make_uncounted_page(self, paginator, number, offset, rows):
+        # a lower bound that makes has_next() true only if another row exists
+        paginator.count = offset + len(rows)
+        return Page(rows[: paginator.per_page], number, paginator)
+
     def get_paginated_response(self, data):
+        counted = self.count_type is not None
         return Response(
             {
                 "success": True,
@@ -32,9 +167,10 @@ class CustomPagination(PageNumberPagination):
                 "message": getattr(
                     self, "success_response_message", "Data retrieved successfully."
                 ),
-                "total_count": self.page.paginator.count,
+                "total_count": self.page.paginator.count if counted else None,
+                "count_type": self.count_type,
                 "current_count": len(data),
-                "total_pages": self.page.paginator.num_pages,
+                "total_pages": self.page.paginator.num_pages if counted else None,
                 "current_page": self.page.number,
                 "next": self.get_next_link(),
                 "previous": self.get_previous_link(),
@@ -43,6 +179,212 @@ class CustomPagination(PageNumberPagination):
         )
 
 
+class CursorJSONEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder truncates datetimes to milliseconds, which would
+    # break the equality half of the keyset comparison
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CustomCursorPagination(BasePagination):
+    """
+    Keyset pagination over the queryset's ordering, with `id` appended as a
+    tiebreaker (`-created_at, -id` by default). A page is fetched with a
+    WHERE on the previous page's boundary row instead of COUNT(*) and
+    OFFSET, so deep pages cost the same as the first one.
+
+    Works with `ordering` and `?ordering=`. Ordering fields must never hold
+    NULL, which the keyset comparison cannot place: non-nullable model
+    fields, annotations, or the `always_set_fields`. `created_at` and
+    `updated_at` are nullable in the schema only; `auto_now_add` / `auto_now`
+    fill them on every save and bulk_create. Opt in per view with
+    `pagination_class = CustomCursorPagination`.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "limit"
+    page_size = 50
+    max_page_size = 50
+    default_ordering = ("-created_at", "-id")
+    always_set_fields = ("created_at", "updated_at")
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        rows = self.get_page_queryset(queryset, request)
+        return self.set_page(list(rows))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        `paginate_queryset()` for async views, reading the page rows with
+        async iteration.
+        """
+        rows = self.get_page_queryset(queryset, request)
+        return self.set_page([row async for row in rows])
+
+    def get_page_queryset(self, queryset, request):
+        """
+        The page rows after the cursor, plus one telling whether more exist.
+        """
+        self.request = request
+        self.limit = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        self.cursor = self.decode_cursor(request)
+        self.reverse = bool(self.cursor and self.cursor["reverse"])
+        queryset = queryset.order_by(
+            *[
+                f"-{name}" if descending != self.reverse else name
+                for name, descending in self.ordering
+            ]
+        )
+        if self.cursor:
+            try:
+                queryset = queryset.filter(
+                    self.get_keyset_filter(self.cursor, self.reverse)
+                )
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+        return queryset[: self.limit + 1]
+
+    def set_page(self, rows):
+        has_more = len(rows) > self.limit
+        rows = rows[: self.limit]
+        if self.reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_ordering(self, queryset):
+        """
+        `[(name, descending), ...]` ending in a unique `id` tiebreaker.
+        """
+        ordering = []
+        for item in (
+            queryset.query.order_by
+            or queryset.model._meta.ordering
+            or self.default_ordering
+        ):
+            if not isinstance(item, str) or item == "?" or "__" in item:
+                raise ImproperlyConfigured(
+                    "CustomCursorPagination needs an ordering of field names."
+                )
+            name = item.lstrip("-")
+            try:
+                nullable = queryset.model._meta.get_field(name).null
+            except FieldDoesNotExist:
+                nullable = False  # annotations and "pk"
+            if nullable and name not in self.always_set_fields:
+                raise ImproperlyConfigured(
+                    f"CustomCursorPagination cannot order by the nullable "
+                    f"field '{name}'."
+                )
+            ordering.append((name, item.startswith("-")))
+
+        if not any(name in ("id", "pk") for name, _ in ordering):
+            ordering.append(("id", ordering[-1][1] if ordering else True))
+        return ordering
+
+    def get_keyset_filter(self, cursor, reverse):
+        """
+        Rows after the cursor position in the (possibly reversed) ordering:
+        `a > x OR (a = x AND b > y) OR ...` with per-field directions.
+        """
+        position = cursor["position"]
+        if len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        keyset_filter = Q()
+        for index, (name, descending) in enumerate(self.ordering):
+            lookup = "lt" if descending != reverse else "gt"
+            condition = Q(**{f"{name}__{lookup}": position[index]})
+            for (previous_name, _), value in zip(self.ordering[:index], position):
+                condition &= Q(**{previous_name: value})
+            keyset_filter |= condition
+        return keyset_filter
+
+    def get_position(self, row):
+        position = []
+        for name, _ in self.ordering:
+            try:
+                name = row._meta.get_field(name).attname
+            except FieldDoesNotExist:
+                pass  # annotations and "pk"
+            position.append(getattr(row, name))
+        return position
+
+    def encode_cursor(self, row, reverse):
+        cursor = json.dumps(
+            {"position": self.get_position(row), "reverse": reverse},
+            cls=CursorJSONEncoder,
+        )
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            base64.urlsafe_b64encode(cursor.encode()).decode(),
+        )
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            return {
+                "position": list(cursor["position"]),
+                "reverse": bool(cursor["reverse"]),
+            }
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(
+                self.request.build_absolute_uri(), self.cursor_query_param
+            )
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "success": True,
+                "message": getattr(
+                    self, "success_response_message", "Data retrieved successfully."
+                ),
+                "current_count": len(data),
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "data": data,
+            }
+        )
+
+    def get_results(self, data):
+        return data["data"]
+
+
 class FilteringOrderingPaginationMixin:
     # Mixin to add filtering, ordering, and pagination to a view.
 
@@ -69,7 +411,232 @@ class CustomErrorMessage:
         return None
 
 
-class CustomGenericListView(FilteringOrderingPaginationMixin, ListAPIView):
+class ConditionalGetMixin:
+    """
+    Answers `If-None-Match` / `If-Modified-Since` GETs with 304 Not Modified
+    from a cheap validator, before the view's queryset is read or serialized.
+
+    By default the validator is one aggregate over `get_validator_queryset()`,
+    which should include soft-deleted rows: the newest `updated_at` plus the
+    total and live row counts, so edits, soft and hard deletes and restores
+    all change the ETag. `Last-Modified` is the newest datetime of the
+    validator; it cannot see deletes that leave every `updated_at` as it was,
+    which is why `If-None-Match` takes precedence.
+    """
+
+    def get_validator_queryset(self):
+        return None
+
+    def get_validator(self):
+        """
+        Tuple of values that change whenever the response would, or None to
+        answer unconditionally.
+        """
+        queryset = self.get_validator_queryset()
+        if queryset is None:
+            return None
+        return tuple(queryset.aggregate(**self.get_validator_aggregates()).values())
+
+    def get_validator_aggregates(self):
+        return {
+            "last_modified": Max("updated_at"),
+            "total": Count("pk"),
+            "live": Count("pk", filter=Q(deleted_at__isnull=True)),
+        }
+
+    def get_validator_headers(self, request, validator):
+        """
+        `(etag, last_modified)` of a validator.
+        """
+        # weak: the body carries a per-second meta_data timestamp
+        signature = repr((validator, request.accepted_media_type))
+        etag = f'W/"{hashlib.md5(signature.encode()).hexdigest()}"'
+        timestamps = [
+            value for value in validator if isinstance(value, datetime.datetime)
+        ]
+        last_modified = int(max(timestamps).timestamp()) if timestamps else None
+        return etag, last_modified
+
+    def set_validator_headers(self, response, etag, last_modified):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def get(self, request, *args, **kwargs):
+        validator = self.get_validator()
+        if validator is None:
+            return super().get(request, *args, **kwargs)
+
+        etag, last_modified = self.get_validator_headers(request, validator)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+        return self.set_validator_headers(response, etag, last_modified)
+
+
+class AsyncConditionalGetMixin(ConditionalGetMixin):
+    """
+    `ConditionalGetMixin` for async views, with the validator read through
+    the async ORM; override `aget_validator()` instead of `get_validator()`.
+    """
+
+    async def aget_validator(self):
+        queryset = self.get_validator_queryset()
+        if queryset is None:
+            return None
+        stats = await queryset.aaggregate(**self.get_validator_aggregates())
+        return tuple(stats.values())
+
+    async def get(self, request, *args, **kwargs):
+        # the view's own get(), not the sync one of ConditionalGetMixin
+        view_get = super(ConditionalGetMixin, self).get
+        validator = await self.aget_validator()
+        if validator is None:
+            return await view_get(request, *args, **kwargs)
+
+        etag, last_modified = self.get_validator_headers(request, validator)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = await view_get(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+        return self.set_validator_headers(response, etag, last_modified)
+
+
+class SparseFieldsetMixin:
+    """
+    `?fields=a,b` keeps only the listed serializer fields, `?omit=c,d` drops
+    the listed ones. The queryset then loads only the columns the remaining
+    fields read (`.only()`), so dropped columns are never fetched.
+
+    Columns are only restricted when every remaining field reads a model
+    field, a relation or an annotation: a `SerializerMethodField` or a
+    property may read any attribute, so with one of those the response is
+    trimmed but every column is still loaded.
+    """
+
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def get_sparse_fieldset(self):
+        """
+        `(kept field names, all serializer fields)`, or None when the
+        request asks for no trimming.
+        """
+        if not hasattr(self, "_sparse_fieldset"):
+            self._sparse_fieldset = self._parse_sparse_fieldset()
+        return self._sparse_fieldset
+
+    def _parse_sparse_fieldset(self):
+        request = getattr(self, "request", None)
+        if request is None or request.method not in ("GET", "HEAD"):
+            return None
+        requested = self._split_param(request, self.fields_query_param)
+        omitted = self._split_param(request, self.omit_query_param)
+        if not requested and not omitted:
+            return None
+
+        fields = self.get_serializer_class()(
+            context=self.get_serializer_context()
+        ).fields
+        unknown = [name for name in requested + omitted if name not in fields]
+        if unknown:
+            raise ParseError(f"Unknown field(s): {', '.join(unknown)}.")
+        kept = [
+            name
+            for name in fields
+            if (not requested or name in requested) and name not in omitted
+        ]
+        return kept, fields
+
+    @staticmethod
+    def _split_param(request, param):
+        value = request.query_params.get(param, "")
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        sparse_fieldset = self.get_sparse_fieldset()
+        if sparse_fieldset is not None:
+            kept = sparse_fieldset[0]
+            fields = getattr(serializer, "child", serializer).fields
+            for name in list(fields):
+                if name not in kept:
+                    fields.pop(name)
+        return serializer
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        sparse_fieldset = self.get_sparse_fieldset()
+        if sparse_fieldset is None or queryset._iterable_class is not ModelIterable:
+            return queryset
+        columns = self.get_sparse_columns(queryset, *sparse_fieldset)
+        return queryset if columns is None else queryset.only(*columns)
+
+    def get_sparse_columns(self, queryset, kept, fields):
+        """
+        Model fields to load for the kept serializer fields, or None when
+        a kept field may read any attribute.
+        """
+        opts = queryset.model._meta
+        columns = {opts.pk.name}
+        for name in kept:
+            field_columns = self.get_field_columns(fields[name], queryset)
+            if field_columns is None:
+                return None
+            columns |= field_columns
+
+        # ordering fields are read back by the cursor pagination, and
+        # select_related() cannot follow a deferred foreign key
+        query = queryset.query
+        ordering = query.order_by or (query.default_ordering and opts.ordering) or ()
+        related = query.select_related
+        if related is True:
+            related = [f.name for f in opts.concrete_fields if f.is_relation]
+        for lookup in [*ordering, *(related or ())]:
+            if isinstance(lookup, str):
+                model_field = self._get_model_field(opts, lookup.lstrip("-"))
+                if model_field is not None and model_field.concrete:
+                    columns.add(model_field.name)
+        return columns
+
+    def get_field_columns(self, field, queryset):
+        """
+        Model fields one serializer field reads: empty for annotations and
+        reverse or many-to-many relations, None when unknown.
+        """
+        if field.field_name in queryset.query.annotations:
+            return set()
+        if field.source == "*":
+            return None
+        model_field = self._get_model_field(queryset.model._meta, field.source_attrs[0])
+        if model_field is None:
+            return None
+        if model_field.concrete and not model_field.many_to_many:
+            return {model_field.name}
+        return set()
+
+    @staticmethod
+    def _get_model_field(opts, lookup):
+        name = lookup.split("__")[0]
+        if name == "pk":
+            return opts.pk
+        try:
+            return opts.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+
+class CustomGenericListView(
+    SparseFieldsetMixin, FilteringOrderingPaginationMixin, ListAPIView
+):
     request_action = "list"
     success_response_message = "Data retrieved successfully."
 
@@ -83,8 +650,182 @@ class CustomGenericListView(FilteringOrderingPaginationMixin, ListAPIView):
         return super().list(request, *args, **kwargs)
 
 
+class AsyncGenericAPIView(AsyncAPIView, GenericAPIView):
+    """
+    GenericAPIView for async handlers. Querysets are built and filtered in a
+    thread (filter backends and `get_queryset()` may touch the database),
+    rows are read with the async ORM. Serializers run on the event loop, so
+    everything they read must be loaded by the queryset (annotations,
+    `select_related()`, `prefetch_related()`).
+    """
+
+    async def aget_queryset(self):
+        """`filter_queryset(get_queryset())`, built in a thread."""
+        return await sync_to_async(lambda: self.filter_queryset(self.get_queryset()))()
+
+    async def aget_object(self):
+        queryset = await self.aget_queryset()
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        assert lookup_url_kwarg in self.kwargs, (
+            "Expected view %s to be called with a URL keyword argument "
+            'named "%s". Fix your URL conf, or set the `.lookup_field` '
+            "attribute on the view correctly."
+            % (self.__class__.__name__, lookup_url_kwarg)
+        )
+        filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        try:
+            obj = await queryset.aget(**filter_kwargs)
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+
+        await sync_to_async(self.check_object_permissions)(self.request, obj)
+        return obj
+
+    async def apaginate_queryset(self, queryset):
+        if self.paginator is None:
+            return None
+        apaginate = getattr(self.paginator, "apaginate_queryset", None)
+        if apaginate is None:
+            return await sync_to_async(self.paginator.paginate_queryset)(
+                queryset, self.request, view=self
+            )
+        return await apaginate(queryset, self.request, view=self)
+
+
+class AsyncListModelMixin:
+    async def get(self, request, *args, **kwargs):
+        return await self.alist(request, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = await self.aget_queryset()
+
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer([row async for row in queryset], many=True)
+        return Response(serializer.data)
+
+
+class AsyncRetrieveModelMixin:
+    async def get(self, request, *args, **kwargs):
+        return await self.aretrieve(request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+
+
+class AsyncCustomGenericListView(
+    SparseFieldsetMixin,
+    FilteringOrderingPaginationMixin,
+    AsyncListModelMixin,
+    AsyncGenericAPIView,
+):
+    """
+    Async `CustomGenericListView`.
+    """
+
+    request_action = "list"
+    success_response_message = "Data retrieved successfully."
+
+    async def alist(self, request, *args, **kwargs):
+        if self.paginator is not None:
+            self.paginator.success_response_message = self.success_response_message
+        return await super().alist(request, *args, **kwargs)
+
+
+class AsyncCustomGenericRetrieveView(
+    SparseFieldsetMixin, AsyncRetrieveModelMixin, AsyncGenericAPIView
+):
+    """
+    Async `CustomGenericRetrieveView`.
+    """
+
+    success_response_message = "Data retrieved successfully."
+
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance)
+        return CustomAPIResponse.custom_success_response(
+            data=serializer.data, message=self.success_response_message
+        )
+
+
+class StreamingExportMixin:
+    """
+    Streams `filter_queryset(get_queryset())` as CSV or NDJSON
+    (`?export_format=csv|ndjson`), so exports keep the view's scoping.
+
+    Rows are read with `values_list(...).iterator()` (a server-side cursor on
+    PostgreSQL) and written out chunk by chunk, keeping memory constant
+    however many rows are exported.
+
+    : export_fields: dict of output column name -> queryset field or annotation.
+    """
+
+    export_fields = {}
+    export_filename = "export"
+    export_format_query_param = "export_format"
+    export_chunk_size = settings.EXPORT_CHUNK_SIZE
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.query_params.get(self.export_format_query_param, "csv")
+        if export_format == "csv":
+            content_type, stream = "text/csv", self.stream_csv
+        elif export_format == "ndjson":
+            content_type, stream = "application/x-ndjson", self.stream_ndjson
+        else:
+            return CustomAPIResponse.custom_error_response(
+                message="Export format must be either 'csv' or 'ndjson'."
+            )
+
+        # exports tolerate replication lag, keep their long scans off the primary
+        rows = (
+            on_replica(self.filter_queryset(self.get_queryset()))
+            .values_list(*self.export_fields.values())
+            .iterator(chunk_size=self.export_chunk_size)
+        )
+        response = StreamingHttpResponse(stream(rows), content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.export_filename}.{export_format}"'
+        )
+        return response
+
+    def stream_csv(self, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.export_fields.keys())
+        for count, row in enumerate(rows, start=1):
+            writer.writerow(row)
+            if count % self.export_chunk_size == 0:
+                yield self._drain(buffer)
+        yield self._drain(buffer)
+
+    def stream_ndjson(self, rows):
+        columns = list(self.export_fields.keys())
+        buffer = io.StringIO()
+        for count, row in enumerate(rows, start=1):
+            buffer.write(json.dumps(dict(zip(columns, row)), cls=DjangoJSONEncoder))
+            buffer.write("\n")
+            if count % self.export_chunk_size == 0:
+                yield self._drain(buffer)
+        yield self._drain(buffer)
+
+    @staticmethod
+    def _drain(buffer):
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return value
+
+
 class CustomGenericCreateView(CreateAPIView, CustomErrorMessage):
     success_response_message = "Data created successfully."
+    success_status_code = status.HTTP_201_CREATED
 
     @transaction.atomic
     def create(self, request, *args, **kwargs):
@@ -104,7 +845,7 @@ class CustomGenericCreateView(CreateAPIView, CustomErrorMessage):
         return CustomAPIResponse.custom_success_response(
             data=serializer.data,
             message=self.success_response_message,
-            status_code=status.HTTP_201_CREATED,
+            status_code=self.success_status_code,
         )
 
 
@@ -135,7 +876,7 @@ class CustomGenericUpdateView(UpdateAPIView, CustomErrorMessage):
         )
 
 
-class CustomGenericRetrieveView(RetrieveAPIView):
+class CustomGenericRetrieveView(SparseFieldsetMixin, RetrieveAPIView):
     success_response_message = "Data retrieved successfully."
 
     def retrieve(self, request, *args, **kwargs):
@@ -1,5 +1,8 @@
+import inspect
+import time
 from datetime import datetime
 
+from asgiref.sync import sync_to_async
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
@@ -10,6 +13,26 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 
+from apps.authentication.perms.custom_perms import IsAdmin
+
+from ..db import get_pool_stats
+
+_meta_timestamp = (None, "")
+
+
+def get_meta_timestamp():
+    """
+    `meta_data` timestamp of the current second, formatted once per second.
+    """
+    global _meta_timestamp
+    second = int(time.time())
+    if _meta_timestamp[0] != second:
+        _meta_timestamp = (
+            second,
+            datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+    return _meta_timestamp[1]
+
 
 class CustomAPIResponse:
     # this is custom api response for success and error used in both API VIew and generic viewsets
@@ -18,9 +41,8 @@ class CustomAPIResponse:
     def custom_success_response(
         data=None, message="Success", detail=None, status_code=status.HTTP_200_OK
     ):
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         meta_data = {
-            "timestamp": now,
+            "timestamp": get_meta_timestamp(),
         }
         response = {
             "success": True,
@@ -38,9 +60,8 @@ class CustomAPIResponse:
         status_code=status.HTTP_400_BAD_REQUEST,
         detail=None,
     ):
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         meta_data = {
-            "timestamp": now,
+            "timestamp": get_meta_timestamp(),
         }
         response = {
             "success": False,
@@ -62,3 +83,60 @@ class BaseAPIView(CustomAPIResponse, APIView):
                 message="Validation failed.", errors=response.data
             )
         return response
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView with coroutine handlers, which Django runs on the event loop
+    under ASGI instead of the one thread it funnels sync views through.
+    Authentication, permission and throttle checks may query the database
+    and run in a thread; handlers use the async ORM.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        # rendered here, on the event loop, rather than by the handler in the
+        # thread shared by sync views
+        if hasattr(self.response, "render"):
+            self.response.render()
+        return self.response
+
+
+class DatabasePoolStatsView(BaseAPIView):
+    """
+    Connection pool usage of the process serving the request, see
+    `base.db.get_pool_stats`. Every worker process has its own pool.
+    """
+
+    permission_classes = [IsAdmin]
+
+    def get(self, request, *args, **kwargs):
+        stats = get_pool_stats()
+        if stats is None:
+            return self.custom_success_response(
+                message="Connection pooling is disabled."
+            )
+        return self.custom_success_response(data=stats)
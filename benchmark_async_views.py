@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark the async course list against its sync counterpart under ASGI.
+Drives Django's ASGI handler in-process with 1 to 32 concurrent clients, so
+the sync view goes through the same `sync_to_async(thread_sensitive=True)`
+funnel as under uvicorn, and reports requests per second and p95 latency
+per concurrency level. `latency_ms` adds a simulated database round trip to
+every query.
+
+    python benchmark_async_views.py [email_address] [requests] [latency_ms]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "e_learning_backend.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.core.handlers.asgi import ASGIHandler  # noqa: E402
+from django.db.backends.signals import connection_created  # noqa: E402
+from django.urls import path  # noqa: E402
+
+from apps.authentication.tokens import refresh_token_for_user  # noqa: E402
+from apps.course.views import CourseListView  # noqa: E402
+from base.views.generic_views import CustomGenericListView  # noqa: E402
+
+CONCURRENCY = (1, 8, 32)
+
+email_address = sys.argv[1] if len(sys.argv) > 1 else "seqtest@test.com"
+total_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 640
+latency = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.0
+
+
+def simulate_round_trip(execute, sql, params, many, context):
+    time.sleep(latency)
+    return execute(sql, params, many, context)
+
+
+def add_latency(sender, connection, **kwargs):
+    connection.execute_wrappers.append(simulate_round_trip)
+
+
+if latency:
+    # every thread opens its own connection, wrap each as it is created
+    connection_created.connect(add_latency)
+
+
+class SyncCourseListView(CustomGenericListView):
+    """The course list as it was before moving to the async views."""
+
+    serializer_class = CourseListView.serializer_class
+    permission_classes = CourseListView.permission_classes
+    authentication_classes = CourseListView.authentication_classes
+    get_queryset = CourseListView.get_queryset
+
+
+urlpatterns = [
+    path("sync", SyncCourseListView.as_view()),
+    path("async", CourseListView.as_view()),
+]
+settings.ROOT_URLCONF = __name__
+
+user = get_user_model().objects.get(email_address=email_address)
+authorization = f"Bearer {refresh_token_for_user(user).access_token}".encode()
+handler = ASGIHandler()
+
+
+async def request(url):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": url,
+        "raw_path": url.encode(),
+        "query_string": b"limit=20",
+        "root_path": "",
+        "headers": [(b"host", b"localhost"), (b"authorization", authorization)],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 80),
+    }
+    messages = []
+    body_sent = asyncio.Event()
+
+    async def receive():
+        # the body once, then no disconnect until the handler is done
+        if body_sent.is_set():
+            await asyncio.Future()
+        body_sent.set()
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    start = time.perf_counter()
+    await handler(scope, receive, send)
+    assert messages[0]["status"] == 200, messages
+    return time.perf_counter() - start
+
+
+async def run(url, concurrency):
+    per_client = total_requests // concurrency
+
+    async def client():
+        return [await request(url) for _ in range(per_client)]
+
+    # warm up connections and caches before measuring
+    await request(url)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies = sorted(t for timings in results for t in timings)
+    p95 = statistics.quantiles(latencies, n=20)[-1] * 1000
+    return len(latencies) / elapsed, p95
+
+
+print(
+    f"{total_requests} requests per run as {email_address}, "
+    f"{latency * 1000:.0f}ms simulated query latency\n"
+)
+print(f"{'view':<8}{'clients':>8}{'req/s':>10}{'p95 ms':>10}")
+for label in ("sync", "async"):
+    for concurrency in CONCURRENCY:
+        rps, p95 = asyncio.run(run(f"/{label}", concurrency))
+        print(f"{label:<8}{concurrency:>8}{rps:>10.1f}{p95:>10.1f}")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark conditional GETs on the course detail.
+Serves CourseRetrieveView in-process, once unconditionally (full query and
+serialization) and once with the `If-None-Match` of the previous response
+(validator query, 304), and reports requests per second and queries per
+request for each.
+
+    python benchmark_conditional_get.py [email_address] [course_id] [requests]
+"""
+
+import os
+import sys
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "e_learning_backend.settings")
+django.setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from rest_framework.test import APIRequestFactory, force_authenticate  # noqa: E402
+
+from apps.course.models import Course  # noqa: E402
+from apps.course.views import CourseRetrieveView  # noqa: E402
+
+email_address = sys.argv[1] if len(sys.argv) > 1 else "seqtest@test.com"
+user = get_user_model().objects.get(email_address=email_address)
+if len(sys.argv) > 2:
+    course = Course.objects.get(pk=sys.argv[2])
+else:
+    course = Course.objects.filter(instructor=user).first() or Course.objects.first()
+total_requests = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+
+factory = APIRequestFactory()
+view = CourseRetrieveView.as_view()
+path = f"/api/v1/course_app/courses/retrieve/{course.pk}"
+
+
+def request(**headers):
+    http_request = factory.get(path, **headers)
+    force_authenticate(http_request, user=user)
+    response = view(http_request, pk=course.pk)
+    if hasattr(response, "render"):
+        response.render()
+    return response
+
+
+def run(expected_status, **headers):
+    # warm up caches before measuring
+    request(**headers)
+
+    with CaptureQueriesContext(connection) as ctx:
+        request(**headers)
+    queries = len(ctx.captured_queries)
+
+    start = time.perf_counter()
+    for _ in range(total_requests):
+        response = request(**headers)
+        assert response.status_code == expected_status, response.status_code
+    elapsed = time.perf_counter() - start
+    return total_requests / elapsed, queries
+
+
+etag = request()["ETag"]
+print(
+    f"{total_requests} requests per variant, course {course.pk} "
+    f"({course.lessons.count()} lessons) as {email_address}\n"
+)
+print(f"{'variant':<16}{'status':>8}{'req/s':>10}{'queries':>10}")
+for label, expected_status, headers in (
+    ("unconditional", 200, {}),
+    ("If-None-Match", 304, {"HTTP_IF_NONE_MATCH": etag}),
+):
+    rps, queries = run(expected_status, **headers)
+    print(f"{label:<16}{expected_status:>8}{rps:>10.1f}{queries:>10}")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark the orjson renderer against DRF's stdlib JSONRenderer.
+Renders the response envelope of a 50-item LessonListSerializer page with
+both, checks the bytes are identical and reports the time per render.
+Needs no database, the lessons are unsaved instances.
+
+    python benchmark_json_renderer.py [renders]
+"""
+
+import os
+import sys
+import time
+from datetime import timedelta
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "e_learning_backend.settings")
+django.setup()
+
+from django.utils import timezone  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.course.models import Lesson  # noqa: E402
+from apps.course.serializers import LessonListSerializer  # noqa: E402
+from base.renderers import ORJSONRenderer, orjson  # noqa: E402
+from base.views.views import CustomAPIResponse  # noqa: E402
+
+PAGE_SIZE = 50
+
+total_renders = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+if orjson is None:
+    sys.exit("orjson is not installed, install the fast-json extra")
+
+now = timezone.now()
+lessons = [
+    Lesson(
+        id=i,
+        title=f"Lesson {i}: Getting started with Django REST framework",
+        content="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20,
+        order=i,
+        created_at=now - timedelta(days=i),
+    )
+    for i in range(1, PAGE_SIZE + 1)
+]
+page = LessonListSerializer(lessons, many=True).data
+envelope = CustomAPIResponse.custom_success_response(data=page).data
+
+
+def run(renderer):
+    start = time.perf_counter()
+    for _ in range(total_renders):
+        renderer.render(envelope)
+    return (time.perf_counter() - start) / total_renders * 1_000_000
+
+
+expected = JSONRenderer().render(envelope)
+assert ORJSONRenderer().render(envelope) == expected, "rendered bytes differ"
+
+print(f"{total_renders} renders of a {PAGE_SIZE}-lesson page ({len(expected)} bytes)\n")
+print(f"{'renderer':<16}{'us/render':>12}")
+results = {}
+for label, renderer in (
+    ("JSONRenderer", JSONRenderer()),
+    ("ORJSONRenderer", ORJSONRenderer()),
+):
+    results[label] = run(renderer)
+    print(f"{label:<16}{results[label]:>12.1f}")
+print(f"\nspeedup: {results['JSONRenderer'] / results['ORJSONRenderer']:.1f}x")
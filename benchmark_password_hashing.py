@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark password checks of async logins.
+Runs a burst of concurrent password checks on an event loop, once calling
+`check_password()` inline (what a sync view does to the thread it runs on)
+and once through `acheck_password()` on the hashing pool, for PBKDF2 and,
+when argon2-cffi is installed, the tuned Argon2 hasher. Reports logins per
+second, per core used, and the longest stall of a 1ms ticker sharing the
+loop. Needs no database, the users are unsaved instances.
+
+    python benchmark_password_hashing.py [logins]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "e_learning_backend.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.test.utils import override_settings  # noqa: E402
+
+from apps.authentication.hashing import acheck_password  # noqa: E402
+from apps.authentication.models import CustomUser  # noqa: E402
+
+PASSWORD = "Secret@123"
+HASHERS = {
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "argon2": "apps.authentication.hashers.TunedArgon2PasswordHasher",
+}
+
+total_logins = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+cpus = os.cpu_count()
+pool_size = settings.PASSWORD_HASHING_CONCURRENCY or cpus
+
+try:
+    import argon2  # noqa: F401
+except ImportError:
+    del HASHERS["argon2"]
+
+
+async def inline_check(user):
+    return user.check_password(PASSWORD)
+
+
+async def pooled_check(user):
+    return await acheck_password(user, PASSWORD)
+
+
+async def burst(check, users):
+    stalls = []
+
+    async def ticker():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stalls.append(time.perf_counter() - start)
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(check(user) for user in users))
+    elapsed = time.perf_counter() - start
+    # let the ticker record the stall it is resuming from
+    await asyncio.sleep(0.01)
+    ticking.cancel()
+    assert all(results), "password check failed"
+    return total_logins / elapsed, max(stalls) * 1000
+
+
+print(
+    f"{total_logins} concurrent logins, {cpus} CPU(s), "
+    f"hashing pool of {pool_size} thread(s)\n"
+)
+print(f"{'hasher':<8}{'path':<8}{'logins/s':>10}{'per core':>10}{'max stall ms':>14}")
+for label, hasher in HASHERS.items():
+    with override_settings(PASSWORD_HASHERS=[hasher]):
+        encoded = make_password(PASSWORD)
+        users = [CustomUser(password=encoded) for _ in range(total_logins)]
+        # warm up the pool threads before measuring
+        asyncio.run(burst(pooled_check, users[:pool_size]))
+
+        for path, check, cores in (
+            ("inline", inline_check, 1),
+            ("pool", pooled_check, min(pool_size, cpus)),
+        ):
+            rate, stall = asyncio.run(burst(check, users))
+            print(
+                f"{label:<8}{path:<8}{rate:>10.1f}{rate / cores:>10.1f}{stall:>14.1f}"
+            )
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark stateless token-user authentication.
+Serves the opted-in list views in-process, once with TokenClaimsAuthentication
+and once with the default JWTAuthentication + SessionAuthentication, and
+reports requests per second and queries per request for each.
+
+    python benchmark_stateless_auth.py [email_address] [requests]
+"""
+
+import os
+import sys
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "e_learning_backend.settings")
+django.setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from rest_framework.authentication import SessionAuthentication  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+from rest_framework_simplejwt.authentication import JWTAuthentication  # noqa: E402
+
+from apps.authentication.tokens import refresh_token_for_user  # noqa: E402
+from apps.course.views import CourseListView, EnrollmentListView  # noqa: E402
+
+DEFAULT_AUTHENTICATION_CLASSES = (JWTAuthentication, SessionAuthentication)
+
+email_address = sys.argv[1] if len(sys.argv) > 1 else "seqtest@test.com"
+total_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+user = get_user_model().objects.get(email_address=email_address)
+access = str(refresh_token_for_user(user).access_token)
+factory = APIRequestFactory()
+
+
+def run(view, path):
+    # warm up caches before measuring
+    view(factory.get(path, HTTP_AUTHORIZATION=f"Bearer {access}"))
+
+    with CaptureQueriesContext(connection) as ctx:
+        view(factory.get(path, HTTP_AUTHORIZATION=f"Bearer {access}"))
+    queries = len(ctx.captured_queries)
+
+    start = time.perf_counter()
+    for _ in range(total_requests):
+        response = view(factory.get(path, HTTP_AUTHORIZATION=f"Bearer {access}"))
+        assert response.status_code == 200, response.status_code
+    elapsed = time.perf_counter() - start
+    return total_requests / elapsed, queries
+
+
+print(f"{total_requests} requests per variant as {email_address}\n")
+print(f"{'view':<22}{'auth':<12}{'req/s':>10}{'queries':>10}")
+for view_class, path in (
+    (CourseListView, "/api/v1/course_app/courses"),
+    (EnrollmentListView, "/api/v1/course_app/enrollments"),
+):
+    for label, view in (
+        (
+            "default",
+            view_class.as_view(authentication_classes=DEFAULT_AUTHENTICATION_CLASSES),
+        ),
+        ("stateless", view_class.as_view()),
+    ):
+        rps, queries = run(view, path)
+        print(f"{view_class.__name__:<22}{label:<12}{rps:>10.1f}{queries:>10}")
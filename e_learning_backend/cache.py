@@ -0,0 +1,24 @@
+from decouple import config
+
+# "locmem" (default, also used by tests) or "redis"
+CACHE_BACKEND = config("CACHE_BACKEND", default="locmem")
+
+_CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "e-learning-backend",
+    },
+    "redis": {
+        # needs the optional `redis` extra: uv sync --extra redis
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": config("REDIS_URL", default="redis://localhost:6379/1"),
+    },
+}
+
+_CACHES = {
+    "default": {
+        **_CACHE_BACKENDS[CACHE_BACKEND],
+        "KEY_PREFIX": config("CACHE_KEY_PREFIX", default="e_learning"),
+        "TIMEOUT": config("CACHE_DEFAULT_TIMEOUT", cast=int, default=300),
+    },
+}
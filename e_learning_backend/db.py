@@ -1,4 +1,39 @@
-from decouple import config
+from decouple import Csv, config
+
+# psycopg 3's connection pool instead of one connection per thread, needs the
+# optional `pool` extra: uv sync --extra pool. Prefer it under ASGI, where
+# async views hop between threads and persistent connections pile up
+DB_POOL = config("DB_POOL", cast=bool, default=False)
+# check a connection before handing it out (pooled) or at the start of a
+# request (persistent), so a server restart costs a reconnect, not a 500
+DB_CONN_HEALTH_CHECKS = config("DB_CONN_HEALTH_CHECKS", cast=bool, default=True)
+# psycopg 3 prepares a statement server side once a connection has run it
+# this many times (0 prepares everything). Unset keeps Django's default of no
+# prepared statements, which pgbouncer in transaction mode needs
+DB_PREPARE_THRESHOLD = config(
+    "DB_PREPARE_THRESHOLD", cast=lambda v: int(v) if v else None, default=""
+)
+
+_OPTIONS = {}
+
+if DB_POOL:
+    from psycopg_pool import ConnectionPool
+
+    _OPTIONS["pool"] = {
+        "min_size": config("DB_POOL_MIN_SIZE", cast=int, default=2),
+        "max_size": config("DB_POOL_MAX_SIZE", cast=int, default=10),
+        # seconds a request waits for a free connection before failing
+        "timeout": config("DB_POOL_TIMEOUT", cast=float, default=10),
+        # seconds before idle connections above min_size are closed
+        "max_idle": config("DB_POOL_MAX_IDLE", cast=float, default=600),
+        # seconds before a connection is replaced, whatever its use
+        "max_lifetime": config("DB_POOL_MAX_LIFETIME", cast=float, default=3600),
+    }
+    if DB_CONN_HEALTH_CHECKS:
+        _OPTIONS["pool"]["check"] = ConnectionPool.check_connection
+
+if DB_PREPARE_THRESHOLD is not None:
+    _OPTIONS["prepare_threshold"] = DB_PREPARE_THRESHOLD
 
 _DATABASES = {
     "default": {
@@ -8,5 +43,46 @@ _DATABASES = {
         "PASSWORD": config("DB_PASSWORD"),
         "HOST": config("DB_HOST", default="localhost"),
         "PORT": config("DB_PORT"),
+        # seconds a connection is reused across requests, opt-in and for WSGI
+        # only: under ASGI every thread an async view hops onto keeps its own
+        # connection open, use DB_POOL there. Django refuses it with the pool
+        "CONN_MAX_AGE": (
+            0 if DB_POOL else config("DB_CONN_MAX_AGE", cast=int, default=0)
+        ),
+        "CONN_HEALTH_CHECKS": DB_CONN_HEALTH_CHECKS,
+        "OPTIONS": _OPTIONS,
     },
 }
+
+# Read replicas as comma separated `host[:port][/name]`, the rest is taken
+# from the primary, see base.db.PrimaryReplicaRouter. Locally a second
+# database on the same server subscribed to the primary with logical
+# replication will do (DB_REPLICAS=localhost/e_learning_replica), or the
+# primary's own database (DB_REPLICAS=localhost) to exercise the routing only
+DB_REPLICAS = config("DB_REPLICAS", cast=Csv(), default="")
+# seconds a user's reads stay on the primary after they wrote, covering the
+# replication lag
+_DB_REPLICA_PIN_SECONDS = config("DB_REPLICA_PIN_SECONDS", cast=int, default=10)
+
+
+def _replica(location):
+    address, _, name = location.partition("/")
+    host, _, port = address.partition(":")
+    primary = _DATABASES["default"]
+    return {
+        **primary,
+        "HOST": host or primary["HOST"],
+        "PORT": port or primary["PORT"],
+        "NAME": name or primary["NAME"],
+        # tests run against the primary only
+        "TEST": {"MIRROR": "default"},
+    }
+
+
+_DATABASE_REPLICAS = [f"replica_{i}" for i in range(1, len(DB_REPLICAS) + 1)]
+_DATABASES.update(
+    {
+        alias: _replica(location)
+        for alias, location in zip(_DATABASE_REPLICAS, DB_REPLICAS)
+    }
+)
@@ -2,6 +2,8 @@ from decouple import config
 
 DEBUG = config("DEBUG", cast=bool, default=False)
 DISABLED_AUTHENTICATION = config("DISABLED_AUTHENTICATION", cast=bool, default=False)
+# orjson-backed JSON renderer/parser, same output as DRF's (needs the "fast-json" extra)
+FAST_JSON = config("FAST_JSON", cast=bool, default=False)
 REST_FRAMEWORK_CONFIGS = {
     "DEFAULT_PAGINATION_CLASS": "e_learning_backend.pagination.CustomPagePagination",
     "PAGE_SIZE": 10,
@@ -23,6 +25,23 @@ REST_FRAMEWORK_CONFIGS = {
             "rest_framework.permissions.IsAuthenticated",
         ]
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        (
+            "base.renderers.ORJSONRenderer"
+            if FAST_JSON
+            else "rest_framework.renderers.JSONRenderer"
+        ),
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        (
+            "base.parsers.ORJSONParser"
+            if FAST_JSON
+            else "rest_framework.parsers.JSONParser"
+        ),
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     # "DEFAULT_RENDERER_CLASSES": (
     # (
     #     "djangorestframework_camel_case.render.CamelCaseJSONRenderer",
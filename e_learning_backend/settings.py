@@ -15,10 +15,11 @@ from pathlib import Path
 
 from decouple import config
 
-from .db import _DATABASES
+from .cache import _CACHES
+from .db import _DATABASE_REPLICAS, _DATABASES, _DB_REPLICA_PIN_SECONDS
 from .rest import REST_FRAMEWORK_CONFIGS
 from .settings_config import *  # noqa: F403
-from .simple_jwt import _SIMPLE_JWT
+from .simple_jwt import _JWT_PERMISSION_CLAIMS, _SIMPLE_JWT
 from .spectacular import SPECTACULAR_SETTINGS_
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -83,6 +84,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "base.middleware.replica_routing_middleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -117,6 +119,15 @@ WSGI_APPLICATION = "e_learning_backend.wsgi.application"
 #     }
 # }
 DATABASES = _DATABASES
+DATABASE_REPLICAS = _DATABASE_REPLICAS
+DATABASE_REPLICA_PIN_SECONDS = _DB_REPLICA_PIN_SECONDS
+DATABASE_ROUTERS = ["base.db.PrimaryReplicaRouter"]
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+CACHES = _CACHES
 
 
 # Password validation
@@ -137,6 +148,20 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/6.0/topics/auth/passwords/
+
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "apps.authentication.hashers.TunedArgon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+if ARGON2_PASSWORD_HASHING:  # noqa: F405
+    # the first hasher hashes new passwords, see apps.authentication.hashers
+    PASSWORD_HASHERS.insert(0, PASSWORD_HASHERS.pop(2))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
@@ -164,3 +189,4 @@ AUTH_USER_MODEL = "authentication.CustomUser"
 SPECTACULAR_SETTINGS = SPECTACULAR_SETTINGS_
 REST_FRAMEWORK = REST_FRAMEWORK_CONFIGS
 SIMPLE_JWT = _SIMPLE_JWT
+JWT_PERMISSION_CLAIMS = _JWT_PERMISSION_CLAIMS
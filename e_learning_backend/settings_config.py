@@ -61,6 +61,65 @@ FILE_UPLOAD_MAX_MEMORY_SIZE = MAX_UPLOAD_FILE_SIZE_MB * 1024 * 1024
 MAX_UPLOAD_SIZE = DATA_UPLOAD_MAX_MEMORY_SIZE
 
 
+# Effective permission sets cached per user
+USER_PERMISSION_CACHE_TIMEOUT = config(
+    "USER_PERMISSION_CACHE_TIMEOUT", cast=int, default=5 * 60
+)  # seconds
+
+# Per-course lesson order index cache
+LESSON_INDEX_CACHE_TIMEOUT = config(
+    "LESSON_INDEX_CACHE_TIMEOUT", cast=int, default=60 * 60
+)  # seconds in the shared cache
+LESSON_INDEX_LOCAL_CACHE_SIZE = config(
+    "LESSON_INDEX_LOCAL_CACHE_SIZE", cast=int, default=512
+)  # courses kept in the in-process LRU tier
+
+# total_count of paginated list responses, see base.counting
+PAGINATION_COUNT_CACHE_TIMEOUT = config(
+    "PAGINATION_COUNT_CACHE_TIMEOUT", cast=int, default=30
+)  # seconds an exact count is reused
+PAGINATION_ESTIMATE_THRESHOLD = config(
+    "PAGINATION_ESTIMATE_THRESHOLD", cast=int, default=100_000
+)  # rows from which unfiltered lists report the planner estimate
+
+# Streaming CSV / NDJSON exports, see base.views.generic_views.StreamingExportMixin
+EXPORT_CHUNK_SIZE = config(
+    "EXPORT_CHUNK_SIZE", cast=int, default=2000
+)  # rows fetched from the cursor and flushed to the client at a time
+
+# Cohort enrollment, see apps.course.serializers.EnrollmentBulkCreateSerializer
+BULK_ENROLLMENT_MAX_STUDENTS = config(
+    "BULK_ENROLLMENT_MAX_STUDENTS", cast=int, default=10_000
+)  # students accepted per request
+BULK_ENROLLMENT_BATCH_SIZE = config(
+    "BULK_ENROLLMENT_BATCH_SIZE", cast=int, default=1000
+)  # enrollments per INSERT statement
+
+# Bulk user import, see apps.authentication.user_import.UserImporter
+USER_IMPORT_CHUNK_SIZE = config(
+    "USER_IMPORT_CHUNK_SIZE", cast=int, default=1000
+)  # CSV rows hashed, inserted and committed together
+USER_IMPORT_WORKERS = config(
+    "USER_IMPORT_WORKERS", cast=int, default=0
+)  # password hashing processes, 0 uses every CPU
+USER_IMPORT_MAX_UPLOAD_ROWS = config(
+    "USER_IMPORT_MAX_UPLOAD_ROWS", cast=int, default=500
+)  # rows the upload endpoint imports, bigger files go through import_users
+
+# Password hashing, see apps.authentication.hashing and .hashers
+PASSWORD_HASHING_CONCURRENCY = config(
+    "PASSWORD_HASHING_CONCURRENCY", cast=int, default=0
+)  # hashes run at once per process by async views, 0 uses every CPU
+ARGON2_PASSWORD_HASHING = config(
+    "ARGON2_PASSWORD_HASHING", cast=bool, default=False
+)  # hash new passwords with Argon2 and upgrade others on login (argon2 extra)
+ARGON2_TIME_COST = config("ARGON2_TIME_COST", cast=int, default=2)  # iterations
+ARGON2_MEMORY_COST = config(
+    "ARGON2_MEMORY_COST", cast=int, default=102_400
+)  # KiB per hash
+ARGON2_PARALLELISM = config("ARGON2_PARALLELISM", cast=int, default=8)  # lanes
+
+
 # def copy_default_images():
 #     """
 #     We won't be editing media dir
@@ -20,3 +20,7 @@ _SIMPLE_JWT = {
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
 }
+
+# "Fat token" mode: access tokens carry the user's permission bitmask,
+# see apps.authentication.tokens and apps.authentication.authentication
+_JWT_PERMISSION_CLAIMS = config("JWT_PERMISSION_CLAIMS", cast=bool, default=False)